@@ -0,0 +1 @@
+"""Benchmarks. Run from the repository root, ie: "python -m benchmarks.bench_io"."""
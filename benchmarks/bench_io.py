@@ -0,0 +1,84 @@
+"""Benchmark session loading/saving on a generated 50k tasks session.
+
+Usage: python -m benchmarks.bench_io [--tasks 50000] [--artists 100]
+"""
+import argparse
+import os
+import tempfile
+import time
+from unittest import mock
+
+import yaml
+
+from csp4cg.core import (
+    Artist,
+    Assignment,
+    Context,
+    Task,
+    export_context_to_json,
+    export_context_to_yml,
+    import_context_from_json,
+    import_context_from_yml,
+)
+from csp4cg.core import _io
+
+
+def _generate_context(num_tasks: int, num_artists: int) -> Context:
+    """Generate a session big enough to be representative of a large production."""
+    artists = [
+        Artist(f"Artist{index}", tags={f"tag{index % 10}": 10})
+        for index in range(num_artists)
+    ]
+    tasks = [
+        Task(f"{index:06d}", 1 + index % 8, tags=[f"tag{index % 10}"])
+        for index in range(num_tasks)
+    ]
+    solution = [
+        Assignment(artists[index % num_artists], task)
+        for index, task in enumerate(tasks)
+    ]
+    return Context(artists=artists, tasks=tasks, solution=solution)
+
+
+def _timeit(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=50000)
+    parser.add_argument("--artists", type=int, default=100)
+    args = parser.parse_args()
+
+    context = _generate_context(args.tasks, args.artists)
+    implementations = [("python", yaml.SafeLoader, yaml.SafeDumper)]
+    if getattr(yaml, "__with_libyaml__", False):
+        implementations.append(("libyaml", yaml.CSafeLoader, yaml.CSafeDumper))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "session.yml")
+        for name, loader, dumper in implementations:
+            with mock.patch.object(
+                _io, "_get_yaml", return_value=(yaml, loader, dumper)
+            ):
+                save = _timeit(export_context_to_yml, context, path)
+                load = _timeit(import_context_from_yml, path)
+            _print(name, path, save, load)
+
+        for extension in (".json", ".json.gz"):
+            path = os.path.join(directory, "session" + extension)
+            save = _timeit(export_context_to_json, context, path)
+            load = _timeit(import_context_from_json, path)
+            _print(extension[1:], path, save, load)
+
+
+def _print(name, path, save, load):
+    size = os.path.getsize(path) / 1024 / 1024
+    print(f"{name:>8}: save {save:.2f}s, load {load:.2f}s ({size:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
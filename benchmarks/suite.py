@@ -0,0 +1,502 @@
+"""Benchmark suite, run on synthetic sessions of increasing size.
+
+Each benchmark run in a fresh process so timings and memory usage don't depend
+on what ran before. Results are written as JSON and can be compared
+with the results of another commit.
+
+Usage:
+  python -m benchmarks.suite [--scales 1 10] [--only build solve] [--output out.json]
+  python -m benchmarks.suite --compare baseline.json [...]
+  python -m benchmarks.suite --models production.zip [...]
+
+Model files written with "csp4cg solve --dump-model" are replayed with the
+same solver parameters as the solve benchmark, to tune on real productions.
+"""
+import argparse
+import datetime
+import functools
+import json
+import multiprocessing
+import os
+import pickle
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from csp4cg.core import Assignment, Context, generate_context
+from csp4cg.core._synthetic import EXAMPLE_NUM_TASKS
+
+if TYPE_CHECKING:  # pragma: no cover
+    from csp4cg.core import Solver
+
+Metrics = Dict[str, Any]
+
+_BENCHMARKS = {}  # type: Dict[str, Callable[[Context, argparse.Namespace], Metrics]]
+
+
+def _benchmark(func):
+    """Register a benchmark, its name is the function name without "bench_"."""
+    _BENCHMARKS[func.__name__[len("bench_") :]] = func
+    return func
+
+
+def _timeit(func: Callable, *args, repeat: int = 1) -> float:
+    """Time a function call, keeping the fastest of multiple runs.
+
+    :param func: A function to call
+    :param repeat: Number of times to call the function
+    :return: A duration in seconds
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def _get_max_rss() -> Optional[float]:
+    """Get the peak memory usage of the current process, in MB."""
+    try:
+        import resource  # pylint: disable=import-outside-toplevel
+    except ImportError:  # pragma: no cover, not available on Windows
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage / 1024 / 1024 if sys.platform == "darwin" else usage / 1024
+
+
+def _get_solution(context: Context) -> List[Assignment]:
+    """Get a solution that respect the locks without running the solver."""
+    locks = {assignment.task.name: assignment for assignment in context.assignments}
+    return [
+        locks.get(task.name)
+        or Assignment(context.artists[index % len(context.artists)], task)
+        for index, task in enumerate(context.tasks)
+    ]
+
+
+@_benchmark
+def bench_build(context: Context, args: argparse.Namespace) -> Metrics:
+    """Time and memory needed to build the solver model."""
+    from csp4cg.core import Solver  # pylint: disable=import-outside-toplevel
+
+    context.get_columns()
+    memory = _get_max_rss()
+    start = time.perf_counter()
+    solver = Solver(context)
+    duration = time.perf_counter() - start
+    metrics = {
+        "time": duration,
+        "memory": _get_max_rss() - memory if memory is not None else None,
+        "variables": len(solver.model.Proto().variables),
+        "constraints": len(solver.model.Proto().constraints),
+    }
+    del solver
+    if args.repeat > 1:
+        metrics["time"] = min(
+            duration, _timeit(Solver, context, repeat=args.repeat - 1)
+        )
+    return metrics
+
+
+@_benchmark
+def bench_cache(context: Context, args: argparse.Namespace) -> Metrics:
+    """Time to get a solver when its model is built then loaded from the cache."""
+    from csp4cg.core import ModelCache  # pylint: disable=import-outside-toplevel
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ModelCache(directory)
+        start = time.perf_counter()
+        cache.get_solver(context)
+        miss = time.perf_counter() - start
+        context.settings.weight_tags += 1  # a weight change reuse the model
+        return {
+            "miss": miss,
+            "hit": _timeit(cache.get_solver, context, repeat=args.repeat),
+            "size": os.path.getsize(cache.get_path(context)) / 1024 / 1024,
+        }
+
+
+@_benchmark
+def bench_startup(context: Context, args: argparse.Namespace) -> Metrics:
+    """Latency between starting a solve process and its first message.
+
+    "startup" use a tiny session, "first_message" the benchmark session
+    with its model already cached so the build time is not included.
+    """
+    # pylint: disable=import-outside-toplevel
+    from csp4cg.core import _worker
+
+    tiny = generate_context(1, num_artists=1)
+    methods = {"spawn": multiprocessing.get_context("spawn")}
+    if _worker.get_process_context().get_start_method() == "forkserver":
+        methods["forkserver"] = _worker.get_process_context()
+        _worker.start_server()
+
+    def _get_latency(process_context, context_) -> float:
+        queue = process_context.Queue()
+        start = time.perf_counter()
+        process = process_context.Process(
+            target=_worker.solve, args=(context_, queue, directory)
+        )
+        process.start()
+        queue.get()
+        latency = time.perf_counter() - start
+        process.terminate()
+        process.join()
+        return latency
+
+    metrics = {}  # type: Metrics
+    with tempfile.TemporaryDirectory() as directory:
+        for name, process_context in methods.items():
+            _get_latency(process_context, context)  # warm the caches
+            metrics[name + "_startup"] = min(
+                _get_latency(process_context, tiny) for _ in range(args.repeat)
+            )
+            metrics[name + "_first_message"] = min(
+                _get_latency(process_context, context) for _ in range(args.repeat)
+            )
+    return metrics
+
+
+@_benchmark
+def bench_snapshot(context: Context, args: argparse.Namespace) -> Metrics:
+    """Cost of the context copy sent to each solve process."""
+    context.solution = _get_solution(context)
+
+    def _snapshot():
+        context.invalidate()  # don't reuse the previous snapshot
+        return context.snapshot()
+
+    return {
+        "time": _timeit(_snapshot, repeat=args.repeat),
+        "time_unchanged": _timeit(context.snapshot, repeat=args.repeat),
+        "size": len(pickle.dumps(context.snapshot())) / 1024 / 1024,
+        "size_context": len(pickle.dumps(context)) / 1024 / 1024,
+    }
+
+
+@_benchmark
+def bench_solve(context: Context, args: argparse.Namespace) -> Metrics:
+    """Time to the first solution and objective over time."""
+    from csp4cg.core import Solver  # pylint: disable=import-outside-toplevel
+
+    return _solve(Solver(context), args)
+
+
+def _solve(solver: "Solver", args: argparse.Namespace) -> Metrics:
+    """Run a solver and describe how the solve went.
+
+    :param solver: The solver to run
+    :param args: Command line arguments
+    :return: The solve metrics
+    """
+    solver.printer = None
+    parameters = solver.solver.parameters
+    parameters.max_time_in_seconds = args.time_limit
+    parameters.num_search_workers = args.workers
+    parameters.random_seed = args.seed
+    try:
+        solver.solve()
+    except RuntimeError:
+        pass
+    report = solver.report
+    return {
+        "status": report.status,
+        "time": report.solve_time,
+        "presolve_time": report.presolve_time,
+        "first_solution_time": report.solutions[0].time if report.solutions else None,
+        "objective": report.objective,
+        "bound": report.best_bound,
+        "gap": report.gap,
+        "curve": [
+            [point.time, point.objective, point.bound] for point in report.solutions
+        ],
+    }
+
+
+@_benchmark
+def bench_io(context: Context, args: argparse.Namespace) -> Metrics:
+    """Load and save throughput of sessions and csv files."""
+    # pylint: disable=import-outside-toplevel
+    from csp4cg.core import _io
+
+    context.solution = _get_solution(context)
+    metrics = {}  # type: Metrics
+    formats = (
+        ("yml", _io.export_context_to_yml, _io.import_context_from_yml),
+        ("json", _io.export_context_to_json, _io.import_context_from_json),
+        ("json.gz", _io.export_context_to_json, _io.import_context_from_json),
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        for name, export, import_ in formats:
+            path = os.path.join(directory, "session." + name)
+            metrics[name + "_save"] = _timeit(export, context, path, repeat=args.repeat)
+            metrics[name + "_load"] = _timeit(import_, path, repeat=args.repeat)
+            metrics[name + "_size"] = os.path.getsize(path) / 1024 / 1024
+
+        csv_files = (
+            (
+                "artists",
+                _io.export_artists_to_csv,
+                context.artists,
+                _io.import_artists_from_csv,
+            ),
+            (
+                "tasks",
+                _io.export_tasks_to_csv,
+                context.tasks,
+                _io.import_tasks_from_csv,
+            ),
+            (
+                "assignments",
+                _io.export_assignments_to_csv,
+                context.solution,
+                functools.partial(_io.import_assignments_from_csv, context),
+            ),
+        )
+        for name, export, data, import_ in csv_files:
+            path = os.path.join(directory, name + ".csv")
+            metrics[f"csv_{name}_save"] = _timeit(
+                export, data, path, repeat=args.repeat
+            )
+            metrics[f"csv_{name}_load"] = _timeit(import_, path, repeat=args.repeat)
+    return metrics
+
+
+@_benchmark
+def bench_scores(context: Context, args: argparse.Namespace) -> Metrics:
+    """Time to compute the score of a solution without the solver."""
+    # pylint: disable=import-outside-toplevel
+    from csp4cg.core._score import iter_scores
+
+    solution = _get_solution(context)
+    return {
+        "time": _timeit(
+            lambda: tuple(iter_scores(context, solution)), repeat=args.repeat
+        )
+    }
+
+
+@_benchmark
+def bench_gui(context: Context, args: argparse.Namespace) -> Metrics:
+    """Refresh time of the tasks and scores models, without showing any window."""
+    # pylint: disable=import-outside-toplevel
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    try:
+        from PySide2.QtWidgets import QApplication
+    except ImportError:
+        return {"skipped": "PySide2 is not installed"}
+
+    from csp4cg.core._score import iter_scores
+    from csp4cg.gui.widgets.scores import PointsTableModel
+    from csp4cg.gui.widgets.tasks import TasksListModel
+
+    app = QApplication.instance() or QApplication([])
+    context.solution = _get_solution(context)
+    statistics = tuple(iter_scores(context, context.solution))
+    model_tasks = TasksListModel(None, context)
+    model_scores = PointsTableModel(None)
+    metrics = {
+        "tasks_reset": _timeit(model_tasks.resetInternalData, repeat=args.repeat),
+        "tasks_set_context": _timeit(
+            model_tasks.set_context, context, repeat=args.repeat
+        ),
+        "scores_set": _timeit(model_scores.set_scores, statistics, repeat=args.repeat),
+    }
+    app.processEvents()
+    return metrics
+
+
+def _run(name: str, scale: int, args: argparse.Namespace) -> Dict[str, Any]:
+    """Run a benchmark at a given scale, called in a child process.
+
+    :param name: The benchmark name
+    :param scale: Size of the session, relative to examples/tasks.yml
+    :param args: Command line arguments
+    :return: A result entry
+    """
+    context = generate_context(EXAMPLE_NUM_TASKS * scale, seed=args.seed)
+    return {
+        "benchmark": name,
+        "scale": scale,
+        "tasks": len(context.tasks),
+        "artists": len(context.artists),
+        "metrics": _BENCHMARKS[name](context, args),
+    }
+
+
+def _run_model(path: str, args: argparse.Namespace) -> Dict[str, Any]:
+    """Replay a model file, called in a child process.
+
+    :param path: Path to a model file
+    :param args: Command line arguments
+    :return: A result entry
+    """
+    # pylint: disable=import-outside-toplevel
+    from csp4cg.core._replay import ReplaySolver
+
+    solver = ReplaySolver(path)
+    return {
+        "benchmark": "replay",
+        "model": os.path.basename(path),
+        "scale": None,
+        "tasks": len(solver.tasks),
+        "artists": len(solver.artists),
+        "metrics": dict(_solve(solver, args), build_time=solver.report.build_time),
+    }
+
+
+def _apply(func: Callable, args: tuple) -> Any:
+    """Call a function in a fresh process.
+
+    Unlike the processes of a multiprocessing.Pool, the process is not a daemon
+    so the benchmarks can start their own processes.
+
+    :param func: A function
+    :param args: The function arguments
+    :return: The function return value
+    """
+    process_context = multiprocessing.get_context("spawn")
+    receiver, sender = process_context.Pipe(duplex=False)
+    process = process_context.Process(target=_call, args=(sender, func, args))
+    process.start()
+    sender.close()
+    try:
+        result = receiver.recv()
+    except EOFError:
+        raise RuntimeError(f"{func.__name__} process exited unexpectedly") from None
+    finally:
+        process.join()
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+
+def _call(connection, func: Callable, args: tuple):
+    """Send the return value or the exception of a function to a pipe."""
+    try:
+        result = func(*args)
+    except Exception as error:  # pylint: disable=broad-except
+        result = error
+    connection.send(result)
+
+
+def _get_metadata() -> Dict[str, Any]:
+    """Describe the environment the benchmarks run in, to compare results."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=os.path.dirname(__file__),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def compare(baseline: Dict, results: Dict) -> List[str]:
+    """Compare the numeric metrics of two benchmark results.
+
+    :param baseline: Results of a previous run
+    :param results: Results of the current run
+    :return: One line per metric found in both results
+    """
+    previous = {
+        (entry["benchmark"], entry.get("model") or entry["scale"], key): value
+        for entry in baseline["results"]
+        for key, value in entry["metrics"].items()
+    }
+    lines = []
+    for entry in results["results"]:
+        size = entry.get("model") or f"x{entry['scale']}"
+        for key, value in entry["metrics"].items():
+            old = previous.get(
+                (entry["benchmark"], entry.get("model") or entry["scale"], key)
+            )
+            if not isinstance(value, (int, float)) or not isinstance(old, (int, float)):
+                continue
+            ratio = f"{value / old:.2f}x" if old else "-"
+            lines.append(
+                f"{entry['benchmark']:>8} {size:<6} {key:<24}"
+                f" {old:>12.4g} -> {value:<12.4g} {ratio}"
+            )
+    return lines
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Entry point.
+
+    :param argv: Command line arguments, default to sys.argv
+    :return: The results
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--scales",
+        type=int,
+        nargs="+",
+        default=[1, 10],
+        help="Session sizes, relative to examples/tasks.yml",
+    )
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        choices=sorted(_BENCHMARKS),
+        default=sorted(_BENCHMARKS),
+        help="Benchmarks to run",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Keep the best of N runs")
+    parser.add_argument(
+        "--time-limit", type=float, default=10.0, help="Solve time limit"
+    )
+    parser.add_argument("--workers", type=int, default=8, help="Solver search workers")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument(
+        "--models",
+        nargs="+",
+        default=[],
+        help="Model files to replay, written with csp4cg solve --dump-model",
+    )
+    parser.add_argument("--output", help="Write the results to a .json file")
+    parser.add_argument("--compare", help="Compare with the results of a previous run")
+    args = parser.parse_args(argv)
+
+    results = {"metadata": _get_metadata(), "results": []}  # type: Dict[str, Any]
+    for scale in args.scales:
+        for name in args.only:
+            entry = _apply(_run, (name, scale, args))
+            results["results"].append(entry)
+            print(json.dumps(entry), file=sys.stderr)
+    for path in args.models:
+        entry = _apply(_run_model, (path, args))
+        results["results"].append(entry)
+        print(json.dumps(entry), file=sys.stderr)
+
+    if args.output:
+        with open(args.output, "w") as stream:
+            json.dump(results, stream, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+
+    if args.compare:
+        with open(args.compare) as stream:
+            baseline = json.load(stream)
+        print("\n".join(compare(baseline, results)), file=sys.stderr)
+
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,7 @@
 """Main entry point. Invoke with "python -m csp4cg". """
-from . import gui
+import sys
+
+from csp4cg._cli import main
 
 if __name__ == "__main__":
-    gui.show()
+    sys.exit(main())
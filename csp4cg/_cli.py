@@ -0,0 +1,483 @@
+"""Command line interface.
+
+The solve command only use csp4cg.core so it can run on machines without Qt.
+"""
+
+# pylint: disable=import-outside-toplevel
+import argparse
+import json
+import sys
+from typing import IO, TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    from csp4cg.core import Assignment, SolveReport, Solver
+
+# Exit codes, 1 is left to uncaught exceptions.
+EXIT_OPTIMAL = 0  # a solution was found and proven optimal
+EXIT_USAGE = 2  # invalid arguments, same as argparse
+EXIT_INFEASIBLE = 3  # the problem has no solution, ie: conflicting locks
+EXIT_NO_SOLUTION = 4  # no solution was found before the time limit
+EXIT_INVALID_INPUT = 5  # the session could not be read or the output written
+EXIT_FEASIBLE = 6  # a solution was found but the search was interrupted
+EXIT_ERROR = 7  # the model could not be built or solved
+
+_EPILOG = f"""\
+exit codes:
+  {EXIT_OPTIMAL}  solution found and proven optimal
+  {EXIT_USAGE}  invalid arguments
+  {EXIT_INFEASIBLE}  the problem has no solution
+  {EXIT_NO_SOLUTION}  no solution found before the time limit
+  {EXIT_INVALID_INPUT}  cannot read the session or write the output
+  {EXIT_FEASIBLE}  solution found, search interrupted by the time limit
+  {EXIT_ERROR}  unexpected error while building or solving the model
+"""
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point.
+
+    :param argv: Command line arguments, default to sys.argv
+    :return: An exit code
+    """
+    parser = argparse.ArgumentParser(prog="csp4cg", description=__doc__.split("\n")[0])
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.add_parser("gui", help="Show the graphical user interface (default)")
+
+    # Arguments shared by all commands that run the solver
+    parser_solver = argparse.ArgumentParser(add_help=False)
+    parser_solver.add_argument(
+        "--time-limit", type=float, help="Maximum solve time in seconds"
+    )
+    parser_solver.add_argument("--workers", type=int, help="Number of search workers")
+    parser_solver.add_argument(
+        "--report",
+        nargs="?",
+        const="",
+        help="Write a solve report in .json. "
+        "Default to <input>.report.json, next to the input file.",
+    )
+
+    parser_solve = subparsers.add_parser(
+        "solve",
+        help="Solve a session without user interface",
+        description="Solve a session and stream progress to stdout as JSON lines.",
+        epilog=_EPILOG,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        parents=[parser_solver],
+    )
+    parser_solve.add_argument("session", help="Session file (.yml, .json, .json.gz)")
+    parser_solve.add_argument(
+        "--out",
+        help="Where to write the solution. "
+        "A .csv file receive the assignments, other extensions the solved session.",
+    )
+    parser_solve.add_argument(
+        "--cache",
+        nargs="?",
+        const="",
+        metavar="DIR",
+        help="Reuse the model built by a previous solve of the same session, "
+        "if only weights changed. Default to the user cache directory.",
+    )
+    parser_solve.add_argument(
+        "--dump-model",
+        metavar="PATH",
+        help="Write the built model to a .zip file that can be replayed offline.",
+    )
+    parser_replay = subparsers.add_parser(
+        "replay",
+        help="Solve a model written with solve --dump-model",
+        description="Solve a model file and stream progress to stdout as JSON lines.",
+        epilog=_EPILOG,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        parents=[parser_solver],
+    )
+    parser_replay.add_argument("model", help="Model file (.zip)")
+    parser_replay.add_argument("--out", help="Write the assignments to a .csv file.")
+    parser_tune = subparsers.add_parser(
+        "tune",
+        help="Find the best solver parameters for a corpus of sessions",
+        description="Solve sessions with each combination of a parameter grid, "
+        "rank the combinations by objective reached at multiple times "
+        "and stream progress to stdout as JSON lines.",
+    )
+    parser_tune.add_argument(
+        "sessions", nargs="+", help="Session files or directories of session files"
+    )
+    parser_tune.add_argument(
+        "--grid",
+        help="A .json file of values to try by parameter name, ie: "
+        '{"linearization_level": [1, 2]}. Default to a few search parameters.',
+    )
+    parser_tune.add_argument(
+        "--time-limit",
+        type=float,
+        default=30.0,
+        help="Solve time of each session with each combination, in seconds",
+    )
+    parser_tune.add_argument(
+        "--marks",
+        type=float,
+        nargs="+",
+        help="Times at which the objectives are compared, in seconds. "
+        "Default to a quarter, half and all of the time limit.",
+    )
+    parser_tune.add_argument(
+        "--workers", type=int, default=8, help="Number of search workers by solve"
+    )
+    parser_tune.add_argument(
+        "--jobs", type=int, default=1, help="Number of solves to run at the same time"
+    )
+    parser_tune.add_argument(
+        "--apply",
+        action="store_true",
+        help="Write the best parameters in the settings of each session",
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "solve":
+        return solve(
+            args.session,
+            args.out,
+            args.time_limit,
+            args.workers,
+            report=args.report,
+            dump_model=args.dump_model,
+            cache=args.cache,
+        )
+    if args.command == "replay":
+        return replay(
+            args.model, args.out, args.time_limit, args.workers, report=args.report
+        )
+
+    if args.command == "tune":
+        return tune(
+            args.sessions,
+            grid=args.grid,
+            time_limit=args.time_limit,
+            marks=args.marks,
+            workers=args.workers,
+            jobs=args.jobs,
+            apply=args.apply,
+        )
+
+    from csp4cg import gui
+
+    gui.show()
+    return 0
+
+
+def solve(  # pylint: disable=too-many-arguments,too-many-locals
+    path: str,
+    path_out: Optional[str] = None,
+    time_limit: Optional[float] = None,
+    workers: Optional[int] = None,
+    stream: Optional[IO[str]] = None,
+    report: Optional[str] = None,
+    dump_model: Optional[str] = None,
+    cache: Optional[str] = None,
+) -> int:
+    """Solve a session file.
+
+    Progress is written as JSON lines, one per solution found,
+    followed by a final "done" line.
+
+    :param path: Path to a session file
+    :param path_out: Where to write the solution
+    :param time_limit: Maximum solve time in seconds
+    :param workers: Number of search workers
+    :param stream: Where to write progress, default to stdout
+    :param report: Where to write the solve report.
+      An empty string write it next to the session.
+    :param dump_model: Where to write the built model, see replay.
+    :param cache: Directory of the model cache, None to always build the model.
+      An empty string use the user cache directory.
+    :return: An exit code
+    """
+    from csp4cg.core import ModelCache, export_context, import_context
+    from csp4cg.core._io import _get_yaml, export_assignments_to_csv
+    from csp4cg.core._replay import export_model
+    from csp4cg.core._solver import Solver
+
+    write = _get_writer(stream or sys.stdout)
+    try:
+        context = import_context(path)
+    except (
+        OSError,
+        ValueError,
+        KeyError,
+        TypeError,
+        _get_yaml()[0].YAMLError,  # only evaluated on errors, import yaml then
+    ) as error:
+        write("error", message=f"Cannot read {path}: {error}")
+        return EXIT_INVALID_INPUT
+
+    try:
+        solver = (
+            Solver(context) if cache is None else ModelCache(cache).get_solver(context)
+        )
+        if dump_model:
+            try:
+                export_model(solver, dump_model)
+            except OSError as error:
+                write("error", message=f"Cannot write {dump_model}: {error}")
+                return EXIT_INVALID_INPUT
+        context.solution = list(_run(solver, time_limit, workers, write))
+    except Exception as error:  # pylint: disable=broad-except
+        write("error", message=f"Cannot solve {path}: {error!r}")
+        return EXIT_ERROR
+    code = _get_exit_code(solver, path, report, write)
+    if code not in (EXIT_OPTIMAL, EXIT_FEASIBLE) or not path_out:
+        return code
+
+    try:
+        if path_out.lower().endswith(".csv"):
+            export_assignments_to_csv(context.solution, path_out)
+        else:
+            export_context(context, path_out)
+    except OSError as error:
+        write("error", message=f"Cannot write {path_out}: {error}")
+        return EXIT_INVALID_INPUT
+    return code
+
+
+def replay(
+    path: str,
+    path_out: Optional[str] = None,
+    time_limit: Optional[float] = None,
+    workers: Optional[int] = None,
+    stream: Optional[IO[str]] = None,
+    report: Optional[str] = None,
+) -> int:
+    """Solve a model file, written by solve with dump_model.
+
+    :param path: Path to a model file
+    :param path_out: Where to write the assignments, as a .csv file
+    :param time_limit: Maximum solve time in seconds
+    :param workers: Number of search workers
+    :param stream: Where to write progress, default to stdout
+    :param report: Where to write the solve report.
+      An empty string write it next to the model.
+    :return: An exit code
+    """
+    from csp4cg.core._io import export_assignments_to_csv
+    from csp4cg.core._replay import ReplaySolver
+
+    write = _get_writer(stream or sys.stdout)
+    try:
+        solver = ReplaySolver(path)
+    except (OSError, ValueError) as error:
+        write("error", message=f"Cannot read {path}: {error}")
+        return EXIT_INVALID_INPUT
+
+    try:
+        solution = _run(solver, time_limit, workers, write)
+    except Exception as error:  # pylint: disable=broad-except
+        write("error", message=f"Cannot solve {path}: {error!r}")
+        return EXIT_ERROR
+    code = _get_exit_code(solver, path, report, write)
+    if code not in (EXIT_OPTIMAL, EXIT_FEASIBLE) or not path_out:
+        return code
+
+    try:
+        export_assignments_to_csv(solution, path_out)
+    except OSError as error:
+        write("error", message=f"Cannot write {path_out}: {error}")
+        return EXIT_INVALID_INPUT
+    return code
+
+
+def tune(  # pylint: disable=too-many-arguments,too-many-locals
+    paths: List[str],
+    grid: Optional[str] = None,
+    time_limit: float = 30.0,
+    marks: Optional[List[float]] = None,
+    workers: int = 8,
+    jobs: int = 1,
+    apply: bool = False,
+    stream: Optional[IO[str]] = None,
+) -> int:
+    """Find the best solver parameters for a corpus of sessions.
+
+    A JSON line is written after each solve, then one for each parameter set,
+    best first, and a final "done" line with the best parameters.
+
+    :param paths: Session files or directories of session files
+    :param grid: Path to a .json file of values to try by parameter name
+    :param time_limit: Solve time of each session with each parameter set
+    :param marks: Times at which the objectives are compared, in seconds
+    :param workers: Number of search workers by solve
+    :param jobs: Number of solves to run at the same time
+    :param apply: Write the best parameters in the settings of each session
+    :param stream: Where to write progress, default to stdout
+    :return: An exit code
+    """
+    from ortools.sat.sat_parameters_pb2 import SatParameters
+
+    from csp4cg.core import export_context, import_context
+    from csp4cg.core._io import _get_yaml
+    from csp4cg.core._solver import set_parameters
+    from csp4cg.core._tuning import check_grid, find_sessions, iter_parameter_sets
+    from csp4cg.core._tuning import tune as tune_
+
+    write = _get_writer(stream or sys.stdout)
+    sessions = find_sessions(paths)
+    if not sessions:
+        write("error", message="No session found")
+        return EXIT_INVALID_INPUT
+    grid_ = None  # type: Optional[Dict[str, List[Any]]]
+    try:
+        contexts = [import_context(path) for path in sessions]
+        if grid:
+            with open(grid) as file_:
+                grid_ = json.load(file_)
+            check_grid(grid_)
+            # Fail early on invalid parameters, not in the solve processes
+            for parameters in iter_parameter_sets(grid_):
+                set_parameters(SatParameters(), parameters)
+    except (
+        OSError,
+        ValueError,
+        KeyError,
+        TypeError,
+        AttributeError,
+        _get_yaml()[0].YAMLError,
+    ) as error:
+        write("error", message=str(error))
+        return EXIT_INVALID_INPUT
+
+    def _on_solve(path: str, parameters: Dict[str, Any], report: "SolveReport"):
+        write(
+            "solve",
+            session=path,
+            parameters=parameters,
+            status=report.status,
+            objective=report.objective,
+        )
+
+    results = tune_(sessions, grid_, time_limit, marks, workers, jobs, _on_solve)
+    for result in results:
+        write(
+            "result",
+            parameters=result.parameters,
+            rank=result.rank,
+            objectives=result.objectives,
+        )
+    best = results[0].parameters
+    write("done", parameters=best)
+
+    if apply:
+        for path, context in zip(sessions, contexts):
+            context.settings.solver_parameters = dict(best)
+            try:
+                export_context(context, path)
+            except OSError as error:
+                write("error", message=f"Cannot write {path}: {error}")
+                return EXIT_INVALID_INPUT
+    return EXIT_OPTIMAL
+
+
+def _get_writer(stream: IO[str]) -> Callable[..., None]:
+    """Get a function that write an event as a JSON line.
+
+    :param stream: Where to write
+    :return: A function that take an event name and its data as keyword arguments.
+    """
+
+    def _write(event: str, **data: Any):
+        stream.write(json.dumps({"event": event, **data}) + "\n")
+        stream.flush()
+
+    return _write
+
+
+def _run(
+    solver: "Solver",
+    time_limit: Optional[float],
+    workers: Optional[int],
+    write: Callable[..., None],
+) -> Tuple["Assignment", ...]:
+    """Run a solver, writing a JSON line for each solution and when done.
+
+    :param solver: The solver to run
+    :param time_limit: Maximum solve time in seconds
+    :param workers: Number of search workers
+    :param write: Function that write an event
+    :return: The assignments, empty if no solution was found.
+    """
+    from ortools.sat.python import cp_model
+
+    class _Printer(cp_model.CpSolverSolutionCallback):
+        """Write a JSON line for each solution found."""
+
+        def __init__(self):
+            super().__init__()
+            self.count = 0
+
+        def on_solution_callback(self):
+            self.count += 1
+            write(
+                "solution",
+                count=self.count,
+                objective=self.ObjectiveValue(),
+                bound=self.BestObjectiveBound(),
+                time=self.WallTime(),
+            )
+
+    if time_limit is not None:
+        solver.solver.parameters.max_time_in_seconds = time_limit
+    if workers is not None:
+        solver.solver.parameters.num_search_workers = workers
+    solver.printer = _Printer()
+
+    try:
+        solution = solver.solve()
+    except RuntimeError:
+        solution = ()
+    summary = {
+        "status": solver.report.status,
+        "solutions": solver.printer.count,
+        "time": solver.report.solve_time,
+        "build_time": solver.report.build_time,
+        "model_cached": solver.report.model_cached,
+        "presolve_time": solver.report.presolve_time,
+        "variables": solver.report.num_variables,
+        "constraints": solver.report.num_constraints,
+    }  # type: Dict[str, Any]
+    if solution:
+        summary.update(
+            objective=solver.report.objective,
+            bound=solver.report.best_bound,
+            gap=solver.report.gap,
+        )
+    write("done", **summary)
+    return solution
+
+
+def _get_exit_code(
+    solver: "Solver", path: str, report: Optional[str], write: Callable[..., None]
+) -> int:
+    """Write the solve report if requested and get the exit code of a solve.
+
+    :param solver: A solver that was run
+    :param path: Path to the solver input file, the report default to be next to it.
+    :param report: Where to write the solve report, None to not write it.
+    :param write: Function that write an event
+    :return: An exit code
+    """
+    from csp4cg.core._report import export_report, get_report_path
+
+    if report is not None:
+        path_report = report or get_report_path(path)
+        try:
+            export_report(solver.report, path_report)
+        except OSError as error:
+            write("error", message=f"Cannot write {path_report}: {error}")
+            return EXIT_INVALID_INPUT
+
+    status = solver.report.status
+    if status == "OPTIMAL":
+        return EXIT_OPTIMAL
+    if status == "FEASIBLE":
+        return EXIT_FEASIBLE
+    return EXIT_INFEASIBLE if status == "INFEASIBLE" else EXIT_NO_SOLUTION
@@ -1,28 +1,91 @@
-"""Core logic"""
+"""Core logic
+
+Names that depend on slow to import modules (ortools, yaml) are only
+imported on first access so short-lived scripts can import this package cheaply.
+"""
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from ._types import (
     Artist,
     Task,
     Context,
     Assignment,
+    AssignmentPool,
     TaskGroup,
 )
-from ._io import (
-    context_from_dict,
-    context_to_dict,
-    import_context_from_yml,
-    export_context_to_yml,
-)
-from ._solver import Solver
+from ._events import Change, ChangeKind
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ._io import (
+        context_from_dict,
+        context_to_dict,
+        import_context,
+        export_context,
+        import_context_from_yml,
+        export_context_to_yml,
+        import_context_from_json,
+        export_context_to_json,
+    )
+    from ._cache import ModelCache
+    from ._catalog import TaskCatalog, export_tasks_to_catalog
+    from ._report import SolveReport
+    from ._solver import Solver
+    from ._synthetic import generate_context
+
+# Map lazily imported names to the module defining them
+_LAZY = {
+    "context_from_dict": "._io",
+    "context_to_dict": "._io",
+    "import_context": "._io",
+    "export_context": "._io",
+    "import_context_from_yml": "._io",
+    "export_context_to_yml": "._io",
+    "import_context_from_json": "._io",
+    "export_context_to_json": "._io",
+    "ModelCache": "._cache",
+    "TaskCatalog": "._catalog",
+    "export_tasks_to_catalog": "._catalog",
+    "SolveReport": "._report",
+    "Solver": "._solver",
+    "generate_context": "._synthetic",
+}
 
 __all__ = (
     "Artist",
     "Assignment",
+    "AssignmentPool",
+    "Change",
+    "ChangeKind",
     "Context",
+    "ModelCache",
+    "SolveReport",
     "Solver",
     "Task",
+    "TaskCatalog",
     "TaskGroup",
     "context_from_dict",
     "context_to_dict",
+    "import_context",
+    "export_context",
     "import_context_from_yml",
     "export_context_to_yml",
+    "import_context_from_json",
+    "export_context_to_json",
+    "export_tasks_to_catalog",
+    "generate_context",
 )
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Don't go through __getattr__ next time
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
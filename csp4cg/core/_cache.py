@@ -0,0 +1,206 @@
+"""On-disk cache of built solver models.
+
+Building the model of a big session is slow as it's done in python.
+Models are cached by a hash of what define their variables and constraints:
+the artists, tasks, locks, task groups and which artists have preferences
+for which tasks. The weights of the preferences, task groups and settings
+are only part of the objective, changing them reuse the cached model.
+"""
+import hashlib
+import io
+import json
+import os
+import tempfile
+import time
+import zipfile
+from typing import Optional
+
+import numpy
+import ortools
+from google.protobuf.message import DecodeError
+from ortools.sat import cp_model_pb2
+
+from ._solver import Solver, _Solver, get_costs, set_parameters
+from ._types import AssignmentPool, Context
+
+# Increment when the model built by Solver change
+_VERSION = 1
+_EXTENSION = ".zip"
+_MODEL = "model.pb"
+_ASSIGNMENTS = "assignments.npy"
+_WEIGHTED = "weighted.npy"
+
+
+def get_cache_directory() -> str:
+    """Get the default directory of the model cache.
+
+    :return: A path in the user cache directory
+    """
+    root = (
+        os.environ.get("XDG_CACHE_HOME")
+        or os.environ.get("LOCALAPPDATA")
+        or os.path.join(os.path.expanduser("~"), ".cache")
+    )
+    return os.path.join(root, "csp4cg", "models")
+
+
+def get_context_key(context: Context) -> str:
+    """Hash what define the model variables and constraints of a context.
+
+    :param context: A context
+    :return: An hexadecimal digest, the same for contexts that only differ by weights.
+    """
+    columns = context.get_columns()
+    data = {
+        "version": _VERSION,
+        "ortools": ortools.__version__,
+        "artists": [artist.name for artist in context.artists],
+        "availabilities": columns.availabilities.tolist(),
+        "tasks": [task.name for task in context.tasks],
+        "durations": columns.durations.tolist(),
+        "locks": [
+            (assignment.task.name, assignment.artist.name)
+            for assignment in context.assignments
+        ],
+        "groups": [
+            [task.name for task in group.tasks] for group in context.combinations
+        ],
+        "preferences": [list(preferences) for preferences in columns.preferences],
+    }
+    return hashlib.sha256(json.dumps(data).encode()).hexdigest()
+
+
+class ModelCache:
+    """Built models stored on disk, keyed by the structure of their context.
+
+    :param directory: Where to store the models, default to the user cache directory.
+    :param max_entries: Number of models to keep, the least recently used are removed.
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_entries: int = 8):
+        self.directory = directory or get_cache_directory()
+        self.max_entries = max_entries
+
+    def get_path(self, context: Context) -> str:
+        """Get the path of the cached model of a context.
+
+        :param context: A context
+        :return: A path, that may not exist
+        """
+        return os.path.join(self.directory, get_context_key(context) + _EXTENSION)
+
+    def get_solver(self, context: Context, save: bool = True) -> Solver:
+        """Get a solver for a context, loading its model from the cache if possible.
+
+        :param context: A context
+        :param save: Save a model that had to be built. If False,
+          call save once it doesn't delay the solve, ie: when it started.
+        :return: A solver
+        """
+        path = self.get_path(context)
+        try:
+            solver = _CachedSolver(context, path)  # type: Solver
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile, DecodeError):
+            solver = Solver(context)
+            if save:
+                self.save(solver, context)
+        else:
+            os.utime(path)  # mark as recently used
+        return solver
+
+    def save(self, solver: Solver, context: Context):
+        """Save the model of a solver in the cache.
+
+        Saving only read the model, it can be done from another thread
+        while the solver is running. Errors are ignored.
+
+        :param solver: A solver built from the context
+        :param context: The context the solver was built from
+        """
+        try:
+            self._save(solver, self.get_path(context))
+        except OSError:  # the cache is an optimization, don't fail the solve
+            pass
+
+    def _save(self, solver: Solver, path: str):
+        """Save a solver model in the cache, its objective is set again when loaded.
+
+        :param solver: A solver
+        :param path: Destination path
+        """
+        # pylint: disable=protected-access
+        os.makedirs(self.directory, exist_ok=True)
+        weighted = numpy.array(
+            [variable.Index() for variable in solver._vars_weighted], dtype=numpy.int64
+        )
+        # Write to a temporary file first so concurrent solves never read a partial file
+        handle, path_tmp = tempfile.mkstemp(suffix=_EXTENSION, dir=self.directory)
+        try:
+            with os.fdopen(handle, "wb") as stream:
+                with zipfile.ZipFile(stream, "w") as archive:
+                    archive.writestr(_MODEL, solver.model.Proto().SerializeToString())
+                    archive.writestr(
+                        _ASSIGNMENTS, _to_bytes(solver._assignment_indexes)
+                    )
+                    archive.writestr(_WEIGHTED, _to_bytes(weighted))
+            os.replace(path_tmp, path)
+        except BaseException:
+            os.remove(path_tmp)
+            raise
+        self._prune()
+
+    def _prune(self):
+        """Remove the least recently used models."""
+        paths = [
+            os.path.join(self.directory, name)
+            for name in os.listdir(self.directory)
+            if name.endswith(_EXTENSION)
+        ]
+        paths.sort(key=os.path.getmtime, reverse=True)
+        for path in paths[self.max_entries :]:
+            os.remove(path)
+
+
+class _CachedSolver(Solver):  # pylint: disable=too-few-public-methods
+    """Solver which model is loaded from the cache instead of being built.
+
+    :param context: The context the model was built from
+    :param path: Path to a cached model
+    """
+
+    def __init__(
+        self, context: Context, path: str
+    ):  # pylint: disable=super-init-not-called
+        start = time.perf_counter()
+        _Solver.__init__(self)  # don't build a model, it is loaded instead
+        with zipfile.ZipFile(path) as archive:
+            data = archive.read(_MODEL)
+            assignments = _from_bytes(archive.read(_ASSIGNMENTS))
+            weighted = _from_bytes(archive.read(_WEIGHTED))
+        costs = get_costs(context)
+        shape = (len(context.artists), len(context.tasks))
+        if assignments.shape != shape or len(weighted) != len(costs):
+            raise ValueError(f"{path} was not built from this context")
+
+        set_parameters(self.solver.parameters, context.settings.solver_parameters)
+        self.model.Proto().MergeFrom(cp_model_pb2.CpModelProto.FromString(data))
+        self.artists = context.artists
+        self.tasks = context.tasks
+        self.assignments = AssignmentPool(self.artists, self.tasks)
+        self._assignment_indexes = assignments
+        self._vars_weighted = [
+            self.model.GetIntVarFromProtoIndex(index) for index in weighted.tolist()
+        ]
+        self._vars_weighted_cost = costs
+        self.report.build_time = time.perf_counter() - start
+        self.report.model_cached = True
+
+
+def _to_bytes(array: numpy.ndarray) -> bytes:
+    stream = io.BytesIO()
+    numpy.save(stream, array, allow_pickle=False)
+    return stream.getvalue()
+
+
+def _from_bytes(data: bytes) -> numpy.ndarray:
+    return numpy.load(io.BytesIO(data), allow_pickle=False)
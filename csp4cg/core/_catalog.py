@@ -0,0 +1,259 @@
+"""Memory-mapped, columnar storage for large task catalogs.
+
+A catalog store tasks column by column so a slice of it can be selected
+and converted to a context without parsing the whole file.
+
+File layout (little-endian), each section is aligned on 8 bytes:
+- header: magic, version, number of tasks, number of distinct tags
+- durations in hours: float64[num_tasks]
+- task names offsets: uint64[num_tasks + 1]
+- task tags offsets: uint64[num_tasks + 1]
+- tag names offsets: uint64[num_tags + 1]
+- task tags: uint32[], indexes in the tag names
+- task names: utf-8, each name is followed by a newline
+- tag names: utf-8, each name is followed by a newline
+"""
+import array
+import bisect
+import datetime
+import mmap
+import re
+import struct
+import sys
+from typing import Iterable, List, Optional, Sequence
+
+from csp4cg.core._tags import TagRegistry
+from csp4cg.core._types import Artist, Context, Settings, Task
+
+_MAGIC = b"CSP4CGTC"
+_VERSION = 1
+_HEADER = struct.Struct("<8sIII4x")
+_ALIGNMENT = 8
+_LITTLE_ENDIAN = sys.byteorder == "little"
+_REGEX_ANY_CHAR = rb"(?:[^\n\x80-\xff]|[\xc0-\xff][\x80-\xbf]+)"  # one utf-8 char
+
+
+def export_tasks_to_catalog(tasks: Iterable[Task], path: str):
+    """Export tasks to a catalog file.
+
+    :param tasks: The tasks to export
+    :param path: Destination path
+    :raises ValueError: If a task or tag name contain a newline.
+    """
+    durations = array.array("d")
+    name_offsets = array.array("Q", [0])
+    tag_offsets = array.array("Q", [0])
+    task_tags = array.array("I")
+    names = bytearray()
+    tags = TagRegistry()
+
+    for task in tasks:
+        durations.append(task.duration.total_seconds() / 60 / 60)
+        names += _encode(task.name)
+        name_offsets.append(len(names))
+        for tag in task.tags:
+            task_tags.append(tags.intern(tag))
+        tag_offsets.append(len(task_tags))
+
+    tag_names = bytearray()
+    tag_name_offsets = array.array("Q", [0])
+    for tag_id in range(len(tags)):
+        tag_names += _encode(tags.get_name(tag_id))
+        tag_name_offsets.append(len(tag_names))
+
+    with open(path, "wb") as stream:
+        stream.write(_HEADER.pack(_MAGIC, _VERSION, len(durations), len(tags)))
+        for section in (
+            durations,
+            name_offsets,
+            tag_offsets,
+            tag_name_offsets,
+            task_tags,
+        ):
+            if not _LITTLE_ENDIAN:
+                section.byteswap()
+            _write_aligned(stream, section.tobytes())
+        _write_aligned(stream, bytes(names))
+        _write_aligned(stream, bytes(tag_names))
+
+
+class TaskCatalog:
+    """Read-only view on a catalog file.
+
+    Nothing is parsed until accessed,
+    tasks are only created for the selected slice.
+
+    :param path: Path to a catalog file
+    :raises ValueError: If the file is not a catalog.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as stream:
+            self._mmap = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        self._views = []  # type: List[memoryview]
+
+        try:
+            magic, version, num_tasks, num_tags = _HEADER.unpack_from(self._mmap)
+        except struct.error as error:
+            self.close()
+            raise ValueError(f"{path} is not a task catalog.") from error
+        if magic != _MAGIC or version != _VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a task catalog.")
+
+        offset = _HEADER.size
+        self._durations, offset = self._view(offset, "d", num_tasks)
+        self._name_offsets, offset = self._view(offset, "Q", num_tasks + 1)
+        self._tag_offsets, offset = self._view(offset, "Q", num_tasks + 1)
+        tag_name_offsets, offset = self._view(offset, "Q", num_tags + 1)
+        self._task_tags, offset = self._view(offset, "I", self._tag_offsets[-1])
+        self._names_start = offset
+        offset = _align(offset + self._name_offsets[-1])
+        tag_names = self._mmap[offset : offset + tag_name_offsets[-1]]
+        self.tags = tag_names.decode("utf-8").split("\n")[:-1]  # type: List[str]
+        self._registry = TagRegistry(self.tags)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._durations)
+
+    def close(self):
+        """Release the memory map."""
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._mmap.close()
+
+    def name(self, index: int) -> str:
+        """Get a task name.
+
+        :param index: A task index
+        :return: The task name
+        """
+        start = self._names_start + self._name_offsets[index]
+        end = self._names_start + self._name_offsets[index + 1] - 1  # skip newline
+        return self._mmap[start:end].decode("utf-8")
+
+    def duration(self, index: int) -> datetime.timedelta:
+        """Get a task duration.
+
+        :param index: A task index
+        :return: The task duration
+        """
+        return datetime.timedelta(hours=self._durations[index])
+
+    def task_tags(self, index: int) -> List[str]:
+        """Get a task tags.
+
+        :param index: A task index
+        :return: The task tags
+        """
+        start, end = self._tag_offsets[index], self._tag_offsets[index + 1]
+        return [self.tags[tag_id] for tag_id in self._task_tags[start:end]]
+
+    def select(
+        self, pattern: Optional[str] = None, tags: Optional[Iterable[str]] = None
+    ) -> List[int]:
+        """Select tasks by name and/or by tags.
+
+        :param pattern: A wildcard pattern (ie: "sq010_*") that task names must match
+        :param tags: Tags that task must have, at least one of them
+        :return: The selected tasks indexes, in catalog order
+        """
+        indexes: Sequence[int] = range(len(self))
+        if pattern is not None:
+            indexes = self._select_by_pattern(pattern)
+        if tags is not None:
+            indexes = self._select_by_tags(tags, indexes)
+        return list(indexes)
+
+    def to_tasks(self, indexes: Iterable[int]) -> List[Task]:
+        """Create tasks from a selection.
+
+        :param indexes: Tasks indexes
+        :return: A list of tasks
+        """
+        return [
+            Task(self.name(index), self.duration(index), self.task_tags(index))
+            for index in indexes
+        ]
+
+    def to_context(
+        self,
+        indexes: Iterable[int],
+        artists: Iterable[Artist] = (),
+        settings: Optional[Settings] = None,
+    ) -> Context:
+        """Create a context from a selection.
+
+        :param indexes: Tasks indexes
+        :param artists: The artists to assign the selected tasks to
+        :param settings: Optional solver settings
+        :return: A context object
+        """
+        return Context(
+            artists=list(artists),
+            tasks=self.to_tasks(indexes),
+            settings=settings or Settings(),
+        )
+
+    def _select_by_pattern(self, pattern: str) -> List[int]:
+        """Match a wildcard pattern against all names in a single regex scan."""
+        regex = re.escape(pattern.encode("utf-8"))
+        regex = regex.replace(rb"\*", rb"[^\n]*").replace(rb"\?", _REGEX_ANY_CHAR)
+        compiled = re.compile(rb"^" + regex + rb"$", re.MULTILINE)
+        name_offsets = self._name_offsets
+        start = self._names_start
+        with memoryview(self._mmap)[start : start + name_offsets[-1]] as names:
+            return [
+                bisect.bisect_right(name_offsets, match.start()) - 1
+                for match in compiled.finditer(names)
+            ]
+
+    def _select_by_tags(self, tags: Iterable[str], indexes: Iterable[int]):
+        """Select tasks having at least one tag, comparing tags ids."""
+        tag_ids = {self._registry.get_id(tag) for tag in tags if tag in self._registry}
+        tag_offsets = self._tag_offsets
+        task_tags = self._task_tags
+        return [
+            index
+            for index in indexes
+            if not tag_ids.isdisjoint(
+                task_tags[tag_offsets[index] : tag_offsets[index + 1]]
+            )
+        ]
+
+    def _view(self, offset: int, typecode: str, count: int):
+        """Map a typed array section of the file.
+
+        :return: A sequence of values and the offset of the next section.
+        """
+        size = array.array(typecode).itemsize * count
+        if _LITTLE_ENDIAN:
+            base = memoryview(self._mmap)[offset : offset + size]
+            values = base.cast(typecode)  # type: ignore
+            self._views.extend((base, values))
+        else:  # pragma: no cover
+            values = array.array(typecode, self._mmap[offset : offset + size])
+            values.byteswap()
+        return values, _align(offset + size)
+
+
+def _encode(name: str) -> bytes:
+    if "\n" in name:
+        raise ValueError(f"Name cannot contain a newline: {name!r}")
+    return name.encode("utf-8") + b"\n"
+
+
+def _align(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _write_aligned(stream, data: bytes):
+    stream.write(data)
+    stream.write(b"\0" * (_align(len(data)) - len(data)))
@@ -0,0 +1,131 @@
+"""Column oriented, numeric view of a context."""
+import array
+import datetime
+from dataclasses import dataclass
+from typing import Dict, Iterable, List
+
+from ._tags import TagRegistry
+from ._types import Context
+
+
+@dataclass
+class ContextColumns:
+    """Numbers derived from a context, indexed like the artists and tasks lists.
+
+    Use Context.get_columns to get a cached instance.
+    """
+
+    # Task durations, in minutes.
+    durations: "array.array[int]"
+    # Artists availability, in percent.
+    availabilities: "array.array[int]"
+    # Sparse artists x tasks matrix, one row per artist.
+    # Map task indexes to the sum of the artist tags weights matching the task.
+    preferences: List[Dict[int, int]]
+    # Index of the task group each task is part of, -1 for none.
+    groups: "array.array[int]"
+    # Index of the artist each task is locked to, -1 for none.
+    locks: "array.array[int]"
+    # Artists and tasks indexes by name
+    artist_indexes: Dict[str, int]
+    task_indexes: Dict[str, int]
+    # Tags of all tasks and artists
+    tags: TagRegistry
+    # Tags of each task, as a bitset of tag ids
+    task_tags: List[int]
+    # Tasks of each tag id, the inverse of task_tags
+    tasks_by_tag: "List[array.array[int]]"
+
+    @classmethod
+    def from_context(cls, context: Context) -> "ContextColumns":
+        """Compute the columns of a context.
+
+        :param context: A context
+        :return: A columns object
+        """
+        artist_indexes = {artist.name: i for i, artist in enumerate(context.artists)}
+        task_indexes = {task.name: i for i, task in enumerate(context.tasks)}
+
+        # Intern tags and index tasks by tag id
+        # so each artist preference only visit matching tasks.
+        tags = TagRegistry()
+        task_tags = []  # type: List[int]
+        tasks_by_tag = []  # type: List[array.array[int]]
+        for index, task in enumerate(context.tasks):
+            mask = 0
+            for tag in task.tags:
+                tag_id = tags.intern(tag)
+                if tag_id == len(tasks_by_tag):
+                    tasks_by_tag.append(array.array("i"))
+                if not mask >> tag_id & 1:
+                    tasks_by_tag[tag_id].append(index)
+                mask |= 1 << tag_id
+            task_tags.append(mask)
+        for artist in context.artists:
+            for tag in artist.tags:
+                if tags.intern(tag) == len(tasks_by_tag):
+                    tasks_by_tag.append(array.array("i"))
+
+        preferences = []  # type: List[Dict[int, int]]
+        for artist in context.artists:
+            row = {}  # type: Dict[int, int]
+            for tag, weight in artist.tags.items():
+                for index in tasks_by_tag[tags.intern(tag)]:
+                    row[index] = row.get(index, 0) + weight
+                # A task name is also a tag
+                task_index = task_indexes.get(tag)
+                if task_index is not None and tag not in context.tasks[task_index].tags:
+                    row[task_index] = row.get(task_index, 0) + weight
+            preferences.append(row)
+
+        groups = array.array("i", [-1]) * len(context.tasks)
+        for group_index, group in enumerate(context.combinations):
+            for task in group.tasks:
+                task_index = task_indexes.get(task.name)
+                if task_index is not None:
+                    groups[task_index] = group_index
+
+        locks = array.array("i", [-1]) * len(context.tasks)
+        for assignment in context.assignments:
+            task_index = task_indexes.get(assignment.task.name)
+            artist_index = artist_indexes.get(assignment.artist.name)
+            if task_index is not None and artist_index is not None:
+                locks[task_index] = artist_index
+
+        return cls(
+            durations=array.array(
+                "q", (_timedelta_to_unit(task.duration) for task in context.tasks)
+            ),
+            availabilities=array.array(
+                "q", (artist.availability for artist in context.artists)
+            ),
+            preferences=preferences,
+            groups=groups,
+            locks=locks,
+            artist_indexes=artist_indexes,
+            task_indexes=task_indexes,
+            tags=tags,
+            task_tags=task_tags,
+            tasks_by_tag=tasks_by_tag,
+        )
+
+    def select_tasks(self, tags: Iterable[str]) -> List[int]:
+        """Select tasks having at least one of multiple tags.
+
+        :param tags: Tags
+        :return: The tasks indexes
+        """
+        mask = self.tags.to_mask(tags)
+        return [
+            index for index, task_mask in enumerate(self.task_tags) if task_mask & mask
+        ]
+
+
+def _timedelta_to_unit(delta: datetime.timedelta) -> int:
+    """Convert a datetime timedelta objects to internal units.
+    The smallest unit of time we handle is minutes.
+
+    :param delta: A timedelta object
+    :return: An amount of minutes
+    """
+    return int(delta.total_seconds() / 60)
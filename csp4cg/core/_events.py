@@ -0,0 +1,41 @@
+"""Events emitted when a context is modified."""
+import enum
+from dataclasses import dataclass
+from typing import Any, Callable, Tuple
+
+
+class ChangeKind(enum.Enum):
+    """What changed in a context."""
+
+    ARTIST_ADDED = "artist_added"
+    ARTIST_REMOVED = "artist_removed"
+    ARTIST_CHANGED = "artist_changed"
+    TASK_ADDED = "task_added"
+    TASK_REMOVED = "task_removed"
+    TASK_CHANGED = "task_changed"
+    LOCK_CHANGED = "lock_changed"
+    SOLUTION_CHANGED = "solution_changed"
+    GROUP_ADDED = "group_added"
+    GROUP_REMOVED = "group_removed"
+    GROUP_CHANGED = "group_changed"
+
+
+@dataclass(frozen=True)
+class Change:
+    """A single change made to a context.
+
+    :param kind: What changed
+    :param item: The artist, task or task group that changed.
+      For lock and solution changes, this is the task which assignments changed.
+    :param index: The item index in its context list.
+      For removals, this is the index the item had before being removed.
+    :param fields: For modifications, the name of the modified attributes.
+    """
+
+    kind: ChangeKind
+    item: Any
+    index: int
+    fields: Tuple[str, ...] = ()
+
+
+Listener = Callable[[Change], None]
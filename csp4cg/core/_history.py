@@ -0,0 +1,114 @@
+"""Undo/redo history of context edits.
+
+Each step stores the records needed to go backward and forward,
+recorded from the changes reported by the context. Undoing or redoing
+a step replay its records on the context, through the context methods.
+The solution of each state is cached separately so it can be restored
+without running the solver again.
+"""
+import collections
+from dataclasses import dataclass
+from typing import Any, Deque, List, Optional
+
+from csp4cg.core._types import Context
+from csp4cg.core._records import Record, Recorder, apply_records
+
+# Number of steps kept by default
+_DEFAULT_LIMIT = 100
+
+
+@dataclass
+class _Step:
+    """Records to go from a state to the next one and back."""
+
+    forward: List[Record]
+    backward: List[Record]
+    # Cached solution of the states before and after the step
+    before: Any = None
+    after: Any = None
+
+
+class History:
+    """Undo/redo stack of context edits.
+
+    Only edits made through the context methods and to the settings are recorded.
+
+    :param limit: Maximum number of steps that can be undone.
+    """
+
+    def __init__(self, limit: int = _DEFAULT_LIMIT):
+        self._undo: Deque[_Step] = collections.deque(maxlen=limit)
+        self._redo = []  # type: List[_Step]
+        self._recorder: Optional[Recorder] = None
+        self._solution = None  # type: Any
+
+    def reset(self, context: Context):
+        """Forget all steps and start recording the edits of a context.
+
+        :param context: The current context
+        """
+        if self._recorder is not None:
+            self._recorder.close()
+        self._recorder = Recorder(context, solution=False)
+        self._undo.clear()
+        self._redo.clear()
+        self._solution = None
+
+    def record(self) -> bool:
+        """Record the edits made to the context since the last call.
+
+        :return: Was there any edit to record?
+        """
+        if self._recorder is None:
+            return False
+        forward, backward = self._recorder.pop()
+        if not forward:
+            return False
+        self._undo.append(_Step(forward, backward, before=self._solution))
+        self._redo.clear()
+        self._solution = None
+        return True
+
+    def set_solution(self, solution: Any):
+        """Cache the solution of the current state.
+
+        :param solution: Any value, usually the assignments and their scores.
+        """
+        self._solution = solution
+
+    def can_undo(self) -> bool:
+        """Determine if there is a step to undo."""
+        return bool(self._undo)
+
+    def can_redo(self) -> bool:
+        """Determine if there is a step to redo."""
+        return bool(self._redo)
+
+    def undo(self) -> Any:
+        """Modify the context back to its state before the last step.
+
+        :return: The cached solution of the previous state, if any.
+        :raises IndexError: If there is nothing to undo.
+        """
+        step = self._undo.pop()
+        step.after = self._solution
+        self._redo.append(step)
+        return self._move(step.backward, step.before)
+
+    def redo(self) -> Any:
+        """Re-apply the last undone step to the context.
+
+        :return: The cached solution of the next state, if any.
+        :raises IndexError: If there is nothing to redo.
+        """
+        step = self._redo.pop()
+        step.before = self._solution
+        self._undo.append(step)
+        return self._move(step.forward, step.after)
+
+    def _move(self, records: List[Record], solution: Any) -> Any:
+        assert self._recorder is not None
+        apply_records(self._recorder.context, records)
+        self._recorder.pop()  # the replayed edits are already part of the step
+        self._solution = solution
+        return solution
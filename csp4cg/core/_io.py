@@ -1,10 +1,25 @@
 """Logic for serializing/deserializing a session."""
+import ast
 import csv
 import dataclasses
 import datetime
-from typing import Dict, Type, List, Sequence, Any
-
-import yaml
+import functools
+import gzip
+import json
+import operator
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    IO,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 from csp4cg.core._types import (
     Artist,
@@ -14,33 +29,72 @@ from csp4cg.core._types import (
     Settings,
     Assignment,
 )
+from csp4cg.core._score import get_score, get_unassigned_tasks
+
+_CSV_CHUNK_SIZE = 10000  # Number of rows parsed at once when importing a .csv file
+
+
+@functools.lru_cache(maxsize=None)
+def _get_yaml() -> Tuple[Any, Any, Any]:
+    """Import yaml on first use, it is slow to import and not always needed.
+
+    :return: The yaml module, a safe loader class and a safe dumper class
+    """
+    # pylint: disable=import-outside-toplevel
+    import yaml
+
+    try:  # Use the libyaml bindings when available, they are a lot faster.
+        from yaml import CSafeLoader as loader, CSafeDumper as dumper
+    except ImportError:  # pragma: no cover
+        from yaml import SafeLoader as loader, SafeDumper as dumper  # type: ignore
 
+    return yaml, loader, dumper
 
-def context_to_dict(context: Context) -> Dict:
+
+def context_to_dict(context: Context, compact: bool = False) -> Dict:
     """Serialize a context object to a JSON compatible data type.
 
     :param context: A context object
+    :param compact: If True, assignments and task groups reference
+        artists and tasks by their index instead of by their name.
     :return: A dict
     """
     data = {
-        "artists": [_artist_to_dict(artist) for artist in context.artists],
-        "tasks": [_task_to_dict(task) for task in context.tasks],
-        "settings": _settings_to_dict(context.settings),
-    }
-    if context.assignments:
-        data["assignments"] = [
-            {"artist": assignment.artist.name, "task": assignment.task.name}
-            for assignment in sorted(context.assignments)
-        ]
-    if context.solution:
-        data["solution"] = [
-            {"artist": assignment.artist.name, "task": assignment.task.name}
-            for assignment in sorted(context.solution)
-        ]
+        "artists": [artist_to_dict(artist) for artist in context.artists],
+        "tasks": [task_to_dict(task) for task in context.tasks],
+        "settings": settings_to_dict(context.settings),
+    }  # type: Dict[str, Any]
+
+    artist_indexes = task_indexes = None
+    if compact:
+        data["compact"] = True
+        artist_indexes = {artist.name: i for i, artist in enumerate(context.artists)}
+        task_indexes = {task.name: i for i, task in enumerate(context.tasks)}
+
+    for key, assignments in (
+        ("assignments", context.assignments),
+        ("solution", context.solution),
+    ):
+        if not assignments:
+            continue
+        if compact:
+            data[key] = [
+                [
+                    _get_ref(assignment.artist, artist_indexes),
+                    _get_ref(assignment.task, task_indexes),
+                ]
+                for assignment in sorted(assignments)
+            ]
+        else:
+            data[key] = [
+                {"artist": assignment.artist.name, "task": assignment.task.name}
+                for assignment in sorted(assignments)
+            ]
+
     if context.combinations:
         data["combinations"] = [
             {
-                "tasks": [task.name for task in combination.tasks],
+                "tasks": [_get_ref(task, task_indexes) for task in combination.tasks],
                 "weight": combination.weight,
             }
             for combination in context.combinations
@@ -54,40 +108,120 @@ def context_from_dict(data: Dict) -> Context:
     :param data: A dict
     :return: A context object
     """
-    context = Context(
-        artists=[
-            _artist_from_dict(artist_data) for artist_data in data.get("artists", ())
-        ],
-        tasks=[_task_from_dict(task_data) for task_data in data.get("tasks", ())],
-        settings=_settings_from_dict(data.get("settings", {})),
+    artists = [artist_from_dict(artist_data) for artist_data in data.get("artists", ())]
+    tasks = [task_from_dict(task_data) for task_data in data.get("tasks", ())]
+
+    compact = data.get("compact", False)
+    get_artist = get_task = None  # type: Any
+    if compact:  # artists and tasks are referenced by index
+        get_artist = artists.__getitem__
+        get_task = tasks.__getitem__
+    else:  # artists and tasks are referenced by name
+        get_artist = {artist.name: artist for artist in artists}.__getitem__
+        get_task = {task.name: task for task in tasks}.__getitem__
+
+    # Load assignments and solutions, the context index them on creation
+    loaded = {}  # type: Dict[str, List[Assignment]]
+    for key in ("assignments", "solution"):
+        assignments = loaded[key] = []
+        for assignment_data in data.get(key, []):
+            if compact:
+                artist_ref, task_ref = assignment_data
+            else:
+                artist_ref = assignment_data["artist"]
+                task_ref = assignment_data["task"]
+            assignments.append(Assignment(get_artist(artist_ref), get_task(task_ref)))
+
+    # Load combinations
+    combinations = []
+    for combination_data in data.get("combinations", []):
+        group_tasks = [get_task(task_ref) for task_ref in combination_data["tasks"]]
+        combinations.append(TaskGroup(group_tasks, combination_data["weight"]))
+
+    return Context(
+        artists=artists,
+        tasks=tasks,
+        assignments=loaded["assignments"],
+        settings=settings_from_dict(data.get("settings", {})),
+        combinations=combinations,
+        solution=loaded["solution"],
     )
 
-    artists_by_name = {artist.name: artist for artist in context.artists}
-    tasks_by_name = {task.name: task for task in context.tasks}
 
-    # Load assignments
-    for assignment_data in data.get("assignments", []):
-        assignment = Assignment(
-            artists_by_name[assignment_data["artist"]],
-            tasks_by_name[assignment_data["task"]],
-        )
-        context.assignments.append(assignment)
+def import_context(path: str) -> Context:
+    """Deserialize a context from a session file.
+    The file format is deduced from the file extension.
 
-    # Load solutions
-    for assignment_data in data.get("solution", []):
-        assignment = Assignment(
-            artists_by_name[assignment_data["artist"]],
-            tasks_by_name[assignment_data["task"]],
-        )
-        context.solution.append(assignment)
+    :param path: Path to a .yml, .json or .json.gz file
+    :return: A context object
+    :raises ValueError: The the file cannot be serialized.
+    """
+    if _is_json(path):
+        return import_context_from_json(path)
+    return import_context_from_yml(path)
 
-    # Load combinations
-    for combination_data in data.get("combinations", []):
-        tasks = [tasks_by_name[task_name] for task_name in combination_data["tasks"]]
-        combination = TaskGroup(tasks, combination_data["weight"])
-        context.combinations.append(combination)
 
-    return context
+def export_context(context: Context, path: str):
+    """Serialize a context to a session file.
+    The file format is deduced from the file extension.
+
+    :param context: Context to serialize
+    :param path: Destination path to a .yml, .json or .json.gz file
+    """
+    if _is_json(path):
+        export_context_to_json(context, path)
+    else:
+        export_context_to_yml(context, path)
+
+
+def import_context_from_json(path: str) -> Context:
+    """Deserialize a context from a compact JSON file.
+
+    :param path: Path to a .json file, or a gzip compressed .json.gz file
+    :return: A context object
+    :raises ValueError: The the file cannot be serialized.
+    """
+    with _open_json(path, "r") as stream:
+        try:
+            data = json.load(stream)
+        except ValueError as error:  # also catch UnicodeDecodeError
+            raise ValueError(error) from error
+        except OSError as error:  # not a gzip file
+            raise ValueError(error) from error
+    if not data:
+        raise ValueError("File is empty.")
+    return context_from_dict(data)
+
+
+def export_context_to_json(context: Context, path: str):
+    """Serialize a context to a compact JSON file.
+
+    :param context: Context to serialize
+    :param path: Destination path to a .json file, or a .json.gz file to compress it
+    """
+    data = context_to_dict(context, compact=True)
+    with _open_json(path, "w") as stream:
+        json.dump(data, stream, separators=(",", ":"))
+
+
+def _get_ref(entity: Union[Artist, Task], indexes: Optional[Dict[str, int]]):
+    """Get how an artist or task is referenced in a serialized context.
+
+    :param entity: An artist or a task
+    :param indexes: Index by name for compact serialization, None otherwise.
+    :return: The entity name, or the entity index if compact
+    """
+    return entity.name if indexes is None else indexes[entity.name]
+
+
+def _is_json(path: str) -> bool:
+    return path.endswith((".json", ".json.gz"))
+
+
+def _open_json(path: str, mode: str) -> IO:
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")  # type: ignore
+    return open(path, mode, encoding="utf-8")
 
 
 def import_context_from_yml(path: str) -> Context:
@@ -97,28 +231,48 @@ def import_context_from_yml(path: str) -> Context:
     :return: A context object
     :raises ValueError: The the file cannot be serialized.
     """
+    return context_from_dict(load_yml(path))
+
+
+def export_context_to_yml(context: Context, path: str):
+    """Serialize a context to a YAML file.
+
+    :param context: Context to serialize
+    :param path: Destination path to a .yml file
+    """
+    dump_yml(context_to_dict(context), path)
+
+
+def load_yml(path: str) -> Dict:
+    """Load a serialized context dict from a JSON/YAML file.
+
+    :param path: Path to load from
+    :return: A dict
+    :raises ValueError: The the file cannot be serialized.
+    """
+    yaml, loader, _ = _get_yaml()
     with open(path) as stream:
         try:
-            data = yaml.safe_load(stream)
+            data = yaml.load(stream, Loader=loader)
         except yaml.YAMLError as error:
             raise ValueError(error) from error
     if not data:
         raise ValueError("File is empty.")
-    return context_from_dict(data)
+    return data
 
 
-def export_context_to_yml(context: Context, path: str):
-    """Serialize a context to a YAML file.
+def dump_yml(data: Dict, path: str):
+    """Dump a serialized context dict to a YAML file.
 
-    :param context: Context to serialize
+    :param data: A dict
     :param path: Destination path to a .yml file
     """
-    data = context_to_dict(context)
+    yaml, _, dumper = _get_yaml()
     with open(path, "w") as stream:
-        yaml.safe_dump(data, stream)
+        yaml.dump(data, stream, Dumper=dumper)
 
 
-def _artist_to_dict(artist: Artist) -> Dict:
+def artist_to_dict(artist: Artist) -> Dict:
     """Serialize an artist object to a JSON compatible data type.
 
     :param artist: An artist object
@@ -135,7 +289,7 @@ def _artist_to_dict(artist: Artist) -> Dict:
     return data
 
 
-def _artist_from_dict(data: Dict) -> Artist:
+def artist_from_dict(data: Dict) -> Artist:
     """Deserialize an artist from a JSON compatible data type.
 
     :param data: A dict
@@ -151,7 +305,7 @@ def _artist_from_dict(data: Dict) -> Artist:
     )
 
 
-def _task_to_dict(task: Task) -> Dict:
+def task_to_dict(task: Task) -> Dict:
     """Serialize a task object to a JSON compatible data type.
 
     :param task: A task object
@@ -162,11 +316,11 @@ def _task_to_dict(task: Task) -> Dict:
         "duration": task.duration.total_seconds() / 60 / 60,  # in hours
     }
     if task.tags:
-        result["tags"] = task.tags
+        result["tags"] = list(task.tags)
     return result
 
 
-def _task_from_dict(data: Dict) -> Task:
+def task_from_dict(data: Dict) -> Task:
     """Deserialize a task from a JSON dict.
 
     :param data: A dict
@@ -179,20 +333,34 @@ def _task_from_dict(data: Dict) -> Task:
     )
 
 
-def _settings_from_dict(data: Dict) -> Settings:
+def settings_from_dict(data: Dict) -> Settings:
+    """Deserialize solver settings from a JSON compatible data type.
+
+    :param data: A dict
+    :return: A settings object
+    """
     return Settings(
         weight_tags=data.get("TAGS", 1),
         weight_equal_hours_by_artists=data.get("EQUAL_TASKS_BY_USER", 0),
         weight_equal_tasks_count_by_artists=data.get("EQUAL_TASKS_COUNT_BY_USER", 0),
+        solver_parameters=dict(data.get("SOLVER_PARAMETERS", {})),
     )
 
 
-def _settings_to_dict(settings: Settings) -> dict:
-    return {
+def settings_to_dict(settings: Settings) -> dict:
+    """Serialize solver settings to a JSON compatible data type.
+
+    :param settings: A settings object
+    :return: A dict
+    """
+    data = {
         "TAGS": settings.weight_tags,
         "EQUAL_TASKS_BY_USER": settings.weight_equal_hours_by_artists,
         "EQUAL_TASKS_COUNT_BY_USER": settings.weight_equal_tasks_count_by_artists,
-    }
+    }  # type: Dict[str, Any]
+    if settings.solver_parameters:
+        data["SOLVER_PARAMETERS"] = dict(settings.solver_parameters)
+    return data
 
 
 def export_artists_to_csv(artists: Sequence[Artist], path: str):
@@ -213,20 +381,93 @@ def export_assignments_to_csv(assignments: Sequence[Assignment], path: str):
             writer.writerow([assignment.task.name, assignment.artist.name])
 
 
-def import_assignments_from_csv(context: Context, path: str):
-    """Import a list of assignments from a .csv file."""
-    assignments = []
+def import_assignments_from_csv(context: Context, path: str) -> List[Assignment]:
+    """Import a list of assignments from a .csv file.
+
+    :raises ValueError: If any row is invalid.
+    """
+    result = ingest_assignments_from_csv(context, path)
+    _raise_errors(result.errors)
+    return result.assignments
+
+
+@dataclasses.dataclass
+class RowError:
+    """An invalid row encountered while importing a .csv file."""
+
+    line: int
+    message: str
+
+    def __str__(self):
+        return f"Line {self.line}: {self.message}"
+
+
+@dataclasses.dataclass
+class AssignmentsImport:
+    """Assignments imported from a .csv file, validated against a context."""
+
+    assignments: List[Assignment]
+    errors: List[RowError]
+    unassigned: List[Task]  # tasks that had no valid assignment
+    score: int  # score of the valid assignments
+
+    @property
+    def complete(self) -> bool:
+        """Are all tasks assigned, without any errors?"""
+        return not self.errors and not self.unassigned
+
+
+def ingest_assignments_from_csv(context: Context, path: str) -> AssignmentsImport:
+    """Import assignments from a .csv file, validating them in a single pass.
+
+    Rows referencing unknown tasks or artists, assigning the same task twice
+    or contradicting a locked assignment are reported as errors and skipped.
+
+    :param context: The context the assignments are for
+    :param path: Path to the .csv file, with task and artist columns
+    :return: The valid assignments, the errors and the score
+    """
+    errors = []  # type: List[RowError]
     artist_by_name = {artist.name: artist for artist in context.artists}
     task_by_name = {task.name: task for task in context.tasks}
-    with open(path) as stream:
-        reader = csv.reader(stream)
-        for row in reader:
-            task_name, artist_name = row
-            assignment = Assignment(
-                artist_by_name[artist_name], task_by_name[task_name]
-            )
-            assignments.append(assignment)
-    return assignments
+    locked_artist_by_task = {
+        assignment.task.name: assignment.artist.name
+        for assignment in context.assignments
+    }
+    line_by_task = {}  # type: Dict[str, int]
+    assignments = []  # type: List[Assignment]
+
+    for chunk in _iter_csv_chunks(path, _ASSIGNMENT_COLUMNS, errors):
+        for line, values in chunk:
+            task_name = values["task"]
+            artist_name = values.get("artist")
+            task = task_by_name.get(task_name)
+            artist = artist_by_name.get(artist_name)  # type: ignore
+            locked_artist = locked_artist_by_task.get(task_name, artist_name)
+            if artist_name is None:
+                message = "Missing artist"
+            elif task is None:
+                message = f"Unknown task {task_name!r}"
+            elif artist is None:
+                message = f"Unknown artist {artist_name!r}"
+            elif task_name in line_by_task:
+                first_line = line_by_task[task_name]
+                message = f"Task {task_name!r} already assigned line {first_line}"
+            elif locked_artist != artist_name:
+                message = f"Task {task_name!r} is locked to {locked_artist!r}"
+            else:
+                line_by_task[task_name] = line
+                assignments.append(Assignment(artist, task))
+                continue
+            errors.append(RowError(line, message))
+
+    errors.sort(key=operator.attrgetter("line"))
+    return AssignmentsImport(
+        assignments=assignments,
+        errors=errors,
+        unassigned=get_unassigned_tasks(context, assignments),
+        score=get_score(context, assignments),
+    )
 
 
 def _export_to_csv(cls: Type, path: str, data: Sequence[Any]):
@@ -244,31 +485,221 @@ def _export_to_csv(cls: Type, path: str, data: Sequence[Any]):
 
 
 def import_artists_from_csv(path: str) -> List[Artist]:
-    """Import a list of artists from a .csv file."""
-    artists = []  # type: List[Artist]
-    _import_from_csv(Artist, path, artists)
-    return artists
+    """Import a list of artists from a .csv file.
+
+    :raises ValueError: If any row is invalid.
+    """
+    context = Context()
+    _raise_errors(merge_artists_from_csv(context, path))
+    return context.artists
 
 
 def import_tasks_from_csv(path: str) -> List[Task]:
-    """Import a list of tasks from a .csv file."""
-    tasks = []  # type: List[Task]
-    _import_from_csv(Task, path, tasks)
-    return tasks
+    """Import a list of tasks from a .csv file.
+
+    :raises ValueError: If any row is invalid.
+    """
+    context = Context()
+    _raise_errors(merge_tasks_from_csv(context, path))
+    return context.tasks
 
 
-def _import_from_csv(cls: Type, path: str, data: List):
-    """Import data from a .csv file.
+def merge_artists_from_csv(context: Context, path: str) -> List[RowError]:
+    """Import artists from a .csv file into a context.
+    Artists that already exist are updated, other are added.
+
+    :param context: The context to update
+    :param path: Path to the .csv file.
+    :return: Invalid rows, they are skipped.
+    """
+    return _merge_from_csv(
+        Artist,
+        _ARTIST_COLUMNS,
+        path,
+        context.artists,
+        context.add_artist,
+        context.update_artist,
+    )
+
+
+def merge_tasks_from_csv(context: Context, path: str) -> List[RowError]:
+    """Import tasks from a .csv file into a context.
+    Tasks that already exist are updated, other are added.
+
+    :param context: The context to update
+    :param path: Path to the .csv file.
+    :return: Invalid rows, they are skipped.
+    """
+    return _merge_from_csv(
+        Task, _TASK_COLUMNS, path, context.tasks, context.add_task, context.update_task
+    )
+
+
+def _merge_from_csv(  # pylint: disable=too-many-arguments
+    cls: Type,
+    columns: Dict[str, Callable[[str], Any]],
+    path: str,
+    data: List,
+    add: Callable[[Any], None],
+    update: Callable[..., bool],
+) -> List[RowError]:
+    """Import data from a .csv file, merging it with existing data by name.
+
+    Only the columns present in the file are updated on existing entries.
 
     :param cls: The data class to instantiate.
+    :param columns: Parser for each column, in the default column order.
     :param path: Path to the .csv file.
     :param data: Registry of existing data
+    :param add: Function that add a new entry
+    :param update: Function that update an existing entry
+    :return: Invalid rows
     """
-    fields = dataclasses.fields(cls)
-    del data[:]
-    with open(path) as stream:
+    errors = []  # type: List[RowError]
+    required = [
+        field.name
+        for field in dataclasses.fields(cls)
+        if field.default is field.default_factory is dataclasses.MISSING
+    ]
+    entry_by_name = {entry.name: entry for entry in data}
+    for chunk in _iter_csv_chunks(path, columns, errors):
+        for line, values in chunk:
+            entry = entry_by_name.get(values["name"])
+            if entry:
+                update(entry, **values)
+                continue
+            missing = [name for name in required if name not in values]
+            if missing:
+                errors.append(RowError(line, f"Missing {', '.join(missing)}"))
+                continue
+            entry = cls(**values)
+            add(entry)
+            entry_by_name[entry.name] = entry
+    return errors
+
+
+def _iter_csv_chunks(
+    path: str,
+    columns: Dict[str, Callable[[str], Any]],
+    errors: List[RowError],
+    chunk_size: int = _CSV_CHUNK_SIZE,
+) -> Iterator[List[Tuple[int, Dict[str, Any]]]]:
+    """Read and parse a .csv file by chunks of rows.
+
+    If the first row only contain known column names, it is used as a header.
+    Otherwise, columns are expected in the default order.
+    The first column is used as a key and is always required.
+
+    :param path: Path to the .csv file.
+    :param columns: Parser for each column, in the default column order.
+    :param errors: Invalid rows are appended to this list.
+    :param chunk_size: Maximum number of rows in a chunk.
+    :return: A generator that yield lists of line numbers and parsed values.
+    """
+    header = list(columns)
+    chunk = []  # type: List[Tuple[int, Dict[str, Any]]]
+    with open(path, newline="") as stream:
         reader = csv.reader(stream)
         for row in reader:
-            dict_ = {field.name: row for field, row in zip(fields, row)}
-            entry = cls(**dict_)
-            data.append(entry)
+            line = reader.line_num
+            if not any(cell.strip() for cell in row):
+                continue
+
+            names = [cell.strip().lower() for cell in row]
+            if line == 1 and set(names) <= set(columns):
+                if header[0] not in names:
+                    errors.append(RowError(line, f"Missing {header[0]} column"))
+                    return
+                header = names
+                continue
+
+            if len(row) > len(header):
+                errors.append(
+                    RowError(line, f"Expected {len(header)} columns, got {len(row)}")
+                )
+                continue
+
+            values = {}
+            for name, cell in zip(header, row):
+                try:
+                    values[name] = columns[name](cell.strip())
+                except (ValueError, SyntaxError, TypeError):
+                    errors.append(RowError(line, f"Invalid {name}: {cell!r}"))
+                    break
+            else:
+                chunk.append((line, values))
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+    if chunk:
+        yield chunk
+
+
+def _raise_errors(errors: List[RowError]):
+    if errors:
+        raise ValueError("\n".join(str(error) for error in errors))
+
+
+def _parse_name(value: str) -> str:
+    if not value:
+        raise ValueError("Name is empty")
+    return value
+
+
+def _parse_duration(value: str) -> datetime.timedelta:
+    """Parse a duration in hours, ie: "1.5", "1,5", "1:30:00" or "1 day, 1:30:00"."""
+    if ":" in value:
+        days, _, value = value.rpartition(",")  # ie: "1 day" or "2 days"
+        hours, minutes, seconds = (float(token) for token in value.split(":"))
+        duration = datetime.timedelta(
+            days=float(days.split()[0]) if days else 0,
+            hours=hours,
+            minutes=minutes,
+            seconds=seconds,
+        )
+    else:
+        duration = datetime.timedelta(hours=float(value.replace(",", ".")))
+    if duration <= datetime.timedelta():
+        raise ValueError(value)
+    return duration
+
+
+def _parse_artist_tags(value: str) -> Dict[str, int]:
+    """Parse artist tags, ie: "acting:10,fx:5" or "{'acting': 10, 'fx': 5}"."""
+    if value.startswith("{"):
+        tags = ast.literal_eval(value)
+        if not isinstance(tags, dict):
+            raise ValueError(value)
+        return {str(name): int(weight) for name, weight in tags.items()}
+    tags = {}
+    for token in value.split(","):
+        name, _, weight = token.partition(":")
+        if name.strip():
+            tags[name.strip()] = int(weight) if weight.strip() else 1
+    return tags
+
+
+def _parse_task_tags(value: str) -> List[str]:
+    """Parse task tags, ie: "acting,fx" or "['acting', 'fx']"."""
+    if value.startswith("["):
+        tags = ast.literal_eval(value)
+        if not isinstance(tags, list):
+            raise ValueError(value)
+        return [str(tag) for tag in tags]
+    return [tag.strip() for tag in value.split(",") if tag.strip()]
+
+
+_ASSIGNMENT_COLUMNS = {
+    "task": _parse_name,
+    "artist": _parse_name,
+}  # type: Dict[str, Callable[[str], Any]]
+_ARTIST_COLUMNS = {
+    "name": _parse_name,
+    "availability": int,
+    "tags": _parse_artist_tags,
+}  # type: Dict[str, Callable[[str], Any]]
+_TASK_COLUMNS = {
+    "name": _parse_name,
+    "duration": _parse_duration,
+    "tags": _parse_task_tags,
+}  # type: Dict[str, Callable[[str], Any]]
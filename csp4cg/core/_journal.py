@@ -0,0 +1,141 @@
+"""Append-only journal of context edits, used for autosave and crash recovery.
+
+A journal is made of two files:
+- a full snapshot of the context, in the regular .yml session format.
+- an append-only file of JSON records, one per line, describing the edits
+  made since the snapshot was written.
+
+Records are made from the changes reported by the context, see _records.
+Restoring a journal replay the records on top of the snapshot.
+"""
+import json
+import logging
+import os
+from typing import Iterator, Optional
+
+from csp4cg.core._types import Context
+from csp4cg.core._io import context_from_dict, dump_yml, load_yml
+from csp4cg.core._records import Record, Recorder, State
+
+_LOG = logging.getLogger(__name__)
+
+# Number of records after which the journal is compacted into a new snapshot.
+_DEFAULT_COMPACT_EVERY = 500
+
+
+class Journal:
+    """Append-only journal of context edits.
+
+    :param path: Path to the snapshot .yml file.
+        The journal records are written next to it.
+    :param compact_every: Number of records after which a new snapshot is written.
+    """
+
+    def __init__(self, path: str, compact_every: int = _DEFAULT_COMPACT_EVERY):
+        self.path = path
+        self.path_journal = path + ".journal"
+        self.compact_every = compact_every
+        self._recorder: Optional[Recorder] = None
+        self._num_records = 0
+
+    def exists(self) -> bool:
+        """Determine if there's something to restore."""
+        return os.path.exists(self.path)
+
+    def write(self, context: Context):
+        """Record the edits made to a context since the last write.
+
+        A full snapshot is written on the first write of a context,
+        when artists, tasks or task groups were added or removed without
+        going through the context methods, and when compacting.
+        Reordering them in place is only detected when compacting.
+
+        :param context: The context to save
+        """
+        recorder = self._recorder
+        if (
+            recorder is None
+            or recorder.context is not context
+            or not recorder.is_synced(order=False)
+        ):
+            self._start(context)
+            return
+
+        records, _ = recorder.pop()
+        if self._num_records >= self.compact_every:
+            self.compact()
+        elif records:
+            with open(self.path_journal, "a") as stream:
+                stream.writelines(
+                    json.dumps(record, separators=(",", ":")) + "\n"
+                    for record in records
+                )
+            self._num_records += len(records)
+
+    def compact(self):
+        """Fold the journal records into a new snapshot."""
+        recorder = self._recorder
+        if recorder is None:
+            return
+        if not recorder.is_synced():
+            _LOG.debug("Context modified without reporting it, writing it again")
+            self._start(recorder.context)
+            return
+        recorder.pop()
+        self._write_snapshot()
+
+    def restore(self) -> Context:
+        """Restore a context by replaying the journal on top of the last snapshot.
+
+        Later writes of the restored context append to the journal.
+
+        :return: A context object
+        :raises ValueError: If the snapshot cannot be read.
+        """
+        state = State.from_dict(load_yml(self.path))
+        num_records = 0
+        for record in self._iter_records():
+            state.apply(record)
+            num_records += 1
+        context = context_from_dict(state.to_dict())
+        self._close()
+        self._recorder = Recorder(context, state=state)
+        self._num_records = num_records
+        return context
+
+    def _start(self, context: Context):
+        """Start recording a context, from a full snapshot."""
+        self._close()
+        self._recorder = Recorder(context)
+        self._write_snapshot()
+
+    def _close(self):
+        if self._recorder is not None:
+            self._recorder.close()
+            self._recorder = None
+
+    def _iter_records(self) -> Iterator[Record]:
+        """Yield records from the journal file.
+
+        Reading stop at the first malformed line,
+        which can happen if a crash occurred while writing.
+        """
+        if not os.path.exists(self.path_journal):
+            return
+        with open(self.path_journal) as stream:
+            for line in stream:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    _LOG.warning("Ignoring truncated journal %s", self.path_journal)
+                    return
+
+    def _write_snapshot(self):
+        """Write a full snapshot and discard existing journal records."""
+        assert self._recorder is not None
+        path_tmp = self.path + ".tmp"
+        dump_yml(self._recorder.state.to_dict(), path_tmp)
+        os.replace(path_tmp, self.path)
+        with open(self.path_journal, "w"):
+            pass
+        self._num_records = 0
@@ -0,0 +1,451 @@
+"""Records of context edits, shared by the undo history and the autosave journal.
+
+A record is a JSON compatible dict describing one edit, ie:
+{"op": "update_task", "name": "0010", "data": {...}}.
+Records are made from the changes reported by the context,
+so recording an edit doesn't require serializing the whole context.
+"""
+import dataclasses
+import itertools
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from csp4cg.core._events import Change, ChangeKind
+from csp4cg.core._types import Context, TaskGroup
+from csp4cg.core._io import (
+    artist_from_dict,
+    artist_to_dict,
+    context_to_dict,
+    settings_from_dict,
+    settings_to_dict,
+    task_from_dict,
+    task_to_dict,
+)
+
+Record = Dict[str, Any]
+
+_TO_DICT: Dict[str, Callable[[Any], Dict]] = {
+    "artist": artist_to_dict,
+    "task": task_to_dict,
+}
+_ADDED = {ChangeKind.ARTIST_ADDED: "artist", ChangeKind.TASK_ADDED: "task"}
+_REMOVED = {ChangeKind.ARTIST_REMOVED: "artist", ChangeKind.TASK_REMOVED: "task"}
+_CHANGED = {ChangeKind.ARTIST_CHANGED: "artist", ChangeKind.TASK_CHANGED: "task"}
+
+
+@dataclass
+class State:
+    """A serialized context, indexed by name so records apply cheaply.
+
+    Appending an artist or a task, updating it, removing a task and replacing
+    the locks or the solution of a task don't depend on the context size.
+    Inserting an artist or a task, renaming it or removing an artist
+    go through all the entries, as they are rare.
+    """
+
+    artists: Dict[str, Dict] = field(default_factory=dict)
+    tasks: Dict[str, Dict] = field(default_factory=dict)
+    # Names of the artists each task is locked or assigned to, by task name
+    assignments: Dict[str, List[str]] = field(default_factory=dict)
+    solution: Dict[str, List[str]] = field(default_factory=dict)
+    combinations: List[Dict] = field(default_factory=list)
+    settings: Dict = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "State":
+        """Index a serialized context.
+
+        :param data: A dict, as returned by context_to_dict
+        :return: A state object
+        """
+        return cls(
+            artists={entry["name"]: entry for entry in data.get("artists", ())},
+            tasks={entry["name"]: entry for entry in data.get("tasks", ())},
+            assignments=_group_by_task(data.get("assignments", ())),
+            solution=_group_by_task(data.get("solution", ())),
+            combinations=list(data.get("combinations", ())),
+            settings=dict(data.get("settings", {})),
+        )
+
+    @classmethod
+    def from_context(cls, context: Context, solution: bool = True) -> "State":
+        """Serialize a context.
+
+        :param context: A context object
+        :param solution: If False, the solution is left out.
+        :return: A state object
+        """
+        state = cls.from_dict(context_to_dict(context))
+        if not solution:
+            state.solution = {}
+        return state
+
+    def to_dict(self) -> Dict:
+        """Convert back to a serialized context.
+
+        :return: A dict, as accepted by context_from_dict
+        """
+        data = {
+            "artists": list(self.artists.values()),
+            "tasks": list(self.tasks.values()),
+            "settings": self.settings,
+        }
+        for key, by_task in (
+            ("assignments", self.assignments),
+            ("solution", self.solution),
+        ):
+            pairs = sorted(
+                (task, artist)
+                for task, artists in by_task.items()
+                for artist in artists
+            )
+            if pairs:
+                data[key] = [{"artist": artist, "task": task} for task, artist in pairs]
+        if self.combinations:
+            data["combinations"] = self.combinations
+        return data
+
+    def apply(self, record: Record):  # pylint: disable=too-many-branches
+        """Replay a record.
+
+        Removing an artist or a task also remove its locks and solution,
+        renaming one also rename its locks, solution and task groups,
+        the same way the context does.
+
+        :param record: A record
+        :raises ValueError: If the record operation is unknown.
+        """
+        op = record["op"]
+        if op in ("add_artist", "add_task"):
+            _insert(
+                self.artists if op == "add_artist" else self.tasks,
+                record["index"],
+                record["data"],
+            )
+        elif op == "update_artist":
+            old, new = record["name"], record["data"]["name"]
+            _update(self.artists, old, record["data"])
+            if old != new:
+                for by_task in (self.assignments, self.solution):
+                    for task, artists in by_task.items():
+                        if old in artists:
+                            by_task[task] = [
+                                new if name == old else name for name in artists
+                            ]
+        elif op == "update_task":
+            old, new = record["name"], record["data"]["name"]
+            _update(self.tasks, old, record["data"])
+            if old != new:
+                for by_task in (self.assignments, self.solution):
+                    if old in by_task:
+                        by_task[new] = by_task.pop(old)
+                self.combinations = [
+                    _rename_task(group, old, new) for group in self.combinations
+                ]
+        elif op == "remove_artist":
+            name = record["name"]
+            del self.artists[name]
+            for by_task in (self.assignments, self.solution):
+                for task, artists in list(by_task.items()):
+                    if name in artists:
+                        _set_artists(
+                            by_task, task, [item for item in artists if item != name]
+                        )
+        elif op == "remove_task":
+            name = record["name"]
+            del self.tasks[name]
+            self.assignments.pop(name, None)
+            self.solution.pop(name, None)
+        elif op == "set_locks":
+            _set_artists(self.assignments, record["task"], record["artists"])
+        elif op == "set_solution":
+            _set_artists(self.solution, record["task"], record["artists"])
+        elif op == "add_group":
+            self.combinations.insert(record["index"], record["data"])
+        elif op == "update_group":
+            self.combinations[record["index"]] = record["data"]
+        elif op == "remove_group":
+            del self.combinations[record["index"]]
+        elif op == "set_settings":
+            self.settings = record["data"]
+        else:
+            raise ValueError(f"Unknown record: {op!r}")
+
+
+class Recorder:
+    """Record the changes reported by a context.
+
+    Each change is recorded as forward records, that redo it,
+    and backward records, that undo it. The settings are modified
+    without reporting it, they are compared on each pop.
+    The solution is only recorded forward, undoing a change don't restore it.
+
+    :param context: The context to record
+    :param solution: Also record the solution, default to True.
+    :param state: The context state if already known, ie: when it was restored.
+    """
+
+    def __init__(
+        self, context: Context, solution: bool = True, state: Optional[State] = None
+    ):
+        self.context = context
+        self.state = state or State.from_context(context, solution=solution)
+        self._solution = solution
+        self._forward = []  # type: List[Record]
+        self._backward = []  # type: List[List[Record]]  # by change
+        context.subscribe(self._on_change)
+
+    def close(self):
+        """Stop recording the context changes."""
+        self.context.unsubscribe(self._on_change)
+
+    def is_synced(self, order: bool = True) -> bool:
+        """Check that the state has the context artists, tasks and task groups.
+
+        Adding, removing or reordering them in place, instead of
+        through the context methods, is not reported.
+
+        :param order: Also compare the artists and tasks names in order,
+          which takes a time proportional to the context size.
+          Otherwise, only their numbers are compared.
+        """
+        state = self.state
+        context = self.context
+        if (
+            len(state.artists) != len(context.artists)
+            or len(state.tasks) != len(context.tasks)
+            or len(state.combinations) != len(context.combinations)
+        ):
+            return False
+        return not order or (
+            list(state.artists) == [artist.name for artist in context.artists]
+            and list(state.tasks) == [task.name for task in context.tasks]
+        )
+
+    def pop(self) -> Tuple[List[Record], List[Record]]:
+        """Get the records of the changes made since the last call.
+
+        :return: The forward records, to apply in order to redo the changes,
+          and the backward records, to apply in order to undo them.
+        """
+        self._record_settings()
+        forward = self._forward
+        backward = [
+            record for records in reversed(self._backward) for record in records
+        ]
+        self._forward = []
+        self._backward = []
+        return forward, backward
+
+    def _on_change(self, change: Change):
+        if change.kind is ChangeKind.LOCK_CHANGED:
+            self._record_locks(change)
+        elif change.kind in _ADDED:
+            entity = _ADDED[change.kind]
+            data = _TO_DICT[entity](change.item)
+            self._record(
+                [{"op": f"add_{entity}", "index": change.index, "data": data}],
+                [{"op": f"remove_{entity}", "name": data["name"]}],
+            )
+        elif change.kind in _REMOVED:
+            self._record_removed(change, _REMOVED[change.kind])
+        elif change.kind in _CHANGED:
+            self._record_changed(change, _CHANGED[change.kind])
+        elif change.kind is ChangeKind.SOLUTION_CHANGED:
+            if self._solution:
+                self._record_solution(change)
+        else:
+            self._record_group(change)
+
+    def _record(self, forward: List[Record], backward: List[Record]):
+        for record in forward:
+            self.state.apply(record)
+        self._forward.extend(forward)
+        self._backward.append(backward)
+
+    def _record_locks(self, change: Change):
+        task = change.item.name
+        artists = [lock.artist.name for lock in self.context.get_locks(change.item)]
+        old = list(self.state.assignments.get(task, ()))
+        self._record(
+            [{"op": "set_locks", "task": task, "artists": artists}],
+            [{"op": "set_locks", "task": task, "artists": old}],
+        )
+
+    def _record_changed(self, change: Change, entity: str):
+        entries = self.state.artists if entity == "artist" else self.state.tasks
+        data = _TO_DICT[entity](change.item)
+        old = data["name"]
+        if "name" in change.fields:  # renamed, the old name is at the same index
+            old = next(itertools.islice(entries, change.index, None))
+        forward = {"op": f"update_{entity}", "name": old, "data": data}
+        backward = {
+            "op": f"update_{entity}",
+            "name": data["name"],
+            "data": entries[old],
+        }
+        self._record([forward], [backward])
+
+    def _record_removed(self, change: Change, entity: str):
+        name = change.item.name
+        if entity == "artist":
+            entries = self.state.artists
+            locks = {
+                task: list(artists)
+                for task, artists in self.state.assignments.items()
+                if name in artists
+            }
+        else:
+            entries = self.state.tasks
+            locks = {name: list(self.state.assignments.get(name, ()))}
+        backward = [
+            {"op": f"add_{entity}", "index": change.index, "data": entries[name]}
+        ]
+        backward.extend(
+            {"op": "set_locks", "task": task, "artists": artists}
+            for task, artists in locks.items()
+            if artists
+        )
+        self._record([{"op": f"remove_{entity}", "name": name}], backward)
+
+    def _record_group(self, change: Change):
+        index = change.index
+        if change.kind is ChangeKind.GROUP_ADDED:
+            data = _group_to_dict(change.item)
+            forward = {"op": "add_group", "index": index, "data": data}
+            backward = {"op": "remove_group", "index": index}
+        elif change.kind is ChangeKind.GROUP_REMOVED:
+            forward = {"op": "remove_group", "index": index}
+            old = self.state.combinations[index]
+            backward = {"op": "add_group", "index": index, "data": old}
+        else:
+            data = _group_to_dict(change.item)
+            forward = {"op": "update_group", "index": index, "data": data}
+            old = self.state.combinations[index]
+            backward = {"op": "update_group", "index": index, "data": old}
+        self._record([forward], [backward])
+
+    def _record_settings(self):
+        settings = settings_to_dict(self.context.settings)
+        if settings != self.state.settings:
+            self._record(
+                [{"op": "set_settings", "data": settings}],
+                [{"op": "set_settings", "data": self.state.settings}],
+            )
+
+    def _record_solution(self, change: Change):
+        task = change.item.name
+        artists = [item.artist.name for item in self.context.get_solution(change.item)]
+        self._record([{"op": "set_solution", "task": task, "artists": artists}], [])
+
+
+def apply_records(  # pylint: disable=too-many-branches
+    context: Context, records: Iterable[Record]
+):
+    """Replay records on a context, through its methods so changes are reported.
+
+    Solution records are skipped,
+    the history caches the solution of each state apart.
+
+    :param context: The context to modify
+    :param records: Records, as returned by Recorder.pop
+    :raises ValueError: If a record operation is unknown.
+    """
+    for record in records:
+        op = record["op"]
+        if op == "add_artist":
+            context.add_artist(artist_from_dict(record["data"]), record["index"])
+        elif op == "add_task":
+            context.add_task(task_from_dict(record["data"]), record["index"])
+        elif op == "update_artist":
+            artist = artist_from_dict(record["data"])
+            context.update_artist(context.get_artist(record["name"]), **_values(artist))
+        elif op == "update_task":
+            task = task_from_dict(record["data"])
+            context.update_task(context.get_task(record["name"]), **_values(task))
+        elif op == "remove_artist":
+            context.remove_artist(context.get_artist(record["name"]))
+        elif op == "remove_task":
+            context.remove_task(context.get_task(record["name"]))
+        elif op == "set_locks":
+            task = context.get_task(record["task"])
+            artists = [context.get_artist(name) for name in record["artists"]]
+            context.set_locks(task, artists)
+        elif op == "add_group":
+            context.add_group(
+                _group_from_dict(context, record["data"]), record["index"]
+            )
+        elif op == "update_group":
+            group = _group_from_dict(context, record["data"])
+            context.update_group(
+                context.combinations[record["index"]], **_values(group)
+            )
+        elif op == "remove_group":
+            context.remove_groups([context.combinations[record["index"]]])
+        elif op == "set_solution":
+            continue
+        elif op == "set_settings":  # in place, the settings object may be shared
+            settings = settings_from_dict(record["data"])
+            for name, value in _values(settings).items():
+                setattr(context.settings, name, value)
+        else:
+            raise ValueError(f"Cannot apply {op!r} to a context")
+
+
+def _group_by_task(pairs: Iterable[Dict]) -> Dict[str, List[str]]:
+    """Group serialized assignments by task name."""
+    result = {}  # type: Dict[str, List[str]]
+    for entry in pairs:
+        result.setdefault(entry["task"], []).append(entry["artist"])
+    return result
+
+
+def _insert(entries: Dict[str, Dict], index: int, data: Dict):
+    """Add an entry, only going through the others if it is not the last one."""
+    if index >= len(entries):
+        entries[data["name"]] = data
+        return
+    items = list(entries.items())
+    items.insert(index, (data["name"], data))
+    entries.clear()
+    entries.update(items)
+
+
+def _set_artists(by_task: Dict[str, List[str]], task: str, artists: List[str]):
+    """Replace the artists of a task, removing the task if there is none."""
+    by_task.pop(task, None)
+    if artists:
+        by_task[task] = list(artists)
+
+
+def _update(entries: Dict[str, Dict], name: str, data: Dict):
+    """Replace an entry, keeping its position if it was renamed."""
+    if data["name"] == name:
+        entries[name] = data
+        return
+    items = [
+        (data["name"], data) if key == name else (key, value)
+        for key, value in entries.items()
+    ]
+    entries.clear()
+    entries.update(items)
+
+
+def _values(obj: Any) -> Dict[str, Any]:
+    """Get the attributes of a dataclass instance, by name."""
+    return {item.name: getattr(obj, item.name) for item in dataclasses.fields(obj)}
+
+
+def _rename_task(group: Dict, old: str, new: str) -> Dict:
+    """Rename a task of a serialized task group, without modifying it in place."""
+    if old not in group["tasks"]:
+        return group
+    return dict(group, tasks=[new if name == old else name for name in group["tasks"]])
+
+
+def _group_to_dict(group: TaskGroup) -> Dict:
+    return {"tasks": [task.name for task in group.tasks], "weight": group.weight}
+
+
+def _group_from_dict(context: Context, data: Dict) -> TaskGroup:
+    return TaskGroup([context.get_task(name) for name in data["tasks"]], data["weight"])
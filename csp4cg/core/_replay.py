@@ -0,0 +1,86 @@
+"""Export a built solver model to replay it offline, ie: to tune the solver parameters.
+
+A model file is a .zip archive containing:
+- model.pb: the CpModelProto, objective included.
+- mapping.json: the artists and tasks of the assignment variables.
+- parameters.txt: the solver parameters the model was exported with, for reference.
+
+The session itself (tags, groups, settings) is not included,
+only what is needed to decode a solution into assignments.
+"""
+import json
+import time
+import zipfile
+
+import numpy
+from google.protobuf.message import DecodeError
+from ortools.sat import cp_model_pb2
+
+from ._solver import Solver, _Solver
+from ._types import Artist, AssignmentPool, Task
+
+_VERSION = 1
+_MODEL = "model.pb"
+_MAPPING = "mapping.json"
+_PARAMETERS = "parameters.txt"
+
+
+def export_model(solver: Solver, path: str):
+    """Export a solver model and the mapping of its variables to a file.
+
+    :param solver: A solver
+    :param path: Destination path to a .zip file
+    """
+    solver.set_objective()
+    indexes = solver._assignment_indexes  # pylint: disable=protected-access
+    mapping = {
+        "version": _VERSION,
+        "artists": [artist.name for artist in solver.artists],
+        "tasks": [
+            {"name": task.name, "duration": task.duration.total_seconds() / 3600}
+            for task in solver.tasks
+        ],
+        "assignments": indexes.tolist(),
+    }
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(_MODEL, solver.model.Proto().SerializeToString())
+        archive.writestr(_MAPPING, json.dumps(mapping))
+        archive.writestr(_PARAMETERS, str(solver.solver.parameters))
+
+
+class ReplaySolver(Solver):  # pylint: disable=too-few-public-methods
+    """Solver loaded from a model file instead of being built from a context.
+
+    :param path: Path to a model file, see export_model.
+    :raises ValueError: If the file is not a model file.
+    """
+
+    def __init__(self, path: str):  # pylint: disable=super-init-not-called
+        start = time.perf_counter()
+        _Solver.__init__(self)  # don't build a model, it is loaded instead
+        try:
+            with zipfile.ZipFile(path) as archive:
+                data = archive.read(_MODEL)
+                mapping = json.loads(archive.read(_MAPPING))
+        except (zipfile.BadZipFile, KeyError) as error:
+            raise ValueError(f"{path} is not a model file: {error}") from error
+        if mapping.get("version") != _VERSION:
+            raise ValueError(f"Unsupported model version: {mapping.get('version')}")
+        try:
+            model = cp_model_pb2.CpModelProto.FromString(data)
+        except DecodeError as error:
+            raise ValueError(f"{path} has a corrupted model: {error}") from error
+
+        self.model.Proto().MergeFrom(model)
+        self.artists = [Artist(name) for name in mapping["artists"]]
+        self.tasks = [
+            Task(entry["name"], entry["duration"]) for entry in mapping["tasks"]
+        ]
+        self.assignments = AssignmentPool(self.artists, self.tasks)
+        self._assignment_indexes = numpy.array(
+            mapping["assignments"], dtype=numpy.int64
+        ).reshape(len(self.artists), len(self.tasks))
+        self.report.build_time = time.perf_counter() - start
+
+    def set_objective(self):
+        """The objective is part of the loaded model."""
@@ -0,0 +1,141 @@
+"""Instrumentation of a solve: where the time goes and how the objective evolve.
+
+The solver search log is parsed rather than relying on a solution callback
+so the report doesn't depend on which printer is used.
+"""
+import dataclasses
+import json
+import os
+import re
+from typing import Any, Dict, List, Optional
+
+# Log line at the end of the presolve, ie: "Starting search at 0.05s with 8 workers."
+_REGEX_SEARCH_START = re.compile(r"^Starting search at (\S+)s")
+# Log line on each improving solution, ie: "#12  0.41s best:-99 next:[-98,102] no_lp"
+_REGEX_SOLUTION = re.compile(
+    r"^#\d+\s+(?P<time>\S+)s best:(?P<objective>\S+)"
+    r" next:\[(?P<lower>[^,]+),(?P<upper>[^\]]+)\]"
+)
+
+_REPORT_SUFFIX = ".report.json"
+
+
+@dataclasses.dataclass
+class SolutionPoint:
+    """An improving solution found during a solve."""
+
+    time: float  # seconds since the start of the solve
+    objective: float
+    bound: float  # best objective bound at the time the solution was found
+
+    @property
+    def gap(self) -> float:
+        """The relative gap between the objective and the bound."""
+        return get_gap(self.objective, self.bound)
+
+
+@dataclasses.dataclass
+class SolveReport:  # pylint: disable=too-many-instance-attributes
+    """Summary of a solve.
+
+    All durations are in seconds.
+    """
+
+    status: str = "UNKNOWN"
+    build_time: float = 0.0  # time spent building the model in python
+    model_cached: bool = False  # was the model loaded from the cache instead of built
+    presolve_time: Optional[float] = None  # time before the search start
+    solve_time: float = 0.0  # time spent in the solver, presolve included
+    num_variables: int = 0
+    num_constraints: int = 0
+    objective: Optional[float] = None
+    best_bound: Optional[float] = None
+    solutions: List[SolutionPoint] = dataclasses.field(default_factory=list)
+
+    @property
+    def gap(self) -> Optional[float]:
+        """The relative gap between the objective and the best bound.
+
+        A gap of 0 mean the solution is proven optimal.
+        """
+        if self.objective is None or self.best_bound is None:
+            return None
+        return get_gap(self.objective, self.best_bound)
+
+    def on_log(self, line: str):
+        """Collect information from a line of the solver search log.
+
+        :param line: A log line
+        """
+        if line.startswith("#"):
+            match = _REGEX_SOLUTION.match(line)
+            if match:
+                # The model is maximized so the upper end of the next
+                # objective domain is the bound.
+                self.solutions.append(
+                    SolutionPoint(
+                        float(match.group("time")),
+                        float(match.group("objective")),
+                        float(match.group("upper")),
+                    )
+                )
+        elif line.startswith("Starting search"):
+            match = _REGEX_SEARCH_START.match(line)
+            if match:
+                self.presolve_time = float(match.group(1))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to a JSON compatible data type."""
+        data = dataclasses.asdict(self)
+        data["gap"] = self.gap
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SolveReport":
+        """Deserialize from a JSON compatible data type."""
+        data = dict(data)
+        data.pop("gap", None)
+        solutions = [SolutionPoint(**entry) for entry in data.pop("solutions", ())]
+        return cls(solutions=solutions, **data)
+
+
+def get_gap(objective: float, bound: float) -> float:
+    """Get the relative gap between an objective and its best bound, like CP-SAT.
+
+    :param objective: An objective value
+    :param bound: The best objective bound
+    :return: A positive ratio, 0 if the objective is proven optimal.
+    """
+    return abs(bound - objective) / max(1.0, abs(objective))
+
+
+def get_report_path(path: str) -> str:
+    """Get the path of a session solve report, next to the session file.
+
+    :param path: Path to a session file, ie: "session.yml"
+    :return: Path to a .json file, ie: "session.report.json"
+    """
+    root, ext = os.path.splitext(path)
+    if ext == ".gz":
+        root = os.path.splitext(root)[0]
+    return root + _REPORT_SUFFIX
+
+
+def export_report(report: SolveReport, path: str):
+    """Export a solve report to a .json file.
+
+    :param report: A solve report
+    :param path: Destination path
+    """
+    with open(path, "w") as stream:
+        json.dump(report.to_dict(), stream, indent=2)
+
+
+def import_report(path: str) -> SolveReport:
+    """Import a solve report from a .json file.
+
+    :param path: Path to a .json file
+    :return: A solve report
+    """
+    with open(path) as stream:
+        return SolveReport.from_dict(json.load(stream))
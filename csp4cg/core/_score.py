@@ -0,0 +1,111 @@
+"""Compute the score of a set of assignments without running the solver."""
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from ._types import Assignment, Context, Task
+
+# Name, score and weight, as reported by the solver.
+Score = Tuple[str, int, int]
+
+
+def iter_scores(context: Context, assignments: Sequence[Assignment]) -> Iterator[Score]:
+    """Yield the score of each objective the solver try to maximize.
+
+    The names match the solver variables so the result can be used
+    in place of the statistics of a solve.
+
+    :param context: The context the assignments are for
+    :param assignments: Assignments, one per task
+    :return: A generator of name, score and weight
+    """
+    settings = context.settings
+    columns = context.get_columns()
+    artist_by_task: Dict[int, int] = {}
+    for assignment in assignments:
+        task_index = columns.task_indexes[assignment.task.name]
+        artist_index = columns.artist_indexes[assignment.artist.name]
+        artist_by_task[task_index] = artist_index
+
+    # Artists preferences
+    for task_index, artist_index in artist_by_task.items():
+        weight = columns.preferences[artist_index].get(task_index)
+        if weight:
+            weight *= settings.weight_tags
+            task = context.tasks[task_index]
+            artist = context.artists[artist_index]
+            yield f"assign_task_{task.name}_to_{artist.name}", weight, weight
+
+    # Task groups
+    for combination in context.combinations:
+        weight = combination.weight * settings.weight_tags
+        artists = {
+            artist_by_task.get(columns.task_indexes[task.name])
+            for task in combination.tasks
+        }
+        satisfied = len(artists) == 1 and None not in artists
+        yield str(combination), weight if satisfied else 0, weight
+
+    # Workload relative to availability and number of tasks
+    durations = [0] * len(context.artists)
+    counts = [0] * len(context.artists)
+    for task_index, artist_index in artist_by_task.items():
+        durations[artist_index] += columns.durations[task_index]
+        counts[artist_index] += 1
+
+    total_duration = sum(columns.durations)
+    total_availability = sum(columns.availabilities)
+    for artist, availability, duration in zip(
+        context.artists, columns.availabilities, durations
+    ):
+        goal = (
+            int(total_duration * availability / total_availability)
+            if total_availability
+            else 0
+        )
+        yield _get_deviation_score(
+            f"{artist.name}_hours_deviation_cost",
+            duration,
+            goal,
+            settings.weight_equal_hours_by_artists,
+        )
+
+    num_tasks = len(context.tasks)
+    num_artists = len(context.artists)
+    for artist, count in zip(context.artists, counts):
+        yield _get_deviation_score(
+            f"{artist.name}_number_of_tasks_deviation_cost",
+            count,
+            int(num_tasks / num_artists),
+            settings.weight_equal_tasks_count_by_artists,
+        )
+
+
+def get_score(context: Context, assignments: Sequence[Assignment]) -> int:
+    """Compute the total score of a set of assignments.
+
+    :param context: The context the assignments are for
+    :param assignments: Assignments, one per task
+    :return: The score the solver would give to these assignments
+    """
+    return sum(score for _, score, _ in iter_scores(context, assignments))
+
+
+def get_unassigned_tasks(
+    context: Context, assignments: Iterable[Assignment]
+) -> List[Task]:
+    """Get the tasks that are not part of a set of assignments.
+
+    :param context: The context the assignments are for
+    :param assignments: Assignments
+    :return: A list of tasks
+    """
+    assigned = {assignment.task.name for assignment in assignments}
+    return [task for task in context.tasks if task.name not in assigned]
+
+
+def _get_deviation_score(prefix: str, value: int, goal: int, cost: int) -> Score:
+    """Score the deviation from a value, the cost is exponential.
+
+    Like the solver, the variable is the squared distance and its weight the cost.
+    """
+    distance = abs(value - goal)
+    return f"{prefix}_total", -distance * distance * cost, -cost
@@ -1,8 +1,12 @@
 """CSP solvers"""
-import datetime
+
+import dataclasses
 import itertools
-from typing import Generator, Hashable, Tuple, Iterable
+import time
+from typing import Any, Dict, Generator, Hashable, List, Tuple, Iterable, Sequence
 
+import numpy
+from ortools.sat.sat_parameters_pb2 import SatParameters
 from ortools.sat.python.cp_model import (
     CpModel,
     CpSolver,
@@ -14,11 +18,20 @@ from ortools.sat.python.cp_model import (
     FEASIBLE,
 )
 
-from ._types import Task, Artist, Context, Assignment
+from ._report import SolveReport
+from ._types import Task, Artist, Context, Assignment, AssignmentPool
 
 _VARIABLE_ASSIGNMENT_TEMPLATE = "assign_task_{task}_to_{artist}"
 
 
+@dataclasses.dataclass(frozen=True)
+class ScoreMetadata:
+    """Name and weight of each score, they don't change during a solve."""
+
+    names: Tuple[str, ...]
+    weights: Tuple[int, ...]
+
+
 class _Solver:
     """Generic solver class."""
 
@@ -32,7 +45,10 @@ class _Solver:
         self._vars_int = {}
         self._vars_weighted = []
         self._vars_weighted_cost = []
+        self._weighted_indexes = numpy.array([], dtype=numpy.int64)
+        self._weighted_costs = numpy.array([], dtype=numpy.int64)
         self.printer = ObjectiveSolutionPrinter()
+        self.report = SolveReport()
 
     def create_variable_bool(self, name: str = None) -> IntVar:
         """Create a boolean variable.
@@ -130,9 +146,34 @@ class _Solver:
         for variable, score in zip(self._vars_weighted, self._vars_weighted_cost):
             yield variable, score
 
-    def solve(self):
-        """Solve using provided constraints."""
+    def get_score_metadata(self) -> ScoreMetadata:
+        """Get the name and weight of each score, in the order of get_scores."""
+        return ScoreMetadata(
+            tuple(variable.Name() for variable in self._vars_weighted),
+            tuple(self._vars_weighted_cost),
+        )
 
+    def get_scores(self, values: Sequence[int]) -> numpy.ndarray:
+        """Compute the scores of a solution.
+
+        :param values: The value of all the model variables, by variable index,
+          ie: the "solution" field of a solver response.
+        :return: The value of each weighted variable multiplied by its weight.
+        """
+        # The weighted variables are known once the model is built, cache them.
+        if self._weighted_indexes.size != len(self._vars_weighted):
+            self._weighted_indexes = numpy.array(
+                [variable.Index() for variable in self._vars_weighted],
+                dtype=numpy.int64,
+            )
+            self._weighted_costs = numpy.array(
+                self._vars_weighted_cost, dtype=numpy.int64
+            )
+        array = numpy.fromiter(values, dtype=numpy.int64, count=len(values))
+        return array[self._weighted_indexes] * self._weighted_costs
+
+    def set_objective(self):
+        """Maximize the weighted variables, called before solving."""
         self.model.Maximize(
             sum(
                 var * cost
@@ -148,8 +189,29 @@ class _Solver:
                 )
             )
         )
+
+    def solve(self):
+        """Solve using provided constraints."""
+        self.set_objective()
+        report = self.report = SolveReport(
+            build_time=self.report.build_time, model_cached=self.report.model_cached
+        )
+        proto = self.model.Proto()
+        report.num_variables = len(proto.variables)
+        report.num_constraints = len(proto.constraints)
+
+        # The search log is only parsed, not shown.
+        self.solver.parameters.log_search_progress = True
+        self.solver.parameters.log_to_stdout = False
+        self.solver.log_callback = report.on_log
         status = self.solver.SolveWithSolutionCallback(self.model, self.printer)
 
+        report.status = self.solver.StatusName(status)
+        report.solve_time = self.solver.WallTime()
+        if status in (OPTIMAL, FEASIBLE):
+            report.objective = self.solver.ObjectiveValue()
+            report.best_bound = self.solver.BestObjectiveBound()
+
         if status not in (OPTIMAL, FEASIBLE):
             raise RuntimeError("No solution found! Status is %s" % status)
         return status
@@ -159,21 +221,28 @@ class Solver(_Solver):
     """Solver that assign tasks to artists."""
 
     def __init__(self, context: Context):
+        start = time.perf_counter()
         super().__init__()
+        set_parameters(self.solver.parameters, context.settings.solver_parameters)
         self.artists = context.artists
         self.tasks = context.tasks
+        self.assignments = AssignmentPool(self.artists, self.tasks)
 
-        # Convert task durations to internal units
-        duration_by_task = {
-            task: _timedelta_to_unit(task.duration) for task in self.tasks
-        }
-        total_duration = sum(duration_by_task.values())
+        columns = context.get_columns()
+        total_duration = sum(columns.durations)
         num_tasks = len(self.tasks)
         num_users = len(self.artists)
 
-        # Create one variable for each possible assignment
-        for artist, task in itertools.product(self.artists, self.tasks):
-            self.create_variable_assignment(task, artist)
+        # Create one variable for each possible assignment.
+        # Their indexes in the model are kept as an artists x tasks matrix
+        # to read all the assignments of a solution at once.
+        self._assignment_indexes = numpy.array(
+            [
+                self.create_variable_assignment(task, artist).Index()
+                for artist, task in itertools.product(self.artists, self.tasks)
+            ],
+            dtype=numpy.int64,
+        ).reshape(num_users, num_tasks)
 
         # A task need to be assigned to an artist and only once
         for task in self.tasks:
@@ -187,14 +256,13 @@ class Solver(_Solver):
             expr = self.get_variable_assignment(assignment.task, assignment.artist) == 1
             self.add_hard_constraint(expr)
 
-        # Compute individual artists preferences using tags.
-        for artist, task in itertools.product(self.artists, self.tasks):
-            for tag, weight in artist.tags.items():
-                if tag == task.name or tag in task.tags:
-                    variable = self.get_variable_assignment(task, artist)
-                    self.set_variable_bool_score(
-                        variable, weight * context.settings.weight_tags
-                    )
+        # Apply individual artists preferences, pre-computed from tags.
+        for artist, preferences in zip(self.artists, columns.preferences):
+            for task_index, weight in preferences.items():
+                variable = self.get_variable_assignment(self.tasks[task_index], artist)
+                self.set_variable_bool_score(
+                    variable, weight * context.settings.weight_tags
+                )
 
         # Apply task groups
         # This give points if a set of task are all assigned to the same artist.
@@ -219,13 +287,13 @@ class Solver(_Solver):
             self.model.AddBoolOr(variables).OnlyEnforceIf(var_transition)
 
         # Ensure all artists work the same number of hours RELATIVE TO AVAILABILITY
-        total_availability = sum(artist.availability for artist in self.artists)
-        for artist in self.artists:
+        total_availability = sum(columns.availabilities)
+        for artist, availability in zip(self.artists, columns.availabilities):
             expr = sum(
-                self.get_variable_assignment(task, artist) * duration_by_task[task]
-                for task in self.tasks
+                self.get_variable_assignment(task, artist) * duration
+                for task, duration in zip(self.tasks, columns.durations)
             )
-            goal = int(total_duration * artist.availability / total_availability)
+            goal = int(total_duration * availability / total_availability)
             self.create_soft_constraint_target_value(
                 f"{artist.name}_hours_deviation_cost",
                 expr,
@@ -247,6 +315,8 @@ class Solver(_Solver):
                 context.settings.weight_equal_tasks_count_by_artists,
             )
 
+        self.report.build_time = time.perf_counter() - start
+
     def solve(self) -> Tuple[Assignment, ...]:
         """Solve using provided constraints."""
         super().solve()
@@ -254,10 +324,20 @@ class Solver(_Solver):
 
     def _iter_assignments(self) -> Iterable[Assignment]:
         """Iter current assignments"""
-        for artist, task in itertools.product(self.artists, self.tasks):
-            variable = self.get_variable_assignment(task, artist)
-            if self.solver.BooleanValue(variable):
-                yield Assignment(artist=artist, task=task)
+        return self.get_assignments(self.solver.ResponseProto().solution)
+
+    def get_assignments(self, values: Sequence[int]) -> Tuple[Assignment, ...]:
+        """Decode the assignments of a solution.
+
+        :param values: The value of all the model variables, by variable index,
+          ie: the "solution" field of a solver response.
+        :return: The assignments, ordered by artist then task.
+        """
+        array = numpy.fromiter(values, dtype=numpy.int64, count=len(values))
+        artist_indexes, task_indexes = numpy.nonzero(array[self._assignment_indexes])
+        return tuple(
+            map(self.assignments.get, artist_indexes.tolist(), task_indexes.tolist())
+        )
 
     def create_soft_constraint_target_value(
         self, prefix: str, expr: IntVar, goal: int, domain: int, cost: int
@@ -275,10 +355,11 @@ class Solver(_Solver):
         var_distance = _create_distance(self.model, domain, prefix, expr, goal)
         var_weight = self.create_variable_int(f"{prefix}_cost", 0, domain_exp)
         self.model.AddMultiplicationEquality(var_weight, [var_distance, var_distance])
+        # The cost is only part of the objective so changing it don't change the model.
         var_total = self.create_soft_constraint_int(
-            f"{prefix}_total", 0, domain_exp * cost, -1
+            f"{prefix}_total", 0, domain_exp, -cost
         )
-        self.model.Add(var_total == var_weight * cost)
+        self.model.Add(var_total == var_weight)
 
     def create_variable_assignment(self, task: Task, artist: Artist) -> IntVar:
         """Create a boolean variable defining a possible task to artist assignment.
@@ -301,14 +382,51 @@ class Solver(_Solver):
         return self.get_variable_bool(name)
 
 
-def _timedelta_to_unit(delta: datetime.timedelta) -> int:
-    """Convert a datetime timedelta objects to internal units.
-    The smallest unit of time we handle is minutes.
+def set_parameters(parameters: SatParameters, values: Dict[str, Any]):
+    """Set solver parameters by name.
 
-    :param delta: A timedelta object
-    :return: An amount of minutes
+    :param parameters: The parameters to modify, ie: CpSolver.parameters
+    :param values: Values by parameter name, enum values can be set by name.
+    :raises ValueError: If a parameter don't exist or a value is invalid.
+    """
+    fields = parameters.DESCRIPTOR.fields_by_name
+    for name, value in values.items():
+        try:
+            field = fields[name]
+            if field.enum_type is not None and isinstance(value, str):
+                value = field.enum_type.values_by_name[value].number
+            setattr(parameters, name, value)
+        except (KeyError, TypeError, ValueError) as error:
+            raise ValueError(
+                f"Invalid solver parameter {name}={value!r}: {error}"
+            ) from error
+
+
+def get_costs(context: Context) -> List[int]:
+    """Get the cost of each weighted variable of a context model.
+
+    They are in the same order as the variables created by Solver,
+    the model don't need to be rebuilt when only the costs change.
+
+    :param context: A context
+    :return: A cost for each weighted variable
     """
-    return int(delta.total_seconds() / 60)
+    settings = context.settings
+    costs = [
+        weight * settings.weight_tags
+        for preferences in context.get_columns().preferences
+        for weight in preferences.values()
+    ]
+    costs.extend(group.weight * settings.weight_tags for group in context.combinations)
+    costs.extend(
+        itertools.repeat(-settings.weight_equal_hours_by_artists, len(context.artists))
+    )
+    costs.extend(
+        itertools.repeat(
+            -settings.weight_equal_tasks_count_by_artists, len(context.artists)
+        )
+    )
+    return costs
 
 
 def _create_distance(model, domain, prefix, value1, value2):
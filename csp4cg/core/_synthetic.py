@@ -0,0 +1,138 @@
+"""Generate synthetic sessions to reproduce scaling issues and benchmark.
+
+The default distributions are fitted on examples/tasks.yml
+so scaling the number of tasks gives a production that look like the example.
+"""
+import datetime
+import itertools
+import math
+import random
+from typing import List, Optional, Sequence
+
+from ._types import Artist, Assignment, Context, Task, TaskGroup
+
+# Size of examples/tasks.yml
+EXAMPLE_NUM_TASKS = 61
+EXAMPLE_NUM_ARTISTS = 7
+
+# Task durations, in hours, follow a log-normal distribution.
+# The example median is 4.5 hours, from 1 hour to 16 hours.
+_DURATION_MU = math.log(4.5)
+_DURATION_SIGMA = 0.6
+_DURATION_STEP = 0.5  # Durations are rounded to half hours
+
+# Weighted choices, as (values, weights)
+_AVAILABILITIES = ((100, 75, 50), (70, 20, 10))
+_NUM_TAGS_BY_TASK = ((0, 1, 2), (50, 35, 15))
+_NUM_TAGS_BY_ARTIST = ((0, 1, 2, 3), (40, 30, 20, 10))
+_TAG_WEIGHTS = (5, 10, 15)
+_GROUP_SIZES = (2, 3, 4, 5)
+_GROUP_WEIGHTS = (10, 15, 20, 25)
+
+_TASKS_BY_SEQUENCE = 25  # Average number of tasks in a sequence
+_TASKS_BY_TAG = 15  # Average number of tasks for each tag in the vocabulary
+
+
+def generate_context(  # pylint: disable=too-many-arguments,too-many-locals
+    num_tasks: int = EXAMPLE_NUM_TASKS,
+    num_artists: Optional[int] = None,
+    num_tags: Optional[int] = None,
+    num_sequences: Optional[int] = None,
+    locked_ratio: float = 0.05,
+    group_ratio: float = 0.15,
+    zipf_exponent: float = 1.1,
+    seed: int = 0,
+) -> Context:
+    """Generate a synthetic production.
+
+    :param num_tasks: Number of tasks
+    :param num_artists: Number of artists. Default to the same ratio as the example.
+    :param num_tags: Size of the tag vocabulary. Default grow with the number of tasks.
+    :param num_sequences: Number of sequences. Default to ~25 tasks by sequence.
+    :param locked_ratio: Fraction of the tasks that are locked to an artist
+    :param group_ratio: Probability for each task to start a task group
+    :param zipf_exponent: How much popular tags are more used than rare ones
+    :param seed: Random seed, the same arguments always generate the same context.
+    :return: A context
+    """
+    if num_tasks < 1:
+        raise ValueError(f"Expected at least one task, got {num_tasks}")
+    rng = random.Random(seed)
+    if num_artists is None:
+        num_artists = round(num_tasks * EXAMPLE_NUM_ARTISTS / EXAMPLE_NUM_TASKS)
+    num_artists = max(1, num_artists)
+    num_tags = max(1, num_tags or num_tasks // _TASKS_BY_TAG)
+    num_sequences = max(
+        1, min(num_tasks, num_sequences or num_tasks // _TASKS_BY_SEQUENCE)
+    )
+
+    # Tag popularity follow Zipf's law, the nth tag is used ~1/n^s as much as the first.
+    vocabulary = [f"tag{index}" for index in range(num_tags)]
+    popularity = list(
+        itertools.accumulate(1 / rank**zipf_exponent for rank in range(1, num_tags + 1))
+    )
+
+    def _get_tags(counts) -> List[str]:
+        num = rng.choices(*counts)[0]
+        tag_ids = set(rng.choices(range(num_tags), cum_weights=popularity, k=num))
+        return [vocabulary[tag_id] for tag_id in sorted(tag_ids)]
+
+    artists = [
+        Artist(
+            f"artist{index}",
+            availability=rng.choices(*_AVAILABILITIES)[0],
+            tags={
+                tag: rng.choice(_TAG_WEIGHTS) for tag in _get_tags(_NUM_TAGS_BY_ARTIST)
+            },
+        )
+        for index in range(num_artists)
+    ]
+
+    # Tasks are split in contiguous sequences, shots are numbered by 10 like the example
+    sequences = [[] for _ in range(num_sequences)]  # type: List[List[Task]]
+    tasks = []
+    for index in range(num_tasks):
+        sequence_index = index * num_sequences // num_tasks
+        sequence = sequences[sequence_index]
+        hours = rng.lognormvariate(_DURATION_MU, _DURATION_SIGMA)
+        hours = max(_DURATION_STEP, round(hours / _DURATION_STEP) * _DURATION_STEP)
+        name = f"sq{sequence_index + 1:03d}_{(len(sequence) + 1) * 10:04d}"
+        duration = datetime.timedelta(hours=hours)
+        task = Task(name, duration, tags=_get_tags(_NUM_TAGS_BY_TASK))
+        sequence.append(task)
+        tasks.append(task)
+
+    combinations = [
+        group
+        for sequence in sequences
+        for group in _iter_groups(rng, sequence, group_ratio)
+    ]
+    assignments = [
+        Assignment(rng.choice(artists), task)
+        for task in rng.sample(tasks, round(num_tasks * locked_ratio))
+    ]
+    return Context(
+        artists=artists,
+        tasks=tasks,
+        assignments=assignments,
+        combinations=combinations,
+    )
+
+
+def _iter_groups(rng: random.Random, tasks: Sequence[Task], ratio: float):
+    """Group consecutive tasks of a sequence, groups never overlap.
+
+    :param rng: Random number generator
+    :param tasks: Tasks of a sequence
+    :param ratio: Probability for each task to start a group
+    """
+    index = 0
+    while index < len(tasks) - 1:
+        if rng.random() < ratio:
+            size = rng.choice(_GROUP_SIZES)
+            yield TaskGroup(
+                list(tasks[index : index + size]), rng.choice(_GROUP_WEIGHTS)
+            )
+            index += size
+        else:
+            index += 1
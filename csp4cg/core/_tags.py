@@ -0,0 +1,73 @@
+"""Intern tags to integer ids so they can be compared as numbers."""
+from typing import Dict, Iterable, List, Optional
+
+
+class TagRegistry:
+    """Map tags to consecutive integer ids.
+
+    A set of tags can be represented as a bitset (a python int)
+    where the bit of each tag id is set.
+    Matching sets of tags is then a single bitwise and.
+    """
+
+    def __init__(self, tags: Iterable[str] = ()):
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        for tag in tags:
+            self.intern(tag)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, tag: str) -> bool:
+        return tag in self._ids
+
+    def intern(self, tag: str) -> int:
+        """Get the id of a tag, registering it if needed.
+
+        :param tag: A tag
+        :return: The tag id
+        """
+        try:
+            return self._ids[tag]
+        except KeyError:
+            tag_id = self._ids[tag] = len(self._names)
+            self._names.append(tag)
+            return tag_id
+
+    def get_id(self, tag: str) -> Optional[int]:
+        """Get the id of a tag without registering it.
+
+        :param tag: A tag
+        :return: The tag id or None if the tag is unknown
+        """
+        return self._ids.get(tag)
+
+    def get_name(self, tag_id: int) -> str:
+        """Get the tag from its id.
+
+        :param tag_id: A tag id
+        :return: A tag
+        """
+        return self._names[tag_id]
+
+    def to_mask(self, tags: Iterable[str]) -> int:
+        """Convert tags to a bitset. Unknown tags are ignored.
+
+        :param tags: Tags
+        :return: A bitset
+        """
+        mask = 0
+        for tag in tags:
+            tag_id = self._ids.get(tag)
+            if tag_id is not None:
+                mask |= 1 << tag_id
+        return mask
+
+    def from_mask(self, mask: int) -> List[str]:
+        """Convert a bitset to tags.
+
+        :param mask: A bitset
+        :return: Tags, in id order
+        """
+        return [name for tag_id, name in enumerate(self._names) if mask >> tag_id & 1]
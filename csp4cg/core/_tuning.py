@@ -0,0 +1,229 @@
+"""Tune the solver parameters on a corpus of sessions.
+
+Each parameter set of a grid solve each session with the same time budget.
+Objectives are not comparable between sessions so the parameter sets are
+ranked on each session, at multiple times of the solve, and the ranks averaged.
+A parameter set that find good solutions early rank better than one that
+only catch up at the end.
+"""
+import dataclasses
+import itertools
+import logging
+import multiprocessing
+import os
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from ._io import import_context
+from ._report import SolveReport
+from ._solver import Solver
+
+_LOG = logging.getLogger(__name__)
+
+# Parameter values to try, by parameter name. See ortools sat_parameters.proto.
+DEFAULT_GRID = {
+    "linearization_level": [1, 2],
+    "search_branching": ["AUTOMATIC_SEARCH", "PORTFOLIO_WITH_QUICK_RESTART_SEARCH"],
+    "min_num_lns_workers": [2, 4],
+}  # type: Dict[str, List[Any]]
+
+_SESSION_EXTENSIONS = (".yml", ".yaml", ".json", ".json.gz")
+_REPORT_SUFFIX = ".report.json"
+
+# Session index, parameter set index and the solve report
+_Run = Tuple[int, int, SolveReport]
+
+
+@dataclasses.dataclass
+class TuningResult:
+    """How well a parameter set did on all sessions."""
+
+    parameters: Dict[str, Any]
+    rank: float  # average rank, 1 is the best
+    # Objective reached at each time mark, by session path. None if no solution.
+    objectives: Dict[str, List[Optional[float]]]
+
+
+def check_grid(grid: Mapping[str, Sequence[Any]]):
+    """Ensure a parameter grid has at least one parameter set.
+
+    :param grid: Values to try, by parameter name
+    :raises ValueError: If the grid has no parameter or a parameter has no value
+    """
+    if not grid:
+        raise ValueError("The parameter grid is empty")
+    for name, values in grid.items():
+        if not values:
+            raise ValueError(f"The parameter grid has no value for {name}")
+
+
+def iter_parameter_sets(grid: Mapping[str, Sequence[Any]]) -> Iterable[Dict[str, Any]]:
+    """Yield all the combinations of a parameter grid.
+
+    :param grid: Values to try, by parameter name
+    :return: A generator of parameter values by name
+    """
+    names = sorted(grid)
+    for values in itertools.product(*(grid[name] for name in names)):
+        yield dict(zip(names, values))
+
+
+def find_sessions(paths: Iterable[str]) -> List[str]:
+    """Find the session files in files or directories.
+
+    :param paths: Session files or directories containing session files
+    :return: Session files, sorted
+    """
+    found = []
+    for path in paths:
+        if not os.path.isdir(path):
+            found.append(path)
+            continue
+        found.extend(
+            os.path.join(path, name)
+            for name in os.listdir(path)
+            if name.endswith(_SESSION_EXTENSIONS) and not name.endswith(_REPORT_SUFFIX)
+        )
+    return sorted(found)
+
+
+def get_objective_at(report: SolveReport, time: float) -> Optional[float]:
+    """Get the best objective found at a time of a solve.
+
+    :param report: A solve report
+    :param time: Seconds since the start of the solve
+    :return: An objective, None if no solution was found at that time.
+    """
+    objective = None
+    for solution in report.solutions:
+        if solution.time > time:
+            break
+        objective = solution.objective
+    return objective
+
+
+def rank(objectives: Sequence[Sequence[Optional[float]]]) -> List[float]:
+    """Rank parameter sets by their objectives, the model is maximized.
+
+    Equal objectives share the same rank, no objective rank last.
+
+    :param objectives: For each parameter set, objectives to compare
+      with the objectives of the other sets at the same position.
+    :return: The average rank of each parameter set, 1 is the best.
+    """
+    num_sets = len(objectives)
+    totals = [0.0] * num_sets
+    num_comparisons = len(objectives[0]) if objectives else 0
+    for column in range(num_comparisons):
+        column_values = (row[column] for row in objectives)
+        values = [float("-inf") if value is None else value for value in column_values]
+        for index, value in enumerate(values):
+            totals[index] += 1 + sum(other > value for other in values)
+    return [total / max(1, num_comparisons) for total in totals]
+
+
+def tune(  # pylint: disable=too-many-arguments,too-many-locals
+    paths: Sequence[str],
+    grid: Optional[Mapping[str, Sequence[Any]]] = None,
+    time_limit: float = 30.0,
+    marks: Optional[Sequence[float]] = None,
+    workers: int = 8,
+    jobs: int = 1,
+    callback: Optional[Callable[[str, Dict[str, Any], SolveReport], None]] = None,
+) -> List[TuningResult]:
+    """Solve sessions with each parameter set of a grid and rank them.
+
+    :param paths: Session files
+    :param grid: Values to try by parameter name, default to DEFAULT_GRID
+    :param time_limit: Solve time of each session with each parameter set, in seconds
+    :param marks: Times at which the objectives are compared, default to
+      a quarter, half and all of the time limit.
+    :param workers: Search workers of each solve, unless part of the grid
+    :param jobs: Number of solves to run at the same time.
+      Each solve use its own workers, don't use more jobs than cpus / workers.
+    :param callback: Function called with the session, parameters
+      and report after each solve.
+    :return: The parameter sets, best first
+    :raises ValueError: If the grid is empty, see check_grid
+    """
+    grid = grid if grid is not None else DEFAULT_GRID
+    check_grid(grid)
+    parameter_sets = list(iter_parameter_sets(grid))
+    marks = sorted(marks or (time_limit / 4, time_limit / 2, time_limit))
+    runs = [
+        (session_index, set_index, path, parameters, time_limit, workers)
+        for session_index, path in enumerate(paths)
+        for set_index, parameters in enumerate(parameter_sets)
+    ]
+
+    reports = {}  # type: Dict[Tuple[int, int], SolveReport]
+    # Solves run in child processes so a parameter set can't slow down the next one.
+    with multiprocessing.get_context("spawn").Pool(jobs) as pool:
+        for session_index, set_index, report in pool.imap_unordered(_run, runs):
+            reports[session_index, set_index] = report
+            if callback:
+                callback(paths[session_index], parameter_sets[set_index], report)
+
+    objectives = [
+        {
+            path: [
+                get_objective_at(reports[session_index, set_index], mark)
+                for mark in marks
+            ]
+            for session_index, path in enumerate(paths)
+        }
+        for set_index in range(len(parameter_sets))
+    ]
+    ranks = rank(
+        [
+            [value for values in by_session.values() for value in values]
+            for by_session in objectives
+        ]
+    )
+    results = [
+        TuningResult(parameters, set_rank, by_session)
+        for parameters, set_rank, by_session in zip(parameter_sets, ranks, objectives)
+    ]
+    results.sort(key=lambda result: result.rank)  # stable, the grid order break ties
+    return results
+
+
+def _run(args: Tuple[int, int, str, Dict[str, Any], float, int]) -> _Run:
+    """Solve a session with a parameter set, called in a child process.
+
+    A solve that crash rank last instead of stopping the other solves.
+    """
+    session_index, set_index, path, parameters, time_limit, workers = args
+    try:
+        report = _solve(path, parameters, time_limit, workers)
+    except Exception:  # pylint: disable=broad-except
+        _LOG.exception("Cannot solve %s with %s", path, parameters)
+        report = SolveReport(status="ERROR")
+    return session_index, set_index, report
+
+
+def _solve(
+    path: str, parameters: Dict[str, Any], time_limit: float, workers: int
+) -> SolveReport:
+    """Solve a session with a parameter set."""
+    context = import_context(path)
+    context.settings.solver_parameters = parameters
+    solver = Solver(context)
+    solver.printer = None
+    solver.solver.parameters.max_time_in_seconds = time_limit
+    if "num_search_workers" not in parameters:
+        solver.solver.parameters.num_search_workers = workers
+    try:
+        solver.solve()
+    except RuntimeError:  # no solution, the parameter set rank last
+        pass
+    return solver.report
@@ -1,11 +1,45 @@
 """Internal types"""
+import dataclasses
 import datetime
 import functools
 from dataclasses import dataclass, field
-from typing import Dict, List, Literal, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from ._events import Change, ChangeKind, Listener
+
+if TYPE_CHECKING:
+    from ._columns import ContextColumns
+
+
+def _slotted(cls):
+    """Re-create a dataclass with __slots__ instead of a per-instance __dict__.
+
+    Equivalent to dataclass(slots=True) which is only available in python-3.10.
+    """
+    names = tuple(field_.name for field_ in dataclasses.fields(cls))
+    namespace = dict(cls.__dict__)
+    for name in names:
+        namespace.pop(name, None)  # default values are already bound to __init__
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
 
 
 @functools.total_ordering
+@_slotted
 @dataclass
 class Artist:
     """A human artists that we can assign tasks to."""
@@ -25,6 +59,7 @@ class Artist:
 
 
 @functools.total_ordering
+@_slotted
 @dataclass
 class Task:
     """A task that can be performed by an artist."""
@@ -54,6 +89,7 @@ class Task:
 
 
 @functools.total_ordering
+@_slotted
 @dataclass
 class Assignment:
     """An artist assignment to a task."""
@@ -62,12 +98,48 @@ class Assignment:
     task: Task
 
     def __hash__(self):
-        return hash((self.artist, self.task))
+        # Same as hash((self.artist, self.task)) without the extra method calls,
+        # str objects cache their own hash.
+        return hash((self.artist.name, self.task.name))
 
     def __lt__(self, other):
         return other and self.task < other.task
 
 
+class AssignmentPool:
+    """Share a single Assignment instance for each artist and task pair.
+
+    Solutions only differ by a few assignments,
+    pooling them avoid re-creating the same objects for each solution.
+
+    :param artists: The artists to assign
+    :param tasks: The tasks to assign
+    """
+
+    def __init__(self, artists: Sequence[Artist], tasks: Sequence[Task]):
+        self.artists = artists
+        self.tasks = tasks
+        self._assignments = {}  # type: Dict[Tuple[int, int], Assignment]
+
+    def get(self, artist_index: int, task_index: int) -> Assignment:
+        """Get the assignment of a task to an artist.
+
+        :param artist_index: An index in the pool artists
+        :param task_index: An index in the pool tasks
+        :return: An assignment
+        """
+        key = (artist_index, task_index)
+        try:
+            return self._assignments[key]
+        except KeyError:
+            assignment = Assignment(self.artists[artist_index], self.tasks[task_index])
+            self._assignments[key] = assignment
+            return assignment
+
+    def __len__(self) -> int:
+        return len(self._assignments)
+
+
 @dataclass
 class TaskGroup:
     """A sequence of tasks we'd like to have assigned to the same artist."""
@@ -86,58 +158,608 @@ class Settings:
     weight_tags: Literal[100] = 100
     weight_equal_hours_by_artists: Literal[10] = 10
     weight_equal_tasks_count_by_artists: Literal[10] = 10
+    # CP-SAT parameters by name, ie: {"linearization_level": 2}. See csp4cg tune.
+    solver_parameters: Dict[str, Any] = field(default_factory=dict)
+
+
+class Context:  # pylint: disable=too-many-instance-attributes
+    """Hold the data to solve
+
+    Locks (hard assignments) and the solution are stored by task name
+    so that looking up, adding or removing the assignments of a task
+    doesn't require going through all of them.
+    The task groups of each task are indexed on first use.
+
+    Modifications made through the context methods are reported
+    to the listeners registered with subscribe.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        artists: Optional[List[Artist]] = None,
+        tasks: Optional[List[Task]] = None,
+        assignments: Optional[Iterable[Assignment]] = None,
+        settings: Optional[Settings] = None,
+        combinations: Optional[List[TaskGroup]] = None,
+        solution: Optional[Iterable[Assignment]] = None,
+    ):
+        self.artists = [] if artists is None else artists  # type: List[Artist]
+        self.tasks = [] if tasks is None else tasks  # type: List[Task]
+        self.settings = settings or Settings()
+        self.combinations = (
+            [] if combinations is None else combinations
+        )  # type: List[TaskGroup]
+        self._locks = _AssignmentIndex(assignments or ())
+        self._solution = _AssignmentIndex(solution or ())
+        self._groups = None  # type: Optional[Dict[str, List[TaskGroup]]]
+        self._groups_key = (0, 0)  # identity and size of the indexed groups list
+        self._columns = None  # type: Optional[ContextColumns]
+        self._listeners = []  # type: List[Listener]
+        # Indexes by name, used to report changes and look up by name
+        self._artist_positions = None  # type: Optional[Dict[str, int]]
+        self._task_positions = None  # type: Optional[Dict[str, int]]
+        # Incremented on each change, a snapshot is reused until the next change.
+        self._version = 0
+        self._snapshot = None  # type: Optional[Context]
+        self._snapshot_version = -1
+
+    @property
+    def assignments(self) -> Tuple[Assignment, ...]:
+        """The "hard" assignments, grouped by task.
+
+        The tuple can't be modified in place,
+        use assign, unassign and set_locks or set new assignments.
+        """
+        return self._locks.to_tuple()
+
+    @assignments.setter
+    def assignments(self, assignments: Iterable[Assignment]):
+        old = self._locks
+        self._locks = _AssignmentIndex(assignments)
+        self._columns = None  # the locks are part of the columns
+        self._report_assignments(old, self._locks, ChangeKind.LOCK_CHANGED)
+
+    @property
+    def solution(self) -> Tuple[Assignment, ...]:
+        """The assignments found by the solver, grouped by task.
+
+        The tuple can't be modified in place, set new assignments instead.
+        """
+        return self._solution.to_tuple()
+
+    @solution.setter
+    def solution(self, assignments: Iterable[Assignment]):
+        old = self._solution
+        self._solution = _AssignmentIndex(assignments)
+        self._report_assignments(old, self._solution, ChangeKind.SOLUTION_CHANGED)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.artists == other.artists
+            and self.tasks == other.tasks
+            and sorted(self.assignments) == sorted(other.assignments)
+            and self.settings == other.settings
+            and self.combinations == other.combinations
+            and sorted(self.solution) == sorted(other.solution)
+        )
 
-
-@dataclass()
-class Context:
-    """Hold the data to solve"""
-
-    artists: List[Artist] = field(default_factory=list)
-    tasks: List[Task] = field(default_factory=list)
-    assignments: List[Assignment] = field(default_factory=list)
-    settings: Settings = field(default_factory=Settings)
-    combinations: List[TaskGroup] = field(default_factory=list)
-    solution: List[Assignment] = field(default_factory=list)
+    def __repr__(self):
+        return (
+            f"Context(artists={self.artists!r}, tasks={self.tasks!r}, "
+            f"assignments={self.assignments!r}, settings={self.settings!r}, "
+            f"combinations={self.combinations!r}, solution={self.solution!r})"
+        )
+
+    def __getstate__(self):
+        # Don't send cached data and listeners to other processes
+        state = self.__dict__.copy()
+        state.update(
+            _groups=None,
+            _groups_key=(0, 0),
+            _columns=None,
+            _listeners=[],
+            _artist_positions=None,
+            _task_positions=None,
+            _snapshot=None,
+            _snapshot_version=-1,
+        )
+        return state
+
+    def subscribe(self, listener: Listener):
+        """Call a function each time the context is modified.
+
+        :param listener: A function that receive a Change object
+        """
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Listener):
+        """Stop calling a function each time the context is modified.
+
+        :param listener: A previously subscribed function
+        """
+        self._listeners.remove(listener)
+
+    def get_columns(self) -> "ContextColumns":
+        """Get a numeric, column oriented view of the context.
+        The view is cached until the context is invalidated.
+        """
+        if self._columns is None:
+            # pylint: disable=import-outside-toplevel
+            from ._columns import ContextColumns
+
+            self._columns = ContextColumns.from_context(self)
+        return self._columns
+
+    def snapshot(self) -> "Context":
+        """Get a copy of the data to solve that later changes don't affect.
+
+        Artists, tasks and task groups are copied but share their tags
+        and names as they are only replaced, never modified in place.
+        The snapshot is reused until the next change so solving an unchanged
+        context again don't copy anything. The solution is not part of the snapshot.
+
+        The snapshot is shared and must not be modified.
+        """
+        snapshot = self._snapshot
+        if (
+            snapshot is None
+            or self._snapshot_version != self._version
+            or snapshot.settings != self.settings  # settings are modified directly
+        ):
+            artists = {
+                id(artist): Artist(artist.name, artist.availability, artist.tags)
+                for artist in self.artists
+            }
+            tasks = {
+                id(task): Task(task.name, task.duration, task.tags)
+                for task in self.tasks
+            }
+            snapshot = self._snapshot = Context(
+                artists=list(artists.values()),
+                tasks=list(tasks.values()),
+                assignments=[
+                    Assignment(
+                        artists.get(id(assignment.artist), assignment.artist),
+                        tasks.get(id(assignment.task), assignment.task),
+                    )
+                    for assignment in self.assignments
+                ],
+                settings=dataclasses.replace(
+                    self.settings,
+                    solver_parameters=dict(self.settings.solver_parameters),
+                ),
+                combinations=[
+                    TaskGroup(
+                        [tasks.get(id(task), task) for task in group.tasks],
+                        group.weight,
+                    )
+                    for group in self.combinations
+                ],
+            )
+            self._snapshot_version = self._version
+        return snapshot
+
+    def invalidate(self):
+        """Discard cached data derived from the context.
+        Need to be called when artists, tasks or task groups are modified in place.
+        """
+        self._version += 1
+        self._columns = None
+        self._groups = None
+        self._artist_positions = None
+        self._task_positions = None
+
+    def get_locks(self, task: Task) -> List[Assignment]:
+        """Get the "hard" assignments of a task."""
+        return list(self._locks.get(task.name))
+
+    def get_solution(self, task: Task) -> List[Assignment]:
+        """Get the assignments of a task in the solution."""
+        return list(self._solution.get(task.name))
+
+    def get_assignment(self, task: Task) -> Optional[Assignment]:
+        """Get the assignment of a task in the solution, if any."""
+        assignments = self._solution.get(task.name)
+        return assignments[-1] if assignments else None
+
+    def get_groups(self, task: Task) -> List[TaskGroup]:
+        """Get the task groups a task is part of."""
+        return list(self._get_groups_index().get(task.name, ()))
+
+    def get_artist(self, name: str) -> Artist:
+        """Get an artist by name.
+
+        :raises KeyError: If there is no artist with this name
+        """
+        return self.artists[self._get_artist_positions()[name]]
+
+    def get_task(self, name: str) -> Task:
+        """Get a task by name.
+
+        :raises KeyError: If there is no task with this name
+        """
+        return self.tasks[self._get_task_positions()[name]]
+
+    def add_artist(self, artist: Artist, index: Optional[int] = None):
+        """Add an artist to the context.
+
+        :param artist: The artist to add
+        :param index: Where to insert the artist, default to the end.
+        """
+        if index is None or index >= len(self.artists):
+            self.artists.append(artist)
+            index = len(self.artists) - 1
+            if self._artist_positions is not None:
+                self._artist_positions[artist.name] = index
+        else:
+            self.artists.insert(index, artist)
+            self._artist_positions = None
+        self._columns = None
+        self._emit(ChangeKind.ARTIST_ADDED, artist, index)
+
+    def add_task(self, task: Task, index: Optional[int] = None):
+        """Add a task to the context.
+
+        :param task: The task to add
+        :param index: Where to insert the task, default to the end.
+        """
+        if index is None or index >= len(self.tasks):
+            self.tasks.append(task)
+            index = len(self.tasks) - 1
+            if self._task_positions is not None:
+                self._task_positions[task.name] = index
+        else:
+            self.tasks.insert(index, task)
+            self._task_positions = None
+        self._columns = None
+        self._emit(ChangeKind.TASK_ADDED, task, index)
+
+    def add_group(self, group: TaskGroup, index: Optional[int] = None):
+        """Add a task group to the context.
+
+        :param group: The task group to add
+        :param index: Where to insert the task group, default to the end.
+        """
+        if index is None or index >= len(self.combinations):
+            index = len(self.combinations)
+        self.combinations.insert(index, group)
+        self.invalidate()
+        self._emit(ChangeKind.GROUP_ADDED, group, index)
+
+    def update_artist(self, artist: Artist, **values: Any) -> bool:
+        """Modify an artist attributes.
+
+        :param artist: The artist to modify
+        :param values: New values by attribute name
+        :return: Was the artist modified?
+        """
+        old_name = artist.name
+        fields = _set_values(artist, values)
+        if not fields:
+            return False
+        if "name" in fields:
+            _rename(self._artist_positions, old_name, artist.name)
+        self._columns = None
+        self._emit(ChangeKind.ARTIST_CHANGED, artist, self._artist_index, fields)
+        return True
+
+    def update_task(self, task: Task, **values: Any) -> bool:
+        """Modify a task attributes.
+
+        :param task: The task to modify
+        :param values: New values by attribute name
+        :return: Was the task modified?
+        """
+        old_name = task.name
+        fields = _set_values(task, values)
+        if not fields:
+            return False
+        if "name" in fields:
+            self._locks.rename(old_name, task.name)
+            self._solution.rename(old_name, task.name)
+            _rename(self._task_positions, old_name, task.name)
+            self._groups = None
+        self._columns = None
+        self._emit(ChangeKind.TASK_CHANGED, task, self._task_index, fields)
+        return True
+
+    def update_group(self, group: TaskGroup, **values: Any) -> bool:
+        """Modify a task group attributes.
+
+        :param group: The task group to modify
+        :param values: New values by attribute name
+        :return: Was the task group modified?
+        """
+        fields = _set_values(group, values)
+        if not fields:
+            return False
+        if "tasks" in fields:
+            self.invalidate()
+        self._emit(ChangeKind.GROUP_CHANGED, group, self._group_index, fields)
+        return True
 
     def assign(self, task: Task, artist: Artist):
         """Define a "hard" assignment."""
-        self.unassign(task)
-        self.assignments.append(Assignment(artist, task))
+        self.set_locks(task, [artist])
 
     def unassign(self, task: Task):
         """Remove a "hard" assignment."""
-        self.assignments = [
-            assignment for assignment in self.assignments if assignment.task != task
-        ]
+        self.set_locks(task, ())
+
+    def set_locks(self, task: Task, artists: Iterable[Artist]):
+        """Replace the "hard" assignments of a task.
+
+        :param task: The task to lock
+        :param artists: The artists the task is locked to, none to unlock it.
+        """
+        modified = self._locks.discard(task.name)
+        artist = None
+        for artist in artists:
+            self._locks.add(Assignment(artist, task))
+            modified = True
+        if not modified:
+            return
+        if self._columns is not None:
+            self._set_locked_artist(self._columns, task, artist)
+        self._emit(ChangeKind.LOCK_CHANGED, task, self._task_index)
 
     def remove_artist(self, artist: Artist):
         """Remove an artist from the context."""
-        self.artists.remove(artist)
-        self.assignments = [
-            assignment for assignment in self.assignments if assignment.artist != artist
+        self.remove_artists([artist])
+
+    def remove_artists(self, artists: Iterable[Artist]):
+        """Remove multiple artists from the context at once.
+
+        Removal events are emitted from the last to the first artist.
+        """
+        names = {artist.name for artist in artists}
+        removed = [
+            (index, artist)
+            for index, artist in enumerate(self.artists)
+            if artist.name in names
         ]
-        self.solution = [
-            assignment for assignment in self.solution if assignment.artist != artist
+        self.invalidate()
+        self.artists[:] = [
+            artist for artist in self.artists if artist.name not in names
         ]
+        self._locks.discard_artists(names)
+        self._solution.discard_artists(names)
+        for index, artist in reversed(removed):
+            self._emit(ChangeKind.ARTIST_REMOVED, artist, index)
 
     def remove_task(self, task: Task):
         """Remove a task from the context."""
-        self.tasks.remove(task)
-        self.assignments = [
-            assignment for assignment in self.assignments if assignment.task != task
+        self.remove_tasks([task])
+
+    def remove_tasks(self, tasks: Iterable[Task]):
+        """Remove multiple tasks from the context at once.
+
+        Task groups left empty are removed too. Task group events are emitted
+        first, then removal events from the last to the first task.
+        """
+        names = {task.name for task in tasks}
+        removed = [
+            (index, task) for index, task in enumerate(self.tasks) if task.name in names
         ]
-        self.solution = [
-            assignment for assignment in self.solution if assignment.task != task
+        groups = self._get_groups_index()
+        self.invalidate()
+        self.tasks[:] = [task for task in self.tasks if task.name not in names]
+
+        changed = {}  # type: Dict[int, TaskGroup]
+        for _, task in removed:
+            self._locks.discard(task.name)
+            self._solution.discard(task.name)
+            for group in groups.get(task.name, ()):
+                group.tasks[:] = [
+                    item for item in group.tasks if item.name != task.name
+                ]
+                changed[id(group)] = group
+        emptied = {key for key, group in changed.items() if not group.tasks}
+        if emptied:
+            self.remove_groups([changed[key] for key in emptied])
+
+        for key, group in changed.items():
+            if key not in emptied:
+                self._emit(
+                    ChangeKind.GROUP_CHANGED, group, self._group_index, ("tasks",)
+                )
+        for index, task in reversed(removed):
+            self._emit(ChangeKind.TASK_REMOVED, task, index)
+
+    def remove_groups(self, groups: Iterable[TaskGroup]):
+        """Remove multiple task groups from the context at once.
+
+        Removal events are emitted from the last to the first group.
+        """
+        ids = {id(group) for group in groups}
+        removed = [
+            (index, group)
+            for index, group in enumerate(self.combinations)
+            if id(group) in ids
         ]
-
-        new_combinations = []
-        for combination in self.combinations:
-            try:
-                combination.tasks.remove(task)
-            except ValueError:
-                pass
+        self.invalidate()
+        self.combinations[:] = [
+            group for group in self.combinations if id(group) not in ids
+        ]
+        for index, group in reversed(removed):
+            self._emit(ChangeKind.GROUP_REMOVED, group, index)
+
+    def _emit(self, kind: ChangeKind, item: Any, index: Any, fields=()):
+        """Notify listeners of a change.
+
+        :param index: The item index, or a function that return it.
+          The index is only looked up if someone is listening.
+        """
+        if kind is not ChangeKind.SOLUTION_CHANGED:  # not part of the snapshot
+            self._version += 1
+        if not self._listeners:
+            return
+        if callable(index):
+            index = index(item)
+        change = Change(kind, item, index, tuple(fields))
+        for listener in list(self._listeners):
+            listener(change)
+
+    def _report_assignments(
+        self, old: "_AssignmentIndex", new: "_AssignmentIndex", kind: ChangeKind
+    ):
+        """Notify listeners of the tasks which assignments were replaced."""
+        if not self._listeners:
+            if kind is not ChangeKind.SOLUTION_CHANGED:
+                self._version += 1
+            return
+        for task in old.get_changed_tasks(new):
+            self._emit(kind, task, self._task_index)
+
+    def _artist_index(self, artist: Artist) -> int:
+        return self._get_artist_positions().get(artist.name, -1)
+
+    def _task_index(self, task: Task) -> int:
+        return self._get_task_positions().get(task.name, -1)
+
+    def _get_artist_positions(self) -> Dict[str, int]:
+        if self._artist_positions is None:
+            self._artist_positions = {
+                item.name: index for index, item in enumerate(self.artists)
+            }
+        return self._artist_positions
+
+    def _get_task_positions(self) -> Dict[str, int]:
+        if self._task_positions is None:
+            self._task_positions = {
+                item.name: index for index, item in enumerate(self.tasks)
+            }
+        return self._task_positions
+
+    def _group_index(self, group: TaskGroup) -> int:
+        return next(
+            (index for index, item in enumerate(self.combinations) if item is group),
+            -1,
+        )
+
+    def _set_locked_artist(
+        self, columns: "ContextColumns", task: Task, artist: Optional[Artist]
+    ):
+        """Update the cached columns after a task was locked or unlocked."""
+        task_index = columns.task_indexes.get(task.name)
+        if task_index is None:
+            return
+        artist_index = -1 if artist is None else columns.artist_indexes.get(artist.name)
+        if artist_index is None:  # unknown artist, don't try to be smart
+            self._columns = None
+            return
+        columns.locks[task_index] = artist_index
+
+    def _get_groups_index(self) -> Dict[str, List[TaskGroup]]:
+        """Index the task groups by task name.
+
+        Appending or removing groups in place is detected,
+        modifying a group tasks need a call to invalidate.
+        """
+        key = (id(self.combinations), len(self.combinations))
+        if self._groups is None or self._groups_key != key:
+            self._groups = {}
+            for group in self.combinations:
+                for task in group.tasks:
+                    self._groups.setdefault(task.name, []).append(group)
+            self._groups_key = key
+        return self._groups
+
+
+class _AssignmentIndex:
+    """Assignments grouped by task name, in insertion order.
+
+    A task usually has a single assignment but nothing prevent the user
+    from locking a task to multiple artists.
+    """
+
+    def __init__(self, assignments: Iterable[Assignment]):
+        self._by_task = {}  # type: Dict[str, List[Assignment]]
+        self._tuple = None  # type: Optional[Tuple[Assignment, ...]]
+        for assignment in assignments:
+            self.add(assignment)
+
+    def to_tuple(self) -> Tuple[Assignment, ...]:
+        """Get all assignments, the result is cached until the next change."""
+        if self._tuple is None:
+            self._tuple = tuple(
+                assignment
+                for assignments in self._by_task.values()
+                for assignment in assignments
+            )
+        return self._tuple
+
+    def get_changed_tasks(self, other: "_AssignmentIndex") -> List[Task]:
+        """Get the tasks which assignments differ in another index."""
+        changed = [
+            assignments[0].task
+            for name, assignments in other._by_task.items()
+            if self._by_task.get(name) != assignments
+        ]
+        changed.extend(
+            assignments[0].task
+            for name, assignments in self._by_task.items()
+            if name not in other._by_task
+        )
+        return changed
+
+    def get(self, name: str) -> Sequence[Assignment]:
+        """Get the assignments of a task."""
+        return self._by_task.get(name, ())
+
+    def add(self, assignment: Assignment):
+        """Add an assignment."""
+        self._by_task.setdefault(assignment.task.name, []).append(assignment)
+        self._tuple = None
+
+    def discard(self, name: str) -> bool:
+        """Remove the assignments of a task, if any.
+
+        :return: Was there any assignment to remove?
+        """
+        if self._by_task.pop(name, None) is None:
+            return False
+        self._tuple = None
+        return True
+
+    def rename(self, old: str, new: str):
+        """Update the assignments of a task that was renamed."""
+        if old in self._by_task:
+            # Rebuild the dict to keep the order
+            self._by_task = {
+                new if name == old else name: assignments
+                for name, assignments in self._by_task.items()
+            }
+
+    def discard_artists(self, names: Set[str]):
+        """Remove the assignments of multiple artists."""
+        for task_name, assignments in list(self._by_task.items()):
+            kept = [item for item in assignments if item.artist.name not in names]
+            if len(kept) == len(assignments):
+                continue
+            if kept:
+                self._by_task[task_name] = kept
             else:
-                if not combination.tasks:  # became empty
-                    continue
-            new_combinations.append(combination)
-        self.combinations = new_combinations
+                del self._by_task[task_name]
+            self._tuple = None
+
+
+def _set_values(obj: Any, values: Dict[str, Any]) -> Tuple[str, ...]:
+    """Set attributes on an object.
+
+    :return: The name of the attributes that changed
+    """
+    changed = []
+    for name, value in values.items():
+        if getattr(obj, name) != value:
+            setattr(obj, name, value)
+            changed.append(name)
+    return tuple(changed)
+
+
+def _rename(positions: Optional[Dict[str, int]], old: str, new: str):
+    """Update an index by name after an item was renamed."""
+    if positions is not None and old in positions:
+        positions[new] = positions.pop(old)
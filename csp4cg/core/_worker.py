@@ -0,0 +1,115 @@
+"""Solve in a child process, so the solve can be killed at any time.
+
+In ortools, there's no way to interrupt the solving immediately.
+CpSolverSolutionCallback.StopSearch exist but it's not immediate.
+See https://developers.google.com/optimization/cp/cp_tasks#solution-limit
+
+Starting a process that import ortools is slow when processes are spawned.
+Where available, processes are forked from a server process that
+already imported this module, starting a solve then take milliseconds.
+
+A model that had to be built is saved in the model cache from a thread,
+once the first solution was sent, so saving it never delay a solution.
+"""
+import functools
+import multiprocessing
+import multiprocessing.context
+import threading
+from typing import Callable, Optional, Tuple
+
+import numpy
+from ortools.sat.python import cp_model
+
+from ._cache import ModelCache
+from ._report import SolutionPoint
+from ._solver import Solver
+from ._types import Assignment, Context
+
+# Modules imported by the server process, before any solve is started.
+PRELOAD = (__name__,)
+
+# What the solve process send for each solution, the scores names and weights
+# are sent only once, before the first solution.
+RawSolution = Tuple[Tuple[Assignment, ...], numpy.ndarray, SolutionPoint]
+
+
+@functools.lru_cache(maxsize=None)
+def get_process_context() -> multiprocessing.context.BaseContext:
+    """Get the multiprocessing context to start solve processes with.
+
+    :return: A "forkserver" context that preload ortools if the platform support it,
+      the default context otherwise, ie: on Windows.
+    """
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context()
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload(list(PRELOAD))
+    return context
+
+
+def start_server():
+    """Start the server process in advance, so the first solve also start quickly.
+
+    Does nothing if the platform don't support a server process.
+    """
+    if get_process_context().get_start_method() == "forkserver":
+        # pylint: disable=import-outside-toplevel
+        from multiprocessing import forkserver
+
+        forkserver.ensure_running()
+
+
+def solve(
+    context: Context,
+    queue: multiprocessing.Queue,
+    cache_directory: Optional[str] = None,
+):
+    """Solve a context and send the progress to a queue, called in a child process.
+
+    The queue receive the ScoreMetadata, a RawSolution
+    for each solution found then the SolveReport.
+
+    :param context: The context to solve
+    :param queue: Where to send the progress
+    :param cache_directory: The model cache directory, default to the user cache.
+    """
+    cache = ModelCache(cache_directory)
+    solver = cache.get_solver(context, save=False)
+    queue.put(solver.get_score_metadata())
+    saver = threading.Thread(target=cache.save, args=(solver, context))
+    must_save = not solver.report.model_cached
+
+    def _on_solution(data: RawSolution):
+        queue.put(data)
+        if must_save and saver.ident is None:  # the solver release the GIL
+            saver.start()
+
+    solver.printer = CustomPrinter(solver, _on_solution)
+    try:
+        solver.solve()
+    except RuntimeError:  # no solution, the report tell why
+        pass
+    queue.put(solver.report)
+    if saver.ident is not None:
+        saver.join()
+    elif must_save:
+        cache.save(solver, context)
+
+
+class CustomPrinter(cp_model.CpSolverSolutionCallback):
+    """Print that compute the assignments."""
+
+    def __init__(self, solver: Solver, callback: Callable[[RawSolution], None]):
+        super().__init__()
+        self._solver = solver
+        self._callback = callback
+
+    def on_solution_callback(self):
+        """Called on each new solution."""
+        values = self.Response().solution
+        solution = self._solver.get_assignments(values)
+        scores = self._solver.get_scores(values)
+        progress = SolutionPoint(
+            self.WallTime(), self.ObjectiveValue(), self.BestObjectiveBound()
+        )
+        self._callback((solution, scores, progress))
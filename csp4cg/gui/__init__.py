@@ -1,6 +1,7 @@
 """Graphical user interface"""
 from PySide2.QtWidgets import QApplication
 
+from csp4cg.core._worker import start_server
 from .main_window import MainWindow
 from ._manager import Manager
 
@@ -9,6 +10,7 @@ __all__ = ("show", "Manager")
 
 def show():
     """Show the main window."""
+    start_server()  # Before Qt create threads, so solves start quickly
     app = QApplication([])
     win = MainWindow()
     win.show()
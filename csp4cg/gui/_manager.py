@@ -1,11 +1,10 @@
 """Handle interaction between a solver thread and a context object."""
-import csv
 import datetime
 import itertools
 import logging
 import os
 import tempfile
-from typing import List, Tuple
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from PySide2.QtCore import QObject, Signal, Slot, Qt
 
@@ -13,21 +12,30 @@ from csp4cg.core import (
     Artist,
     Task,
     Assignment,
+    AssignmentPool,
     TaskGroup,
     Context,
-    import_context_from_yml,
-    export_context_to_yml,
+    SolveReport,
+    import_context,
+    export_context,
 )
 from csp4cg.core._io import (
+    RowError,
     export_artists_to_csv,
     export_tasks_to_csv,
-    import_artists_from_csv,
-    import_tasks_from_csv,
+    merge_artists_from_csv,
+    merge_tasks_from_csv,
     export_assignments_to_csv,
-    import_assignments_from_csv,
+    ingest_assignments_from_csv,
 )
+from csp4cg.core._score import iter_scores
+from csp4cg.core._history import History
+from csp4cg.core._journal import Journal
 from csp4cg.gui._threading import WorkerThread, Score
 
+if TYPE_CHECKING:  # pragma: no cover
+    from csp4cg.core._report import SolutionPoint
+
 _LOG = logging.getLogger(__name__)
 
 
@@ -42,56 +50,77 @@ class Manager(QObject):
     onSolvingStarted = Signal()
     onSolvingEnded = Signal()
     onSolutionFound = Signal()
+    onReportFound = Signal()
 
     def __init__(self, context: Context, auto_solve=False):
         super().__init__()
         self.context = context  # type: Context
-        self.assignments = ()  # type: Tuple[Assignment, ...]
-        self.statistics = ()  # type: Tuple[Score, ...]
+        self.assignments: Tuple[Assignment, ...] = ()
+        self.statistics: Tuple[Score, ...] = ()
         self.solution_count = 0
         self.current_score = 0
+        self.report: Optional[SolveReport] = None
+        self.progress: Optional[SolutionPoint] = None
         self.auto_solve = auto_solve
         self.dirty = False
         self.path = ""
         self._path_autosave = os.path.join(tempfile.gettempdir(), "tmp.yml")
+        self._journal = Journal(self._path_autosave)
+        self._pool = AssignmentPool((), ())
+        self._history = History()
 
         self._thread = WorkerThread()
-        self._thread.started.connect(self.onSolvingStarted.emit, Qt.DirectConnection)  # type: ignore
-        self._thread.finished.connect(self.onSolvingEnded.emit, Qt.DirectConnection)  # type: ignore
-        self._thread.foundSolution.connect(self._on_solution_found, Qt.DirectConnection)  # type: ignore
+        self._thread.started.connect(  # type: ignore
+            self.onSolvingStarted.emit, Qt.DirectConnection
+        )
+        self._thread.finished.connect(  # type: ignore
+            self.onSolvingEnded.emit, Qt.DirectConnection
+        )
+        self._thread.foundSolution.connect(  # type: ignore
+            self._on_solution_found, Qt.DirectConnection
+        )
+        self._thread.foundReport.connect(  # type: ignore
+            self._on_report_found, Qt.DirectConnection
+        )
         self.set_context(context or Context())
 
         if self.auto_solve and self.can_play():
             self.play()
 
     def perform_autosave(self):
-        """Save the current context to a temporary file."""
+        """Journal the changes made to the current context since the last autosave."""
         if not self.path:
-            self.save(self._path_autosave)
+            self._journal.write(self.context)
 
     def restore_autosave(self):
-        """Restore an auto-saved context from a temporary file."""
-        if os.path.exists(self._path_autosave):
-            try:
-                self.open(self._path_autosave, update_path=False)
-            except ValueError as error:
-                _LOG.warning("Could not open %s: %s", self._path_autosave, error)
-
-    def set_context(self, context: Context):
-        """Set the current context."""
+        """Restore an auto-saved context by replaying its journal."""
+        if not self._journal.exists():
+            return
+        try:
+            context = self._journal.restore()
+        except ValueError as error:
+            _LOG.warning("Could not open %s: %s", self._path_autosave, error)
+            return
+        self.set_context(context)
+        self.set_dirty(False)
+
+    def set_context(self, context: Context, keep_history: bool = False):
+        """Set the current context.
+
+        :param context: The new context
+        :param keep_history: If False, the undo history is cleared
+        """
+        if not keep_history:
+            self._history.reset(context)
         self.context = context
+        self._pool = AssignmentPool(context.artists, context.tasks)
         self._thread.set_context(context)
         self.assignments = self._get_default_assignments()
         self.onContextChanged.emit(context)  # type: ignore
 
     def _get_artist_assigned_to_task(self, task: Task):
-        return next(
-            (
-                assignment.artist
-                for assignment in self.context.solution
-                if assignment.task == task
-            )
-        )
+        assignment = self.context.get_assignment(task)
+        return assignment.artist if assignment else None
 
     @Slot(int, int)  # type: ignore
     def onTaskDroppedOnArtist(  # pylint: disable=invalid-name
@@ -124,28 +153,87 @@ class Manager(QObject):
         assignments = []
         default_artist = self.context.artists[0]
         for task in self.context.tasks:
-            artist = next(
-                (
-                    combination.artist
-                    for combination in self.context.assignments
-                    if combination.task == task
-                ),
-                default_artist,
-            )
+            locks = self.context.get_locks(task)
+            artist = locks[0].artist if locks else default_artist
             assignments.append(Assignment(artist, task))
         return assignments
 
     def _on_solution_found(self, data):
         """Called when the solver found a solution."""
         self.solution_count += 1
-        self.context.solution, self.statistics = data
+        solution, self.statistics, self.progress = data
+        self.context.solution = self._get_pooled_assignments(solution)
         self.current_score = sum(score for _, score, _ in self.statistics)
+        if not self.dirty:  # otherwise the solution is for a previous state
+            self._history.set_solution((self.context.solution, self.statistics))
         self.perform_autosave()
         self.onSolutionFound.emit()
 
+    def _on_report_found(self, report: SolveReport):
+        """Called when the solver finished, with a summary of the solve."""
+        self.report = report
+        self.onReportFound.emit()
+
+    def can_undo(self) -> bool:
+        """Determine if there is an edit to undo."""
+        return self._history.can_undo()
+
+    def can_redo(self) -> bool:
+        """Determine if there is an edit to redo."""
+        return self._history.can_redo()
+
+    def undo(self):
+        """Revert the last edit, restoring the solution found before it if any."""
+        if self._history.can_undo():
+            self.stop()
+            self._restore(self._history.undo())
+
+    def redo(self):
+        """Re-apply the last reverted edit, restoring its solution if any."""
+        if self._history.can_redo():
+            self.stop()
+            self._restore(self._history.redo())
+
+    def _restore(self, solution):
+        """Refresh once the undo history modified the context.
+
+        :param solution: The cached solution of the restored state, if any.
+        """
+        if solution is None:  # was never solved
+            self.context.solution = []
+        self.set_context(self.context, keep_history=True)
+        if solution is None:
+            self.set_dirty()
+            return
+        assignments, self.statistics = solution
+        self.context.solution = self._get_pooled_assignments(assignments)
+        self.current_score = sum(score for _, score, _ in self.statistics)
+        self.perform_autosave()
+        self.onSolutionFound.emit()
+        self.set_dirty(False)
+
+    def _get_pooled_assignments(self, assignments):
+        """Replace assignments received from the solver process, which hold copies
+        of the artists and tasks, by shared assignments of the context objects.
+        """
+        columns = self.context.get_columns()
+        result = []
+        for assignment in assignments:
+            artist_index = columns.artist_indexes.get(assignment.artist.name)
+            task_index = columns.task_indexes.get(assignment.task.name)
+            if artist_index is None or task_index is None:  # context changed since
+                result.append(assignment)
+            else:
+                result.append(self._pool.get(artist_index, task_index))
+        return result
+
     def set_dirty(self, state: bool = True):
         """Notify the manager that the data changed and we need to rerun the solver."""
         self.dirty = state
+        if state:
+            self.context.invalidate()
+            self._pool = AssignmentPool(self.context.artists, self.context.tasks)
+            self._history.record()
         self.onDirty.emit(state)  # type: ignore
 
         if not state:
@@ -164,6 +252,8 @@ class Manager(QObject):
         """Start the solve process."""
         self.set_dirty(False)
         self.solution_count = 0
+        self.report = None
+        self.progress = None
         self._thread.start()
         if join:
             self._thread.wait()
@@ -186,7 +276,7 @@ class Manager(QObject):
         names = {artist.name for artist in self.context.artists}
         name = _get_unique_name(names, "Artist")
         artist = Artist(name=name, availability=100, tags={})
-        self.context.artists.append(artist)
+        self.context.add_artist(artist)
         self.set_dirty()
 
     def remove_artists(self, artists):
@@ -194,8 +284,7 @@ class Manager(QObject):
 
         :param artists: The artist to remove
         """
-        for artist in artists:
-            self.context.remove_artist(artist)
+        self.context.remove_artists(artists)
         self.set_dirty()
 
     def add_task(self):
@@ -203,7 +292,7 @@ class Manager(QObject):
         names = {task.name for task in self.context.tasks}
         name = _get_unique_name(names, "Task")
         task = Task(name, datetime.timedelta(hours=1), [])
-        self.context.tasks.append(task)
+        self.context.add_task(task)
         self.set_dirty()
 
     def remove_tasks(self, tasks: List[Task]):
@@ -211,8 +300,7 @@ class Manager(QObject):
 
         :param tasks: The tasks to remove
         """
-        for task in tasks:
-            self.context.remove_task(task)
+        self.context.remove_tasks(tasks)
         self.set_dirty()
 
     def add_tasks_group(self, tasks: List[Task]):
@@ -220,66 +308,92 @@ class Manager(QObject):
         new_group = TaskGroup(tasks, 1)
 
         # Remove any groups that already use these tasks
-        groups_to_remove = [
-            group
-            for group in self.context.combinations
-            if any(task in group.tasks for task in tasks)
-        ]
-        for group_to_remove in groups_to_remove:
-            self.context.combinations.remove(group_to_remove)
+        self.context.remove_groups(
+            [group for task in tasks for group in self.context.get_groups(task)]
+        )
 
-        self.context.combinations.append(new_group)
+        self.context.add_group(new_group)
         self.set_dirty()
         return new_group
 
     def remove_task_groups(self, task_groups: List[TaskGroup]):
         """Remove bonus points if a group of tasks are given to the same artist."""
-        for task_group in task_groups:
-            self.context.combinations.remove(task_group)
+        self.context.remove_groups(task_groups)
         self.set_dirty()
 
     def export_artists(self, path: str):
         """Export the list of artists to a .csv file."""
         export_artists_to_csv(self.context.artists, path)
 
-    def import_artists(self, path: str):
-        """Import the list of artists from a .csv file."""
-        self.context.artists = import_artists_from_csv(path)
+    def import_artists(self, path: str) -> List[RowError]:
+        """Import artists from a .csv file. Existing artists are updated.
 
-    def import_tasks(self, path: str):
-        """Import the list of tasks from a .csv file."""
-        self.context.tasks = import_tasks_from_csv(path)
+        :return: Invalid rows, they were skipped.
+        """
+        errors = merge_artists_from_csv(self.context, path)
+        _log_import_errors(path, errors)
+        self.set_dirty()
+        return errors
+
+    def import_tasks(self, path: str) -> List[RowError]:
+        """Import tasks from a .csv file. Existing tasks are updated.
+
+        :return: Invalid rows, they were skipped.
+        """
+        errors = merge_tasks_from_csv(self.context, path)
+        _log_import_errors(path, errors)
+        self.set_dirty()
+        return errors
 
     def export_tasks(self, path: str):
         """Export the list of tasks to a .csv file."""
         export_tasks_to_csv(self.context.tasks, path)
 
-    def import_assignments(self, path: str):
-        """Import a list of assignments from a .csv file."""
-        self.context.solution = import_assignments_from_csv(self.context, path)
+    def import_assignments(self, path: str) -> List[RowError]:
+        """Import a list of assignments from a .csv file.
+
+        :return: Invalid rows, they were skipped.
+        """
+        result = ingest_assignments_from_csv(self.context, path)
+        _log_import_errors(path, result.errors)
+        for task in result.unassigned:
+            _LOG.warning("Task %s is not assigned in %s", task.name, path)
+
+        self.context.solution = result.assignments
+        self.assignments = tuple(result.assignments)
+        self.statistics = tuple(iter_scores(self.context, result.assignments))
+        self.current_score = result.score
+        self._history.set_solution((self.context.solution, self.statistics))
+        self.onSolutionFound.emit()
+        return result.errors
 
     def export_assignments(self, path: str):
         """Export the current assignments to a .csv file."""
         export_assignments_to_csv(self.context.solution, path)
 
     def save(self, path: str = None):
-        """Expose the current session to a .yml file."""
-        export_context_to_yml(self.context, path or self.path)
+        """Expose the current session to a .yml, .json or .json.gz file."""
+        export_context(self.context, path or self.path)
 
     def save_as(self, path: str):
-        """Export the current session to a .yml file."""
+        """Export the current session to a .yml, .json or .json.gz file."""
         self.path = path
         self.save()
 
     def open(self, path: str, update_path: bool = True):
-        """Open a saved session .yml file."""
-        context = import_context_from_yml(path)
+        """Open a saved session .yml, .json or .json.gz file."""
+        context = import_context(path)
         self.set_context(context)
         if update_path:
             self.path = path
         self.set_dirty(False)
 
 
+def _log_import_errors(path: str, errors: List[RowError]):
+    for error in errors:
+        _LOG.warning("Could not import %s: %s", path, error)
+
+
 def _get_unique_name(known, prefix):
     suffix = itertools.count(start=1)
     while True:
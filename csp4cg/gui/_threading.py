@@ -1,27 +1,18 @@
 """Worker thread for the solve process."""
-import itertools
-import multiprocessing
 import time
 import queue
-from typing import Callable, Iterable, Tuple
+from typing import Optional, Tuple
 
 from PySide2.QtCore import Signal, QThread
-from ortools.sat.python import cp_model
 
-from csp4cg.core import Solver, Context, Assignment
+from csp4cg.core import Context, Assignment, SolveReport
+from csp4cg.core._report import SolutionPoint
+from csp4cg.core._solver import ScoreMetadata
+from csp4cg.core._worker import RawSolution, get_process_context, solve
 
-Score = Tuple[str, int]
-Solution = Tuple[Tuple[Assignment, ...], Tuple[Score, ...]]
-CallbackOnSolution = Callable[[Solution], None]
-
-
-def _solve(context: Context, queue_: multiprocessing.Queue):
-    # This function is voluntarily not a method of QThread as QThread
-    # is not "pickable" on Windows.
-    solver = Solver(context)
-    printer = CustomPrinter(solver, queue_.put)
-    solver.printer = printer
-    solver.solve()
+Score = Tuple[str, int, int]  # name, score and weight
+# Assignments, scores and the solver progress when the solution was found.
+Solution = Tuple[Tuple[Assignment, ...], Tuple[Score, ...], SolutionPoint]
 
 
 class WorkerThread(QThread):
@@ -29,38 +20,50 @@ class WorkerThread(QThread):
 
     foundSolution = Signal(object)  # list of assignment
     foundBestSolution = Signal(object)
+    foundReport = Signal(object)  # SolveReport, once the solve end
 
     def __init__(self, context=None, parent=None):
         super().__init__(parent)
 
         self._context = context
+        self._snapshot: Optional[Context] = None
         self._process = None
         self._queue = None
         self._cancel = False
+        self._metadata: Optional[ScoreMetadata] = None
 
     def set_context(self, context: Context):
-        """Set the current context"""
+        """Set the current context, a snapshot of it is solved on each start."""
         self._context = context
 
-    def _on_solution_found(self, solution: Solution):
+    def start(self, *args):  # pylint: disable=arguments-differ
+        """Start the solve of the current context.
+
+        The snapshot is taken in the calling thread, the context may be
+        modified as soon as this return.
+        """
+        self._snapshot = self._context.snapshot()
+        super().start(*args)
+
+    def _on_solution_found(self, data: RawSolution):
         """Called when a new solution is found."""
+        assert self._metadata is not None
+        assignments, values, progress = data
+        scores = tuple(
+            zip(self._metadata.names, values.tolist(), self._metadata.weights)
+        )
+        solution = (assignments, scores, progress)  # type: Solution
         self.foundSolution.emit(solution)  # type: ignore
 
     def run(self):
         """Start the solve process."""
         self._cancel = False
-        # We use multiprocessing to be able to kill the process.
-        # https://stackoverflow.com/a/7752174
-        # In ortools, there's no way to interrupt the solving immediately.
-        # There is the CpSolverSolutionCallback.StopSearch but it's not immediate.
-        # https://developers.google.com/optimization/cp/cp_tasks#solution-limit
-        self._queue = multiprocessing.Queue()
-        self._process = multiprocessing.Process(
-            target=_solve,
-            args=(
-                self._context,
-                self._queue,
-            ),
+        # The solve run in a process to be able to kill it, see csp4cg.core._worker.
+        # The target is not a method of QThread as QThread is not "pickable".
+        process_context = get_process_context()
+        self._queue = process_context.Queue()
+        self._process = process_context.Process(
+            target=solve, args=(self._snapshot, self._queue)
         )
         self._process.start()
 
@@ -68,11 +71,16 @@ class WorkerThread(QThread):
             self._process.is_alive() and not self._cancel
         ) or not self._queue.empty():
             try:
-                solution = self._queue.get_nowait()
+                data = self._queue.get_nowait()
             except queue.Empty:
                 pass
             else:
-                self._on_solution_found(solution)
+                if isinstance(data, ScoreMetadata):
+                    self._metadata = data
+                elif isinstance(data, SolveReport):
+                    self.foundReport.emit(data)  # type: ignore
+                else:
+                    self._on_solution_found(data)
             time.sleep(0.1)
 
     def cancel(self):
@@ -80,28 +88,3 @@ class WorkerThread(QThread):
         if self._process:
             self._process.terminate()
         self._cancel = True
-
-
-class CustomPrinter(cp_model.CpSolverSolutionCallback):
-    """Print that compute the assignments."""
-
-    def __init__(self, solver: Solver, callback: CallbackOnSolution):
-        super().__init__()
-        self._solver = solver
-        self._callback = callback
-
-    def _iter_assignments(self) -> Iterable[Assignment]:
-        """Get the assignments for the current solution."""
-        for artist, task in itertools.product(self._solver.artists, self._solver.tasks):
-            variable = self._solver.get_variable_assignment(task, artist)
-            if self.BooleanValue(variable):
-                yield Assignment(artist=artist, task=task)
-
-    def on_solution_callback(self):
-        """Called on each new solution."""
-        solution = tuple(self._iter_assignments())
-        scores = tuple(
-            (variable.Name(), self.Value(variable) * score, score)
-            for variable, score in self._solver.iter_variables_and_cost()
-        )
-        self._callback((solution, scores))
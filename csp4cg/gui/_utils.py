@@ -1,9 +1,13 @@
 """Qt related utilities."""
 import contextlib
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable, Optional, Sequence
 
 from PySide2.QtCore import Qt, QObject, QModelIndex, QAbstractItemModel
-from PySide2.QtWidgets import QFileDialog, QAbstractItemView
+from PySide2.QtWidgets import QFileDialog, QAbstractItemView, QMessageBox
+
+from csp4cg.core import Change, Context
+
+_MAX_ERRORS_DISPLAYED = 20
 
 
 def iter_selected_rows_data(view: QAbstractItemView) -> Iterable[Any]:
@@ -35,6 +39,34 @@ def context_reset_model(*models: QAbstractItemModel):
         model.endResetModel()
 
 
+def subscribe_model(
+    model: QObject, context: Optional[Context], listener: Callable[[Change], None]
+) -> Callable[[], None]:
+    """Helper, subscribe a listener to a context until its model is destroyed.
+
+    The destroyed signal is connected to a closure, not to the model,
+    as the model python wrapper can be gone when the signal is emitted.
+
+    :param model: The model that owns the listener
+    :param context: A context, if any
+    :param listener: A function called each time the context is modified
+    :return: A function that unsubscribes the listener right away
+    """
+    if context is None:
+        return lambda: None
+
+    def _unsubscribe(*_):
+        context.unsubscribe(listener)
+
+    def _cancel():
+        model.destroyed.disconnect(_unsubscribe)
+        _unsubscribe()
+
+    context.subscribe(listener)
+    model.destroyed.connect(_unsubscribe)
+    return _cancel
+
+
 def show_save_dialog(parent: QObject, title: str, filter_: str):
     """Show a file save_as dialog."""
     return QFileDialog.getSaveFileName(parent, title, filter=filter_)[0]
@@ -43,3 +75,13 @@ def show_save_dialog(parent: QObject, title: str, filter_: str):
 def show_open_dialog(parent: QObject, title: str, filter_: str):
     """Show a file open dialog."""
     return QFileDialog.getOpenFileName(parent, title, filter=filter_)[0]
+
+
+def show_errors_dialog(parent: QObject, title: str, errors: Sequence[Any]):
+    """Show a list of errors, if any."""
+    if not errors:
+        return
+    lines = [str(error) for error in errors[:_MAX_ERRORS_DISPLAYED]]
+    if len(errors) > _MAX_ERRORS_DISPLAYED:
+        lines.append(f"... and {len(errors) - _MAX_ERRORS_DISPLAYED} more errors.")
+    QMessageBox.warning(parent, title, "\n".join(lines))
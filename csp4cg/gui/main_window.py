@@ -15,6 +15,8 @@ from .widgets.gantt import GanttWidget
 from .widgets.footer import FooterBarWidget
 from ._utils import show_save_dialog, show_open_dialog
 
+_SESSION_FILTER = "Session (*.yml *.json *.json.gz)"
+
 
 class MainWindow(QMainWindow):
     """Main application window."""
@@ -31,6 +33,12 @@ class MainWindow(QMainWindow):
         self.action_open = QAction("Open", self)
         self.action_save_as = QAction("Save As", self)
         self.action_quit = QAction("Quit", self)
+        self.action_undo = QAction("Undo", self)
+        self.action_undo.setShortcut(QKeySequence.Undo)
+        self.action_redo = QAction("Redo", self)
+        self.action_redo.setShortcut(QKeySequence.Redo)
+        self.action_undo.setEnabled(False)
+        self.action_redo.setEnabled(False)
         self.action_show_artists = QAction("Artists", self)
         self.action_show_artists.setCheckable(True)
         self.action_show_artists.setChecked(True)
@@ -46,14 +54,18 @@ class MainWindow(QMainWindow):
 
         self.menubar = QMenuBar(self)
         self.menu_file = QMenu("File", self.menubar)
+        self.menu_edit = QMenu("Edit", self.menubar)
         self.menu_view = QMenu("View", self.menubar)
         self.menubar.addAction(self.menu_file.menuAction())
+        self.menubar.addAction(self.menu_edit.menuAction())
         self.menubar.addAction(self.menu_view.menuAction())
         self.menu_file.addAction(self.action_new)
         self.menu_file.addAction(self.action_open)
         self.menu_file.addAction(self.action_save)
         self.menu_file.addAction(self.action_save_as)
         self.menu_file.addSeparator()
+        self.menu_edit.addAction(self.action_undo)
+        self.menu_edit.addAction(self.action_redo)
         self.menu_view.addAction(self.action_show_artists)
         self.menu_view.addAction(self.action_show_tasks)
         self.menu_view.addAction(self.action_show_taskgroups)
@@ -98,6 +110,8 @@ class MainWindow(QMainWindow):
         self.action_open.triggered.connect(self.file_open)
         self.action_save.triggered.connect(self.file_save)
         self.action_save_as.triggered.connect(self.file_save_as)
+        self.action_undo.triggered.connect(self.edit_undo)
+        self.action_redo.triggered.connect(self.edit_redo)
         self.widget_artists.artistDeleted.connect(self._on_artist_deleted)
         self.widget_tasks.taskDeleted.connect(self._on_task_deleted)
 
@@ -128,6 +142,8 @@ class MainWindow(QMainWindow):
     def on_dirty(self, state):
         """Called when solver related data change."""
         self.widget_footer.set_dirty(state)
+        self.action_undo.setEnabled(self._manager.can_undo())
+        self.action_redo.setEnabled(self._manager.can_redo())
         self._update_window_title()
 
     def on_context_changed(self, context: Context):
@@ -148,7 +164,7 @@ class MainWindow(QMainWindow):
 
     def file_open(self):
         """Open a saved session."""
-        path = show_open_dialog(self, "Load Session", "Session (*.yml)")
+        path = show_open_dialog(self, "Load Session", _SESSION_FILTER)
         if not path:
             return
 
@@ -165,12 +181,22 @@ class MainWindow(QMainWindow):
 
     def file_save_as(self):
         """Save the session to a new file."""
-        path = show_save_dialog(self, "Save Session", "Session (*.yml)")
+        path = show_save_dialog(self, "Save Session", _SESSION_FILTER)
         if not path:
             return
         self._manager.save_as(path)
         self._update_window_title()
 
+    def edit_undo(self):
+        """Revert the last edit."""
+        self._manager.undo()
+        self._update_window_title()
+
+    def edit_redo(self):
+        """Re-apply the last reverted edit."""
+        self._manager.redo()
+        self._update_window_title()
+
     def _on_artist_deleted(self):
         """Called when an artist is deleted. Reset related models."""
         for model in (self.widget_tasks.model, self.widget_tasksgroups.model):
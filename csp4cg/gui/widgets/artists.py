@@ -21,13 +21,15 @@ from PySide2.QtWidgets import (
     QHeaderView,
 )
 
-from csp4cg.core import Artist, Context
+from csp4cg.core import Artist, Change, ChangeKind, Context
 from csp4cg.gui._manager import Manager
 from csp4cg.gui._utils import (
     show_open_dialog,
     show_save_dialog,
     context_reset_model,
     iter_selected_rows_data,
+    show_errors_dialog,
+    subscribe_model,
 )
 from csp4cg.gui.widgets import _base
 
@@ -126,7 +128,8 @@ class ArtistsWidget(QDockWidget):
             return
 
         with context_reset_model(self.model):
-            self._manager.import_artists(path)
+            errors = self._manager.import_artists(path)
+        show_errors_dialog(self, "Import Artists", errors)
 
     def _on_data_changed(
         self, top_left, bottom_right, roles
@@ -142,10 +145,16 @@ class ArtistsWidget(QDockWidget):
 class ArtistsListModel(QAbstractListModel):
     """Model for a list of artists."""
 
+    _ROLES_BY_FIELD = {
+        "name": RoleArtistName,
+        "availability": RoleArtistAvailability,
+        "tags": RoleArtistTags,
+    }
+
     def __init__(self, parent: QObject, context: Context):
         super().__init__(parent)
         self._context = context
-        self.set_context(context)
+        self._unsubscribe = subscribe_model(self, context, self._on_context_changed)
 
     def roleNames(self) -> Dict:
         return {
@@ -167,10 +176,8 @@ class ArtistsListModel(QAbstractListModel):
         if not setter:
             raise NotImplementedError(f"setData not implemented for role {role}")
 
-        if setter(artist, value):
-            self.dataChanged.emit(index, index, [role])
-            return True
-        return False
+        # The model is notified of the change by the context
+        return setter(self._context, artist, value)
 
     def rowCount(  # pylint: disable=unused-argument
         self, parent: QModelIndex = QModelIndex()
@@ -192,40 +199,45 @@ class ArtistsListModel(QAbstractListModel):
     def set_context(self, context: Context):
         """Reset the model with a new context."""
         self.beginResetModel()
+        self._unsubscribe()
         self._context = context
+        self._unsubscribe = subscribe_model(self, context, self._on_context_changed)
         self.endResetModel()
 
+    def _on_context_changed(self, change: Change):
+        """Refresh an artist row when it is modified."""
+        if change.kind == ChangeKind.ARTIST_CHANGED:
+            index = self.index(change.index, 0)
+            roles = [self._ROLES_BY_FIELD[field] for field in change.fields]
+            self.dataChanged.emit(index, index, roles)
+
 
-def _set_artist_name(artist: Artist, value: str) -> bool:
+def _set_artist_name(context: Context, artist: Artist, value: str) -> bool:
     """Set an artist name from a string value.
 
+    :param context: The context the artist is part of
     :param artist: An artist
     :param value: The artist new name
     :return: Was the artist name changed?
     """
-    if artist.name == value:
-        return False
-    artist.name = value
-    return True
+    return context.update_artist(artist, name=value)
 
 
-def _set_artist_availability(artist: Artist, value: str) -> bool:
+def _set_artist_availability(context: Context, artist: Artist, value: str) -> bool:
     """Set an artist availability from a string value.
 
+    :param context: The context the artist is part of
     :param artist: An artist
     :param value: The artist availability as a string
     :return: Was the artist availability changed?
     """
-    availability = int(value)
-    if artist.availability == availability:
-        return False
-    artist.availability = availability
-    return True
+    return context.update_artist(artist, availability=int(value))
 
 
-def _set_artist_tags(artist: Artist, value: str) -> bool:
+def _set_artist_tags(context: Context, artist: Artist, value: str) -> bool:
     """Set an artist tags from a string value.
 
+    :param context: The context the artist is part of
     :param artist: An artist
     :param value: The artist tags as a string
     :return: Was the artist tags changed?
@@ -237,10 +249,7 @@ def _set_artist_tags(artist: Artist, value: str) -> bool:
         }
     except ValueError:
         return False
-    if artist.tags == tags:
-        return False
-    artist.tags = tags
-    return True
+    return context.update_artist(artist, tags=tags)
 
 
 class ArtistListToTableProxyModel(_base.BaseTableProxyModel):
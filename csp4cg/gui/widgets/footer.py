@@ -1,6 +1,9 @@
 """Bottom tool bar"""
+
 # pylint: disable=no-member
-from PySide2.QtCore import Signal, QObject
+import time
+
+from PySide2.QtCore import Signal, QObject, QTimer
 from PySide2.QtWidgets import (
     QPushButton,
     QLabel,
@@ -49,6 +52,11 @@ class FooterBarWidget(QToolBar):
         self.spacer = QWidget()
         self.spacer.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
+        # Refresh the elapsed time while solving, even if no solution is found.
+        self._start_time = 0.0
+        self._timer = QTimer(self)
+        self._timer.setInterval(1000)
+
         # Build layout
         self.addWidget(self.button_play)
         self.addWidget(self.button_stop)
@@ -66,6 +74,8 @@ class FooterBarWidget(QToolBar):
         self._manager.onSolvingStarted.connect(self.on_solve_start)  # type: ignore
         self._manager.onSolvingEnded.connect(self.on_solve_end)  # type: ignore
         self._manager.onSolutionFound.connect(self.on_solution_found)  # type: ignore
+        self._manager.onReportFound.connect(self.on_report_found)  # type: ignore
+        self._timer.timeout.connect(self.on_solution_found)  # type: ignore
 
     def set_dirty(self, state: bool):
         """Called when a change that invalidate the current solution was made."""
@@ -85,14 +95,43 @@ class FooterBarWidget(QToolBar):
 
         self.button_play.setEnabled(False)
         self.button_stop.setEnabled(True)
+        self._start_time = time.monotonic()
+        self._timer.start()
         self.on_solution_found()
 
     def on_solution_found(self):
         """Called when the solver found a solution."""
-        self.label_progress.setText(
+        text = (
             f"Number of iterations: {self._manager.solution_count}. "
             f"Total score: {self._manager.current_score}"
         )
+        progress = self._manager.progress
+        if progress:
+            text += f". Gap: {progress.gap:.1%}"
+        if self._timer.isActive():
+            elapsed = time.monotonic() - self._start_time
+            text += f". Elapsed: {_format_duration(elapsed)}"
+        self.label_progress.setText(text)
+
+    def on_report_found(self):
+        """Called when the solver finished, show where the time went."""
+        report = self._manager.report
+        self.on_solution_found()
+        self.label_progress.setText(
+            f"{self.label_progress.text()} ({report.status.capitalize()})"
+        )
+        presolve = (
+            f"{report.presolve_time:.2f}s" if report.presolve_time is not None else "?"
+        )
+        cached = " (cached)" if report.model_cached else ""
+        self.label_progress.setToolTip(
+            f"Model: {report.num_variables} variables, "
+            f"{report.num_constraints} constraints\n"
+            f"Build: {report.build_time:.2f}s{cached}\n"
+            f"Presolve: {presolve}\n"
+            f"Solve: {report.solve_time:.2f}s, "
+            f"{len(report.solutions)} improving solutions"
+        )
 
     def on_solve_end(self):
         """Called when the solve end."""
@@ -101,3 +140,10 @@ class FooterBarWidget(QToolBar):
 
         self.button_play.setEnabled(True)
         self.button_stop.setEnabled(False)
+        self._timer.stop()
+
+
+def _format_duration(seconds: float) -> str:
+    """Format a duration, ie: "42s" or "1m05s"."""
+    minutes, seconds = divmod(int(seconds), 60)
+    return f"{minutes}m{seconds:02d}s" if minutes else f"{seconds}s"
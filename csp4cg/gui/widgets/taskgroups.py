@@ -21,9 +21,9 @@ from PySide2.QtWidgets import (
     QHeaderView,
 )
 
-from csp4cg.core import Context
+from csp4cg.core import Change, ChangeKind, Context
 from csp4cg.gui._manager import Manager
-from csp4cg.gui._utils import iter_selected_rows_data
+from csp4cg.gui._utils import iter_selected_rows_data, subscribe_model
 from csp4cg.gui.widgets._base import BaseTableProxyModel
 from ._base import ExcelLikeTableView
 
@@ -129,16 +129,28 @@ class TasksGroupsWidget(QDockWidget):
 class TaskGroupsItemModel(QAbstractItemModel):
     """Model displaying task groups."""
 
+    _ROLES_BY_FIELD = {"tasks": TasksGroupTasksRole, "weight": TasksGroupWeightRole}
+
     def __init__(self, context: Context, parent: QObject):
         super().__init__(parent)
         self._context = context
+        self._unsubscribe = subscribe_model(self, context, self._on_context_changed)
 
     def set_context(self, context):
         """Update the model with a new context."""
         self.beginResetModel()
+        self._context.unsubscribe(self._on_context_changed)
         self._context = context
+        self._unsubscribe = subscribe_model(self, context, self._on_context_changed)
         self.endResetModel()
 
+    def _on_context_changed(self, change: Change):
+        """Refresh a task group row when it is modified."""
+        if change.kind == ChangeKind.GROUP_CHANGED:
+            index = self.createIndex(change.index, 0)
+            roles = [self._ROLES_BY_FIELD[field] for field in change.fields]
+            self.dataChanged.emit(index, index, roles)
+
     def rowCount(  # pylint: disable=unused-argument
         self, parent: QModelIndex = Qt.EditRole
     ) -> int:
@@ -161,8 +173,9 @@ class TaskGroupsItemModel(QAbstractItemModel):
 
     def setData(self, index: QModelIndex, value: Any, role: int = Qt.EditRole) -> bool:
         if role == TasksGroupWeightRole:
-            self._context.combinations[index.row()].weight = int(value)
-            self.dataChanged.emit(index, index, [role])
+            group = self._context.combinations[index.row()]
+            # The model is notified of the change by the context
+            self._context.update_group(group, weight=int(value))
             return True
 
         raise NotImplementedError(f"setData not implemented for role {role}")
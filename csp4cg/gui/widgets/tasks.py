@@ -28,9 +28,14 @@ from PySide2.QtWidgets import (
     QHeaderView,
 )
 
-from csp4cg.core import Context, Assignment
+from csp4cg.core import Change, ChangeKind, Context, Assignment
 from csp4cg.gui._manager import Manager
-from csp4cg.gui._utils import context_reset_model, iter_selected_rows_data
+from csp4cg.gui._utils import (
+    context_reset_model,
+    iter_selected_rows_data,
+    show_errors_dialog,
+    subscribe_model,
+)
 from csp4cg.gui.widgets import _base
 from .._utils import show_save_dialog, show_open_dialog
 
@@ -133,7 +138,8 @@ class TasksWidget(QDockWidget):
             return
 
         with context_reset_model(self.model):
-            self._manager.import_tasks(path)
+            errors = self._manager.import_tasks(path)
+        show_errors_dialog(self, "Import Shots", errors)
 
     def export_tasks(self):
         """Export the list of tasks to a .csv file."""
@@ -155,10 +161,17 @@ class TasksWidget(QDockWidget):
 class TasksListModel(QAbstractListModel):
     """Widget displaying tasks."""
 
+    _ROLES_BY_FIELD = {
+        "name": (RoleTaskName,),
+        "duration": (RoleTaskDuration, RoleTaskWidth),
+        "tags": (RoleTaskTags,),
+    }
+
     def __init__(self, parent: QObject, context: Context):
         super().__init__(parent)
         self._context = context
         self._extra_roles = {}  # type: Dict[int, Dict[int, Any]]
+        self._unsubscribe = subscribe_model(self, context, self._on_context_changed)
 
     def roleNames(self) -> Dict:
         return {
@@ -187,13 +200,11 @@ class TasksListModel(QAbstractListModel):
         if role == RoleTaskDuration:
             return str(task.duration.total_seconds() / 60 / 60)  # hours
         if role == RoleTaskWidth:
-            return task.duration.total_seconds() / 60 / 60  # hours
+            return self._context.get_columns().durations[row] / 60  # hours
         if role == RoleTaskTags:
             return ",".join(task.tags)
         if role == RoleTaskLocked:
-            return any(
-                assignment.task == task for assignment in self._context.assignments
-            )
+            return self._context.get_columns().locks[row] != -1
         if role in (
             RoleTaskXCoord,
             RoleTaskYCoord,
@@ -211,32 +222,21 @@ class TasksListModel(QAbstractListModel):
     def setData(self, index: QModelIndex, value: Any, role: int = Qt.EditRole) -> bool:
         task = self._context.tasks[index.row()]
 
+        # For the following roles, the model is notified by the context.
         if role == RoleTaskName:
-            if value == task.name:
-                return False
-            task.name = value
-            self.dataChanged.emit(index, index, [role])
-            return True
+            return self._context.update_task(task, name=value)
 
         if role == RoleTaskDuration:
             try:
                 value = datetime.timedelta(hours=float(value))
             except ValueError:
                 return False
-            if value == task.duration:
-                return False
-            task.duration = value
-            self.dataChanged.emit(index, index, [role])
-            return True
+            return self._context.update_task(task, duration=value)
 
         if role == RoleTaskTags:
             value = [name.strip() for name in value.split(",")]
             value = [name for name in value if name]
-            if value == task.tags:
-                return False
-            task.tags = value
-            self.dataChanged.emit(index, index, [role])
-            return True
+            return self._context.update_task(task, tags=value)
 
         if role == RoleTaskLocked:
             assignment = self.data(index, RoleAssignment)  # type: Assignment
@@ -244,7 +244,6 @@ class TasksListModel(QAbstractListModel):
                 self._context.assign(assignment.task, assignment.artist)
             else:
                 self._context.unassign(assignment.task)
-            self.dataChanged.emit(index, index, [role])
             return True
 
         if role == RoleTaskArtist:
@@ -262,10 +261,25 @@ class TasksListModel(QAbstractListModel):
     def set_context(self, context: Context):
         """Update the model with a new context."""
         self.beginResetModel()
+        self._unsubscribe()
         self._context = context
+        self._unsubscribe = subscribe_model(self, context, self._on_context_changed)
         self.resetInternalData()
         self.endResetModel()
 
+    def _on_context_changed(self, change: Change):
+        """Refresh a task row when it is modified or locked."""
+        if change.kind == ChangeKind.TASK_CHANGED:
+            roles = [
+                role for field in change.fields for role in self._ROLES_BY_FIELD[field]
+            ]
+        elif change.kind == ChangeKind.LOCK_CHANGED:
+            roles = [RoleTaskLocked]
+        else:
+            return
+        index = self.index(change.index, 0)
+        self.dataChanged.emit(index, index, roles)
+
     def resetInternalData(self):
         """Recompute the extra roles cache."""
         self._extra_roles = [
@@ -278,13 +292,13 @@ class TasksListModel(QAbstractListModel):
             for _ in range(self.rowCount())
         ]
 
-        index_by_task = {task: index for index, task in enumerate(self._context.tasks)}
+        index_by_task = self._context.get_columns().task_indexes
 
         # Join hard assignments and current assignments
         assignments = set(self._context.solution) | set(self._context.assignments)
 
         for assignment, x_coord, y_coord in _iter_assignments_coords(assignments):
-            index = index_by_task[assignment.task]
+            index = index_by_task[assignment.task.name]
             self._extra_roles[index].update(
                 {
                     RoleTaskXCoord: x_coord,
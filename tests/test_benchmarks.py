@@ -0,0 +1,35 @@
+"""Smoke tests for the benchmark suite, so it don't silently break."""
+import json
+
+from benchmarks import suite
+from csp4cg.core import generate_context
+from csp4cg.core._replay import export_model
+from csp4cg.core._solver import Solver
+
+
+def test_suite(tmp_path):
+    """Ensure the benchmarks can run and their results be compared."""
+    path = tmp_path / "results.json"
+    args = ["--scales", "1", "--only", "build", "scores", "--repeat", "1"]
+    results = suite.main(args + ["--output", str(path)])
+    assert json.loads(path.read_text()) == results
+    assert [entry["benchmark"] for entry in results["results"]] == ["build", "scores"]
+    assert results["results"][0]["tasks"] == 61
+    assert results["results"][0]["metrics"]["variables"] > 0
+
+    lines = suite.compare(results, results)
+    assert lines
+    assert all(line.endswith(("1.00x", "-")) for line in lines)
+
+
+def test_suite_models(tmp_path):
+    """Ensure we can replay model files."""
+    path = str(tmp_path / "model.zip")
+    export_model(Solver(generate_context(8, num_artists=2)), path)
+    args = ["--only", "build", "--scales", "1", "--repeat", "1", "--workers", "1"]
+    results = suite.main(args + ["--time-limit", "5", "--models", path])
+    entry = results["results"][-1]
+    assert entry["benchmark"] == "replay"
+    assert entry["model"] == "model.zip"
+    assert entry["metrics"]["status"] == "OPTIMAL"
+    assert suite.compare(results, results)
@@ -0,0 +1,77 @@
+"""Tests for the on-disk cache of built models."""
+import pytest
+
+from csp4cg.core import ModelCache, generate_context
+from csp4cg.core._cache import get_context_key
+from csp4cg.core._solver import Solver, get_costs
+
+
+@pytest.fixture
+def context():
+    return generate_context(12, num_artists=3, group_ratio=0.5, seed=1)
+
+
+def test_context_key(context):
+    """Ensure the key only change when the model structure change."""
+    key = get_context_key(context)
+    context.settings.weight_tags = 50
+    context.combinations[0].weight = 100
+    assert get_context_key(context) == key
+
+    context.update_task(context.tasks[0], duration=context.tasks[0].duration * 2)
+    assert get_context_key(context) != key
+
+
+def test_get_solver(tmp_path, context):
+    """Ensure a cached model reach the same solution as a built model."""
+    cache = ModelCache(str(tmp_path))
+    assert not cache.get_solver(context).report.model_cached
+    context.settings.weight_tags = 50  # only change the objective
+
+    expected = Solver(context)
+    actual = cache.get_solver(context)
+    assert actual.report.model_cached
+    assert actual.get_score_metadata() == expected.get_score_metadata()
+    for solver in (expected, actual):
+        solver.solver.parameters.num_search_workers = 1
+        solver.solve()
+    assert actual.report.status == expected.report.status == "OPTIMAL"
+    assert actual.report.objective == expected.report.objective
+
+
+def test_get_solver_no_save(tmp_path, context):
+    """Ensure a built model is only saved when requested."""
+    cache = ModelCache(str(tmp_path))
+    solver = cache.get_solver(context, save=False)
+    assert not list(tmp_path.iterdir())
+
+    solver.solver.parameters.num_search_workers = 1
+    solver.solve()  # the model is saved with its objective
+    cache.save(solver, context)
+    actual = cache.get_solver(context)
+    assert actual.report.model_cached
+    actual.solver.parameters.num_search_workers = 1
+    actual.solve()
+    assert actual.report.objective == solver.report.objective
+
+
+def test_get_solver_corrupted(tmp_path, context):
+    """Ensure a corrupted cache entry is rebuilt."""
+    cache = ModelCache(str(tmp_path))
+    with open(cache.get_path(context), "w") as stream:
+        stream.write("corrupted")
+    assert not cache.get_solver(context).report.model_cached
+    assert cache.get_solver(context).report.model_cached
+
+
+def test_prune(tmp_path):
+    """Ensure only the most recently used models are kept."""
+    cache = ModelCache(str(tmp_path), max_entries=2)
+    for seed in range(3):
+        cache.get_solver(generate_context(4, num_artists=2, seed=seed))
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_get_costs(context):
+    """Ensure the costs match the weighted variables created by the solver."""
+    assert get_costs(context) == Solver(context)._vars_weighted_cost
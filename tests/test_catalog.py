@@ -0,0 +1,79 @@
+"""Tests for memory-mapped task catalogs."""
+# pylint: disable=redefined-outer-name
+import datetime
+
+import pytest
+
+from csp4cg.core import Artist, Context, Task, TaskCatalog, export_tasks_to_catalog
+
+
+@pytest.fixture()
+def tasks():
+    """A list of tasks"""
+    return [
+        Task("sq010_sh0010_anim", 1, tags=["anim", "acting"]),
+        Task("sq010_sh0010_fx", 2.5, tags=["fx"]),
+        Task("sq010_sh0020_anim", 3),
+        Task("sq020_sh0010_anim", 4, tags=["anim"]),
+        Task("sq020_sh0010_lighting_é", 5, tags=["lighting", "é"]),
+    ]
+
+
+@pytest.fixture()
+def catalog(tmp_path, tasks):
+    """A catalog containing the tasks."""
+    path = str(tmp_path / "catalog.bin")
+    export_tasks_to_catalog(tasks, path)
+    with TaskCatalog(path) as catalog_:
+        yield catalog_
+
+
+def test_roundtrip(catalog, tasks):
+    """Ensure we can read back exported tasks."""
+    assert len(catalog) == 5
+    assert catalog.tags == ["anim", "acting", "fx", "lighting", "é"]
+    assert catalog.name(4) == "sq020_sh0010_lighting_é"
+    assert catalog.duration(1) == datetime.timedelta(hours=2.5)
+    assert catalog.task_tags(0) == ["anim", "acting"]
+    assert catalog.task_tags(2) == []
+    assert catalog.to_tasks(range(len(catalog))) == tasks
+
+
+_SELECT_DATA = {
+    "all": ({}, [0, 1, 2, 3, 4]),
+    "pattern": ({"pattern": "sq010_*"}, [0, 1, 2]),
+    "pattern_single_char": ({"pattern": "sq0?0_sh0010_*_?"}, [4]),
+    "pattern_no_match": ({"pattern": "sh0010"}, []),
+    "tags": ({"tags": ["anim", "lighting"]}, [0, 3, 4]),
+    "tags_unknown": ({"tags": ["unknown"]}, []),
+    "pattern_and_tags": ({"pattern": "*_sh0010_*", "tags": ["anim"]}, [0, 3]),
+}
+
+
+@pytest.mark.parametrize(
+    "kwargs,expected", _SELECT_DATA.values(), ids=_SELECT_DATA.keys()
+)
+def test_select(catalog, kwargs, expected):
+    """Ensure we can filter tasks by name and tags."""
+    assert catalog.select(**kwargs) == expected
+
+
+def test_to_context(catalog, tasks):
+    """Ensure we can build a context from a selection."""
+    artists = [Artist("artist1")]
+    actual = catalog.to_context(catalog.select(tags=["fx"]), artists)
+    assert actual == Context(artists=artists, tasks=[tasks[1]])
+
+
+def test_invalid_file(tmp_path):
+    """Ensure we raise a ValueError when opening something that is not a catalog."""
+    path = tmp_path / "catalog.bin"
+    path.write_bytes(b"not a catalog" * 10)
+    with pytest.raises(ValueError):
+        TaskCatalog(str(path))
+
+
+def test_invalid_name(tmp_path):
+    """Ensure we refuse names that would corrupt the catalog."""
+    with pytest.raises(ValueError):
+        export_tasks_to_catalog([Task("a\nb", 1)], str(tmp_path / "catalog.bin"))
@@ -0,0 +1,182 @@
+"""Tests for the command line interface."""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from csp4cg import _cli
+from csp4cg.core import (
+    Artist,
+    Assignment,
+    Context,
+    Task,
+    export_context,
+    import_context,
+)
+from csp4cg.core._report import import_report
+
+
+def _write_session(path, assignments=()):
+    artist1 = Artist("artist1", tags={"0010": 10})
+    artist2 = Artist("artist2")
+    task1 = Task("0010", 1)
+    task2 = Task("0020", 1)
+    locks = [Assignment(artist1 if index else artist2, task1) for index in assignments]
+    context = Context(
+        artists=[artist1, artist2], tasks=[task1, task2], assignments=locks
+    )
+    export_context(context, str(path))
+
+
+def _read_events(capsys):
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+def test_solve(tmp_path, capsys):
+    """Ensure we can solve a session and export the assignments."""
+    path = tmp_path / "session.yml"
+    path_out = tmp_path / "assignments.csv"
+    _write_session(path)
+    code = _cli.main(["solve", str(path), "--out", str(path_out), "--workers", "1"])
+    assert code == _cli.EXIT_OPTIMAL
+
+    events = _read_events(capsys)
+    assert events[0]["event"] == "solution"
+    assert events[-1]["event"] == "done"
+    assert events[-1]["status"] == "OPTIMAL"
+    assert path_out.read_text().splitlines() == ["0010,artist1", "0020,artist2"]
+
+
+def test_solve_infeasible(tmp_path, capsys):
+    """Ensure a specific exit code is returned when there's no solution."""
+    path = tmp_path / "session.yml"
+    _write_session(path, assignments=(0, 1))  # a task locked to two artists
+    assert _cli.main(["solve", str(path)]) == _cli.EXIT_INFEASIBLE
+    assert _read_events(capsys)[-1]["status"] == "INFEASIBLE"
+
+
+def test_solve_invalid_input(tmp_path, capsys):
+    """Ensure a specific exit code is returned when the session can't be read."""
+    path = tmp_path / "session.yml"
+    assert _cli.main(["solve", str(path)]) == _cli.EXIT_INVALID_INPUT
+    assert _read_events(capsys)[-1]["event"] == "error"
+
+
+def test_solve_error(tmp_path, capsys):
+    """Ensure a specific exit code is returned when the model can't be built."""
+    path = tmp_path / "session.yml"
+    context = Context(
+        artists=[Artist("artist1", availability=0)], tasks=[Task("0010", 1)]
+    )
+    export_context(context, str(path))
+    assert _cli.main(["solve", str(path)]) == _cli.EXIT_ERROR
+    assert _read_events(capsys)[-1]["event"] == "error"
+
+
+def test_solve_dont_import_qt(tmp_path):
+    """Ensure solving from the command line don't import the user interface."""
+    path = tmp_path / "session.yml"
+    _write_session(path)
+    script = (
+        "import sys; from csp4cg._cli import main; "
+        f"main(['solve', {str(path)!r}]); "
+        "assert 'csp4cg.gui' not in sys.modules; "
+        "assert 'PySide2' not in sys.modules"
+    )
+    subprocess.run(
+        [sys.executable, "-c", script], check=True, stdout=subprocess.DEVNULL
+    )
+
+
+def test_solve_json_dont_import_yaml(tmp_path):
+    """Ensure solving a json session don't import yaml."""
+    path = tmp_path / "session.json"
+    path_out = tmp_path / "solution.json"
+    _write_session(path)
+    script = (
+        "import sys; from csp4cg._cli import main; "
+        f"main(['solve', {str(path)!r}, '--out', {str(path_out)!r}]); "
+        "assert 'yaml' not in sys.modules"
+    )
+    subprocess.run(
+        [sys.executable, "-c", script], check=True, stdout=subprocess.DEVNULL
+    )
+
+
+def test_solve_report(tmp_path, capsys):
+    """Ensure we can write a solve report next to the session."""
+    path = tmp_path / "session.yml"
+    _write_session(path)
+    assert _cli.main(["solve", str(path), "--report"]) == _cli.EXIT_OPTIMAL
+    assert _read_events(capsys)[-1]["variables"] > 0
+
+    report = import_report(str(tmp_path / "session.report.json"))
+    assert report.status == "OPTIMAL"
+    assert report.gap == 0
+
+
+def test_replay(tmp_path, capsys):
+    """Ensure we can dump a model and replay it."""
+    path = tmp_path / "session.yml"
+    path_model = tmp_path / "model.zip"
+    path_out = tmp_path / "assignments.csv"
+    _write_session(path)
+    args = ["--workers", "1"]
+    code = _cli.main(["solve", str(path), "--dump-model", str(path_model)] + args)
+    assert code == _cli.EXIT_OPTIMAL
+    expected = _read_events(capsys)[-1]["objective"]
+
+    code = _cli.main(["replay", str(path_model), "--out", str(path_out)] + args)
+    assert code == _cli.EXIT_OPTIMAL
+    assert _read_events(capsys)[-1]["objective"] == expected
+    assert path_out.read_text().splitlines() == ["0010,artist1", "0020,artist2"]
+
+
+def test_replay_invalid_input(tmp_path, capsys):
+    """Ensure a specific exit code is returned when the model can't be read."""
+    path = tmp_path / "model.zip"
+    path.write_text("not a model")
+    assert _cli.main(["replay", str(path)]) == _cli.EXIT_INVALID_INPUT
+    assert _read_events(capsys)[-1]["event"] == "error"
+
+
+def test_solve_cache(tmp_path, capsys):
+    """Ensure the model is reused when solving the same session twice."""
+    path = tmp_path / "session.yml"
+    _write_session(path)
+    args = ["solve", str(path), "--cache", str(tmp_path / "cache")]
+    assert _cli.main(args) == _cli.EXIT_OPTIMAL
+    assert not _read_events(capsys)[-1]["model_cached"]
+    assert _cli.main(args) == _cli.EXIT_OPTIMAL
+    assert _read_events(capsys)[-1]["model_cached"]
+
+
+def test_tune(tmp_path, capsys):
+    """Ensure we can tune the solver parameters and write the best in the sessions."""
+    (tmp_path / "sessions").mkdir()
+    path = tmp_path / "sessions" / "session.yml"
+    path_grid = tmp_path / "grid.json"
+    _write_session(path)
+    path_grid.write_text(json.dumps({"linearization_level": [1, 2]}))
+    args = ["tune", str(path.parent), "--grid", str(path_grid), "--time-limit", "5"]
+    assert _cli.main(args + ["--workers", "1", "--apply"]) == _cli.EXIT_OPTIMAL
+
+    events = _read_events(capsys)
+    assert [event["event"] for event in events].count("solve") == 2
+    assert events[-1]["event"] == "done"
+    best = events[-1]["parameters"]
+    assert import_context(str(path)).settings.solver_parameters == best
+
+
+@pytest.mark.parametrize("grid", [{"unknown": [1]}, {}, {"linearization_level": []}])
+def test_tune_invalid_grid(tmp_path, capsys, grid):
+    """Ensure invalid parameters and empty grids are reported before solving."""
+    path = tmp_path / "session.yml"
+    path_grid = tmp_path / "grid.json"
+    _write_session(path)
+    path_grid.write_text(json.dumps(grid))
+    args = ["tune", str(path), "--grid", str(path_grid)]
+    assert _cli.main(args) == _cli.EXIT_INVALID_INPUT
+    assert _read_events(capsys)[-1]["event"] == "error"
@@ -0,0 +1,66 @@
+"""Tests for the column oriented view of a context."""
+import datetime
+
+from csp4cg.core import Artist, Assignment, Context, Task, TaskGroup
+
+
+def _get_context():
+    artist1 = Artist("artist1", availability=50, tags={"acting": 10, "0030": 5})
+    artist2 = Artist("artist2", tags={"acting": 1, "fx": 2})
+    task1 = Task("0010", datetime.timedelta(hours=1), tags=["acting"])
+    task2 = Task("0020", datetime.timedelta(minutes=90), tags=["acting", "fx"])
+    task3 = Task("0030", datetime.timedelta(hours=3))
+    return Context(
+        artists=[artist1, artist2],
+        tasks=[task1, task2, task3],
+        assignments=[Assignment(artist2, task3)],
+        combinations=[TaskGroup([task1, task3], 1)],
+    )
+
+
+def test_columns():
+    """Ensure the columns match the context."""
+    context = _get_context()
+    columns = context.get_columns()
+    assert list(columns.durations) == [60, 90, 180]
+    assert list(columns.availabilities) == [50, 100]
+    assert columns.preferences == [{0: 10, 1: 10, 2: 5}, {0: 1, 1: 3}]
+    assert list(columns.groups) == [0, -1, 0]
+    assert list(columns.locks) == [-1, -1, 1]
+    assert columns.artist_indexes == {"artist1": 0, "artist2": 1}
+    assert columns.task_indexes == {"0010": 0, "0020": 1, "0030": 2}
+
+
+def test_columns_cache():
+    """Ensure the columns are cached until the context is mutated."""
+    context = _get_context()
+    columns = context.get_columns()
+    assert context.get_columns() is columns
+
+    context.tasks[0].duration = datetime.timedelta(hours=2)
+    context.invalidate()
+    assert context.get_columns().durations[0] == 120
+
+    context.unassign(context.tasks[2])
+    assert list(context.get_columns().locks) == [-1, -1, -1]
+
+    context.remove_artist(context.artists[0])
+    assert context.get_columns().preferences == [{0: 1, 1: 3}]
+
+
+def test_columns_not_compared():
+    """Ensure the cache don't affect equality."""
+    context = _get_context()
+    context.get_columns()
+    assert context == _get_context()
+
+
+def test_columns_tags():
+    """Ensure tags are interned and tasks can be selected by tags."""
+    context = _get_context()
+    columns = context.get_columns()
+    assert columns.tags.from_mask(columns.task_tags[1]) == ["acting", "fx"]
+    assert columns.task_tags[2] == 0
+    assert [list(tasks) for tasks in columns.tasks_by_tag] == [[0, 1], [1], []]
+    assert columns.select_tasks(["fx", "unknown"]) == [1]
+    assert columns.select_tasks(["acting"]) == [0, 1]
@@ -0,0 +1,173 @@
+"""Tests for the context change events."""
+# pylint: disable=redefined-outer-name
+import pickle
+
+import pytest
+
+from csp4cg.core import (
+    Artist,
+    Assignment,
+    Change,
+    ChangeKind,
+    Context,
+    Task,
+    TaskGroup,
+)
+
+
+@pytest.fixture()
+def context():
+    """A context instance."""
+    tasks = [Task(f"{index:04d}", 1) for index in range(3)]
+    return Context(
+        artists=[Artist("artist1"), Artist("artist2")],
+        tasks=tasks,
+        combinations=[TaskGroup(tasks[:2]), TaskGroup(tasks[2:])],
+    )
+
+
+@pytest.fixture()
+def changes(context):
+    """The changes made to the context."""
+    result = []
+    context.subscribe(result.append)
+    return result
+
+
+def test_add(context, changes):
+    """Ensure adding artists, tasks and groups is reported."""
+    artist = Artist("artist3")
+    task = Task("0040", 1)
+    group = TaskGroup([task])
+    context.add_artist(artist)
+    context.add_task(task)
+    context.add_group(group)
+    assert changes == [
+        Change(ChangeKind.ARTIST_ADDED, artist, 2),
+        Change(ChangeKind.TASK_ADDED, task, 3),
+        Change(ChangeKind.GROUP_ADDED, group, 2),
+    ]
+
+
+def test_insert(context, changes):
+    """Ensure inserting artists, tasks and groups report their index."""
+    artist = Artist("artist0")
+    task = Task("0005", 1)
+    group = TaskGroup([task])
+    context.add_artist(artist, 0)
+    context.add_task(task, 1)
+    context.add_group(group, 0)
+    assert context.artists[0] is artist
+    assert context.tasks[1] is task
+    assert context.combinations[0] is group
+    assert changes == [
+        Change(ChangeKind.ARTIST_ADDED, artist, 0),
+        Change(ChangeKind.TASK_ADDED, task, 1),
+        Change(ChangeKind.GROUP_ADDED, group, 0),
+    ]
+    assert context.get_task("0001") is context.tasks[2]
+    assert context.get_columns().task_indexes["0001"] == 2
+
+
+def test_update(context, changes):
+    """Ensure only actual modifications are reported."""
+    artist = context.artists[1]
+    task = context.tasks[2]
+    group = context.combinations[0]
+    assert context.update_artist(artist, name="artist2", availability=50)
+    assert not context.update_task(task, name="0002")
+    assert context.update_task(task, name="0025", tags=["fx"])
+    assert context.update_group(group, weight=2)
+    assert changes == [
+        Change(ChangeKind.ARTIST_CHANGED, artist, 1, ("availability",)),
+        Change(ChangeKind.TASK_CHANGED, task, 2, ("name", "tags")),
+        Change(ChangeKind.GROUP_CHANGED, group, 0, ("weight",)),
+    ]
+    assert context.get_columns().task_indexes["0025"] == 2
+
+
+def test_lock(context, changes):
+    """Ensure locking and unlocking tasks is reported."""
+    task = context.tasks[1]
+    context.assign(task, context.artists[0])
+    context.unassign(task)
+    context.unassign(task)  # not locked anymore, nothing to report
+    assert changes == [
+        Change(ChangeKind.LOCK_CHANGED, task, 1),
+        Change(ChangeKind.LOCK_CHANGED, task, 1),
+    ]
+
+
+def test_set_locks(context, changes):
+    """Ensure replacing all the locks of a task is reported once."""
+    task = context.tasks[1]
+    artist1, artist2 = context.artists
+    context.set_locks(task, [artist1, artist2])
+    assert context.get_locks(task) == [
+        Assignment(artist1, task),
+        Assignment(artist2, task),
+    ]
+    context.set_locks(task, [])
+    context.set_locks(task, [])  # not locked anymore, nothing to report
+    assert context.get_locks(task) == []
+    assert changes == [
+        Change(ChangeKind.LOCK_CHANGED, task, 1),
+        Change(ChangeKind.LOCK_CHANGED, task, 1),
+    ]
+
+
+def test_replace_assignments(context, changes):
+    """Ensure replacing the locks or the solution report the tasks that changed."""
+    task1, task2, task3 = context.tasks
+    artist1, artist2 = context.artists
+    context.assign(task1, artist1)
+    context.solution = [Assignment(artist1, task1), Assignment(artist1, task2)]
+    del changes[:]
+
+    context.assignments = [Assignment(artist1, task1), Assignment(artist2, task3)]
+    context.solution = [Assignment(artist2, task2), Assignment(artist1, task1)]
+    assert changes == [
+        Change(ChangeKind.LOCK_CHANGED, task3, 2),
+        Change(ChangeKind.SOLUTION_CHANGED, task2, 1),
+    ]
+
+
+def test_rename_locked_task(context):
+    """Ensure the locks of a task follow it when renamed."""
+    task = context.tasks[0]
+    context.assign(task, context.artists[1])
+    context.update_task(task, name="0005")
+    assert context.get_locks(task) == [Assignment(context.artists[1], task)]
+
+
+def test_remove(context, changes):
+    """Ensure removals are reported from the last to the first item,
+    after the changes of the task groups the tasks were part of.
+    """
+    task1, task2, task3 = context.tasks
+    group1, group2 = context.combinations
+    artist = context.artists[0]
+    context.remove_tasks([task1, task3])
+    context.remove_artist(artist)
+    assert changes == [
+        Change(ChangeKind.GROUP_REMOVED, group2, 1),
+        Change(ChangeKind.GROUP_CHANGED, group1, 0, ("tasks",)),
+        Change(ChangeKind.TASK_REMOVED, task3, 2),
+        Change(ChangeKind.TASK_REMOVED, task1, 0),
+        Change(ChangeKind.ARTIST_REMOVED, artist, 0),
+    ]
+    assert group1.tasks == [task2]
+
+
+def test_unsubscribe(context, changes):
+    """Ensure listeners are not called after they unsubscribe."""
+    context.unsubscribe(changes.append)
+    context.add_task(Task("0040", 1))
+    assert not changes
+
+
+def test_listeners_not_pickled(context, changes):
+    """Ensure listeners are not sent to other processes."""
+    copy = pickle.loads(pickle.dumps(context))
+    copy.add_task(Task("0040", 1))
+    assert not changes
@@ -0,0 +1,125 @@
+"""Tests for the undo/redo history."""
+# pylint: disable=redefined-outer-name
+import datetime
+
+import pytest
+
+from csp4cg.core import (
+    Artist,
+    Assignment,
+    Context,
+    Task,
+    TaskGroup,
+    context_from_dict,
+    context_to_dict,
+)
+from csp4cg.core._history import History
+
+
+@pytest.fixture()
+def context():
+    """A context instance."""
+    artist1 = Artist("artist1", tags={"acting": 10})
+    artist2 = Artist("artist2")
+    task1 = Task("0010", 1, tags=["acting"])
+    task2 = Task("0020", 2)
+    return Context(
+        artists=[artist1, artist2],
+        tasks=[task1, task2],
+        assignments=[Assignment(artist1, task1)],
+        solution=[Assignment(artist1, task1), Assignment(artist2, task2)],
+    )
+
+
+def _copy(context):
+    """Copy a context without its solution, which the history doesn't restore."""
+    copy = context_from_dict(context_to_dict(context))
+    copy.solution = []
+    return copy
+
+
+def test_undo_redo(context):
+    """Ensure edits can be undone and redone, with their cached solution."""
+    history = History()
+    history.reset(context)
+    history.set_solution("solution1")
+    expected1 = _copy(context)
+
+    context.update_task(context.tasks[1], name="0025", tags=["fx"])
+    context.add_group(TaskGroup(list(context.tasks)))
+    context.unassign(context.tasks[0])
+    assert history.record()
+    expected2 = _copy(context)
+
+    context.remove_artist(context.artists[1])
+    context.update_task(context.tasks[0], duration=datetime.timedelta(hours=4))
+    context.settings.weight_tags = 50
+    assert history.record()
+    expected3 = _copy(context)
+    assert not history.record()  # nothing changed
+
+    assert history.can_undo()
+    assert not history.can_redo()
+
+    assert history.undo() is None  # was never solved
+    assert _copy(context) == expected2
+    history.set_solution("solution2")
+
+    assert history.undo() == "solution1"
+    assert _copy(context) == expected1
+    assert not history.can_undo()
+
+    assert history.redo() == "solution2"
+    assert _copy(context) == expected2
+
+    assert history.redo() is None
+    assert _copy(context) == expected3
+    assert not history.can_redo()
+
+
+def test_undo_remove_tasks(context):
+    """Ensure removed tasks come back with their locks and task groups."""
+    task1, task2 = context.tasks
+    context.add_group(TaskGroup([task1, task2], 2))
+    context.add_group(TaskGroup([task1]))
+    context.update_task(task1, name="0015")
+    history = History()
+    history.reset(context)
+    expected = _copy(context)
+
+    context.remove_task(task1)
+    context.add_task(Task("0030", 1), 0)
+    history.record()
+    assert context.combinations == [TaskGroup([task2], 2)]
+
+    history.undo()
+    assert _copy(context) == expected
+    assert context.get_groups(context.tasks[0]) == context.combinations
+    history.redo()
+    assert [task.name for task in context.tasks] == ["0030", "0020"]
+    assert not context.assignments
+
+
+def test_record_clear_redo(context):
+    """Ensure a new edit discard the steps that were undone."""
+    history = History()
+    history.reset(context)
+    context.add_task(Task("0030", 1))
+    history.record()
+    history.undo()
+    context.add_task(Task("0040", 1))
+    history.record()
+    assert not history.can_redo()
+
+
+def test_limit(context):
+    """Ensure only a limited number of steps are kept."""
+    history = History(limit=2)
+    history.reset(context)
+    for hours in (3, 4, 5):
+        context.update_task(context.tasks[0], duration=datetime.timedelta(hours=hours))
+        history.record()
+    history.undo()
+    history.undo()
+    assert context.tasks[0].duration == datetime.timedelta(hours=3)
+    assert not history.can_undo()
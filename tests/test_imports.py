@@ -0,0 +1,50 @@
+"""Ensure importing the core package stays cheap."""
+import os
+import subprocess
+import sys
+
+import pytest
+
+import csp4cg.core
+
+_HEAVY_MODULES = ("ortools", "yaml", "pandas", "numpy", "PySide2")
+_EXAMPLE = os.path.join(os.path.dirname(__file__), "..", "examples", "tasks.yml")
+
+
+def _get_imported(script):
+    """Run a script in a fresh interpreter and return the heavy modules it imported."""
+    script += (
+        "\nimport sys"
+        f"\nprint(' '.join(name for name in {_HEAVY_MODULES!r} if name in sys.modules))"
+    )
+    process = subprocess.run(
+        [sys.executable, "-c", script], check=True, stdout=subprocess.PIPE, text=True
+    )
+    return process.stdout.split()
+
+
+def test_import_core_is_lazy():
+    """Ensure importing the core package don't import heavy dependencies."""
+    assert _get_imported("import csp4cg.core") == []
+    assert _get_imported("from csp4cg.core import Context, Artist, Task") == []
+
+
+def test_import_core_on_access():
+    """Ensure heavy dependencies are imported on first use."""
+    assert _get_imported("from csp4cg.core import import_context") == []
+    script = f"from csp4cg.core import import_context; import_context({_EXAMPLE!r})"
+    assert _get_imported(script) == ["yaml"]
+    assert "ortools" in _get_imported("from csp4cg.core import Solver")
+
+
+@pytest.mark.parametrize("name", csp4cg.core.__all__)
+def test_exports(name):
+    """Ensure all exported names can be accessed."""
+    assert getattr(csp4cg.core, name) is not None
+    assert name in dir(csp4cg.core)
+
+
+def test_unknown_attribute():
+    """Ensure unknown attributes still raise an AttributeError."""
+    with pytest.raises(AttributeError):
+        csp4cg.core.unknown  # pylint: disable=pointless-statement
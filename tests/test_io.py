@@ -1,5 +1,8 @@
 """Tests for data types serialization."""
+import json
 import os
+
+import pytest
 import yaml
 
 from csp4cg.core import Context, Artist, Task, Assignment, TaskGroup
@@ -22,7 +25,7 @@ def test_serialization(tmp_path):
 
     # Test serialization
     _io.export_context_to_yml(context, path)
-    actual = yaml.load(path.read_text())
+    actual = yaml.safe_load(path.read_text())
     expected = {
         "artists": [
             {
@@ -53,6 +56,79 @@ def test_serialization(tmp_path):
     assert context == deserialized
 
 
+def _get_context():
+    artist1 = Artist("Artist1", tags={"0010": 1})
+    artist2 = Artist("Artist2", availability=50)
+    task1 = Task("0010", 1.5, tags=["acting"])
+    task2 = Task("0020", 1)
+    task3 = Task("0030", 2)
+    return Context(
+        artists=[artist1, artist2],
+        tasks=[task1, task2, task3],
+        assignments=[Assignment(artist2, task2)],
+        combinations=[TaskGroup([task1, task3], 2)],
+        solution=[
+            Assignment(artist1, task1),
+            Assignment(artist2, task2),
+            Assignment(artist1, task3),
+        ],
+    )
+
+
+def test_serialization_compact(tmp_path):
+    """Validate we can serialize a context with index references."""
+    path = tmp_path / "context.json"
+    _io.export_context_to_json(_get_context(), str(path))
+    actual = json.loads(path.read_text())
+    assert actual["compact"] is True
+    assert actual["assignments"] == [[1, 1]]
+    assert actual["solution"] == [[0, 0], [1, 1], [0, 2]]
+    assert actual["combinations"] == [{"tasks": [0, 2], "weight": 2}]
+
+
+@pytest.mark.parametrize("extension", [".yml", ".json", ".json.gz"])
+def test_serialization_formats(tmp_path, extension):
+    """Validate all session formats round-trip to the same context."""
+    context = _get_context()
+    path = str(tmp_path / f"context{extension}")
+    _io.export_context(context, path)
+    actual = _io.import_context(path)
+    assert actual == context
+    assert actual == _io.context_from_dict(_io.context_to_dict(context))
+
+
+def test_deserialization_indexes_assignments():
+    """Ensure loaded locks and solution are visible to the context lookups."""
+    context = _io.context_from_dict(_io.context_to_dict(_get_context()))
+    artist1, artist2 = context.artists
+    task1, task2, _ = context.tasks
+    assert context.get_locks(task2) == [Assignment(artist2, task2)]
+    assert context.get_assignment(task1) == Assignment(artist1, task1)
+
+    context.assign(task2, artist1)
+    assert context.get_locks(task2) == [Assignment(artist1, task2)]
+    assert context.assignments == (Assignment(artist1, task2),)
+
+
+def test_serialization_solver_parameters(tmp_path):
+    """Ensure solver parameters are only serialized when set."""
+    context = _get_context()
+    assert "SOLVER_PARAMETERS" not in _io.context_to_dict(context)["settings"]
+
+    context.settings.solver_parameters = {"linearization_level": 2}
+    path = str(tmp_path / "context.yml")
+    _io.export_context(context, path)
+    assert _io.import_context(path).settings == context.settings
+
+
+def test_import_context_from_json_invalid(tmp_path):
+    """Validate we raise a ValueError when a json file cannot be read."""
+    path = tmp_path / "context.json.gz"
+    path.write_text("not compressed")
+    with pytest.raises(ValueError):
+        _io.import_context(str(path))
+
+
 def test_import_artists_csv_1_columns(tmpdir):
     """Ensure we can import csv containing artists with two columns."""
     path = os.path.join(tmpdir, "artists.csv")
@@ -141,3 +217,149 @@ def test_import_assignments_to_csv(tmpdir):
 
     actual = _io.import_assignments_from_csv(context, path)
     assert actual == [Assignment(artist1, task1), Assignment(artist2, task2)]
+
+
+def test_import_csv_roundtrip(tmpdir):
+    """Ensure we can import what we export."""
+    path = os.path.join(tmpdir, "tasks.csv")
+    tasks = [
+        Task("Task1", 1.5, tags=["acting", "fx"]),
+        Task("Task2", 2),
+        Task("Task3", 50.5),  # exported as "2 days, 2:30:00"
+    ]
+    _io.export_tasks_to_csv(tasks, path)
+    assert _io.import_tasks_from_csv(path) == tasks
+
+    artists = [Artist("Artist1", 50, tags={"acting": 10}), Artist("Artist2")]
+    _io.export_artists_to_csv(artists, path)
+    assert _io.import_artists_from_csv(path) == artists
+
+
+def test_import_tasks_csv_invalid(tmpdir):
+    """Ensure we raise a ValueError listing all invalid rows."""
+    path = os.path.join(tmpdir, "shots.csv")
+    with open(path, "w") as stream:
+        stream.write("Task1,one\nTask2,2\nTask3\n")
+
+    with pytest.raises(ValueError) as error:
+        _io.import_tasks_from_csv(path)
+    assert str(error.value) == (
+        "Line 1: Invalid duration: 'one'\nLine 3: Missing duration"
+    )
+
+
+def test_merge_tasks_from_csv(tmpdir):
+    """Ensure we merge imported tasks with existing ones using a header."""
+    path = os.path.join(tmpdir, "shots.csv")
+    with open(path, "w") as stream:
+        stream.write(
+            "Tags,Name,Duration\n"
+            "acting,0010,2\n"  # update existing task
+            '"fx,acting",0030,"3,5"\n'  # new task
+            "fx,0040,0\n"  # invalid duration
+            ",0050,1,extra\n"  # too many columns
+            "\n"  # empty lines are ignored
+            ",0060,1:30:00\n"  # new task, exported duration notation
+        )
+
+    task1 = Task("0010", 1)
+    task2 = Task("0020", 1, tags=["fx"])
+    context = Context(tasks=[task1, task2])
+    errors = _io.merge_tasks_from_csv(context, path)
+
+    assert [str(error) for error in errors] == [
+        "Line 4: Invalid duration: '0'",
+        "Line 5: Expected 3 columns, got 4",
+    ]
+    assert context.tasks == [
+        Task("0010", 2, tags=["acting"]),
+        Task("0020", 1, tags=["fx"]),
+        Task("0030", 3.5, tags=["fx", "acting"]),
+        Task("0060", 1.5),
+    ]
+    assert context.tasks[0] is task1  # existing tasks are updated in place
+
+
+def test_merge_artists_from_csv_partial_columns(tmpdir):
+    """Ensure columns missing from the header are left untouched."""
+    path = os.path.join(tmpdir, "artists.csv")
+    with open(path, "w") as stream:
+        stream.write("name,availability\nArtist1,50\nArtist2,abc\nArtist3,75\n")
+
+    context = Context(artists=[Artist("Artist1", tags={"acting": 10})])
+    errors = _io.merge_artists_from_csv(context, path)
+
+    assert [str(error) for error in errors] == ["Line 3: Invalid availability: 'abc'"]
+    assert context.artists == [
+        Artist("Artist1", 50, tags={"acting": 10}),
+        Artist("Artist3", 75),
+    ]
+
+
+def test_merge_artists_from_csv_invalid_tags(tmpdir):
+    """Ensure tags with weights that are not numbers are reported as invalid rows."""
+    path = os.path.join(tmpdir, "artists.csv")
+    with open(path, "w") as stream:
+        stream.write(
+            "name,tags\n"
+            "Artist1,\"{'fx': None}\"\n"
+            "Artist2,\"{'fx': [1]}\"\n"
+            "Artist3,\"{'fx': 2}\"\n"
+        )
+
+    context = Context()
+    errors = _io.merge_artists_from_csv(context, path)
+
+    assert [str(error) for error in errors] == [
+        "Line 2: Invalid tags: \"{'fx': None}\"",
+        "Line 3: Invalid tags: \"{'fx': [1]}\"",
+    ]
+    assert context.artists == [Artist("Artist3", tags={"fx": 2})]
+
+
+def test_ingest_assignments_from_csv(tmpdir):
+    """Ensure we collect all invalid assignments in a single pass."""
+    path = os.path.join(tmpdir, "assignments.csv")
+    with open(path, "w") as stream:
+        stream.write(
+            "Artist,Task\n"
+            "Artist1,0010\n"
+            "Artist3,0020\n"  # unknown artist
+            "Artist1,0050\n"  # unknown task
+            "Artist2,0010\n"  # already assigned
+            "Artist1,0030\n"  # locked to another artist
+            "Artist2,0040\n"
+        )
+
+    artist1 = Artist("Artist1", tags={"0010": 1})
+    artist2 = Artist("Artist2")
+    task1, task2, task3, task4 = (
+        Task("0010", 1),
+        Task("0020", 1),
+        Task("0030", 1),
+        Task("0040", 1),
+    )
+    context = Context(
+        artists=[artist1, artist2],
+        tasks=[task1, task2, task3, task4],
+        assignments=[Assignment(artist2, task3)],
+    )
+
+    result = _io.ingest_assignments_from_csv(context, path)
+    assert result.assignments == [
+        Assignment(artist1, task1),
+        Assignment(artist2, task4),
+    ]
+    assert [str(error) for error in result.errors] == [
+        "Line 3: Unknown artist 'Artist3'",
+        "Line 4: Unknown task '0050'",
+        "Line 5: Task '0010' already assigned line 2",
+        "Line 6: Task '0030' is locked to 'Artist2'",
+    ]
+    assert result.unassigned == [task2, task3]
+    assert not result.complete
+    # Preference bonus, minus hours deviation, minus tasks count deviation.
+    assert result.score == 100 - 2 * 60 * 60 * 10 - 2 * 1 * 1 * 10
+
+    with pytest.raises(ValueError):
+        _io.import_assignments_from_csv(context, path)
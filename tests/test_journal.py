@@ -0,0 +1,148 @@
+"""Tests for the autosave journal."""
+# pylint: disable=redefined-outer-name
+import datetime
+
+import pytest
+
+from csp4cg.core import Context, Artist, Task, Assignment, TaskGroup
+from csp4cg.core._journal import Journal
+
+
+@pytest.fixture()
+def context():
+    """A context instance."""
+    artist1 = Artist("artist1", tags={"acting": 10})
+    artist2 = Artist("artist2")
+    task1 = Task("0010", 1, tags=["acting"])
+    task2 = Task("0020", 2)
+    task3 = Task("0030", 3)
+    return Context(
+        artists=[artist1, artist2],
+        tasks=[task1, task2, task3],
+        assignments=[Assignment(artist1, task1)],
+        solution=[
+            Assignment(artist1, task1),
+            Assignment(artist2, task2),
+            Assignment(artist2, task3),
+        ],
+    )
+
+
+@pytest.fixture()
+def journal(tmp_path):
+    """A journal instance."""
+    return Journal(str(tmp_path / "autosave.yml"))
+
+
+def _read_journal(journal):
+    with open(journal.path_journal) as stream:
+        return stream.read().splitlines()
+
+
+def test_first_write_is_a_snapshot(journal, context):
+    """Ensure the first write produce a full snapshot and an empty journal."""
+    journal.write(context)
+    assert journal.exists()
+    assert _read_journal(journal) == []
+    assert Journal(journal.path).restore() == context
+
+
+def test_write_only_changes(journal, context):
+    """Ensure subsequent writes only append the changes."""
+    journal.write(context)
+    task1, task2, task3 = context.tasks
+    artist1, artist2 = context.artists
+
+    context.update_task(task2, tags=["fx"])
+    context.assign(task3, artist2)
+    context.solution = [
+        Assignment(artist1, task1),
+        Assignment(artist1, task2),
+        Assignment(artist2, task3),
+    ]
+    journal.write(context)
+
+    assert _read_journal(journal) == [
+        '{"op":"update_task","name":"0020","data":{"name":"0020","duration":2.0,'
+        '"tags":["fx"]}}',
+        '{"op":"set_locks","task":"0030","artists":["artist2"]}',
+        '{"op":"set_solution","task":"0020","artists":["artist1"]}',
+    ]
+
+    # Writing again without changes don't append anything
+    journal.write(context)
+    assert len(_read_journal(journal)) == 3
+
+
+def test_restore_replay_journal(journal, context):
+    """Ensure restoring replay the journal on top of the snapshot."""
+    journal.write(context)
+    task1, task2, _ = context.tasks
+    artist1, artist2 = context.artists
+
+    context.add_group(TaskGroup([task1, task2], 2))
+    context.remove_task(task2)
+    context.update_artist(artist2, name="artist2_renamed")
+    context.add_task(Task("0005", datetime.timedelta(hours=4)), 0)
+    context.update_task(task1, name="0015")
+    context.assign(task1, artist2)
+    context.remove_artist(artist1)
+    context.settings.weight_tags = 50
+    journal.write(context)
+
+    actual = Journal(journal.path).restore()
+    assert actual == context
+
+
+def test_restore_then_write(journal, context):
+    """Ensure the edits of a restored context are appended to the journal."""
+    journal.write(context)
+    restored = journal.restore()
+    restored.remove_task(restored.tasks[0])
+    journal.write(restored)
+    assert len(_read_journal(journal)) == 1
+    assert Journal(journal.path).restore() == restored
+
+
+def test_unreported_edits_write_snapshot(journal, context):
+    """Ensure edits made in place, which are not reported, write a snapshot.
+
+    Additions are detected on the next write, reordering when compacting.
+    """
+    journal.write(context)
+    context.update_task(context.tasks[0], duration=datetime.timedelta(hours=4))
+    journal.write(context)
+    context.artists.append(Artist("artist3"))
+    journal.write(context)
+    assert _read_journal(journal) == []
+    assert Journal(journal.path).restore() == context
+
+    context.update_task(context.tasks[0], duration=datetime.timedelta(hours=5))
+    context.tasks.reverse()
+    journal.write(context)
+    assert len(_read_journal(journal)) == 1
+    journal.compact()
+    assert _read_journal(journal) == []
+    assert Journal(journal.path).restore() == context
+
+
+def test_compact(tmp_path, context):
+    """Ensure the journal is folded in a new snapshot once it grow too large."""
+    journal = Journal(str(tmp_path / "autosave.yml"), compact_every=2)
+    journal.write(context)
+    for hours in (4, 5, 6, 7):
+        context.update_task(context.tasks[0], duration=datetime.timedelta(hours=hours))
+        journal.write(context)
+    assert len(_read_journal(journal)) == 1
+    assert Journal(journal.path).restore() == context
+
+
+def test_restore_ignore_truncated_record(journal, context):
+    """Ensure a record partially written during a crash is ignored."""
+    journal.write(context)
+    context.update_task(context.tasks[0], duration=datetime.timedelta(hours=4))
+    journal.write(context)
+    with open(journal.path_journal, "a") as stream:
+        stream.write('{"op":"remove_ta')
+
+    assert Journal(journal.path).restore() == context
@@ -40,6 +40,17 @@ def test_add_task_group(manager):
     assert manager.context.combinations == [TaskGroup([task2, task3])]
 
 
+def test_add_task_group_overlapping(manager):
+    """Ensure every group using a task is removed, not only the first one."""
+    task1, task2, task3 = manager.context.tasks
+    manager.context.add_group(TaskGroup([task1, task2]))
+    manager.context.add_group(TaskGroup([task2, task3]))
+
+    manager.add_tasks_group([task2, task1])
+
+    assert manager.context.combinations == [TaskGroup([task2, task1])]
+
+
 def test_remove_task_group(manager):
     """Ensure we can remove a task group."""
     task1, task2, _ = manager.context.tasks
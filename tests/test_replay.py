@@ -0,0 +1,52 @@
+"""Tests for exporting and replaying solver models."""
+import zipfile
+
+import pytest
+
+from csp4cg.core import generate_context
+from csp4cg.core._replay import ReplaySolver, export_model
+from csp4cg.core._solver import Solver
+
+
+def test_export_replay(tmp_path):
+    """Ensure a replayed model reach the same solution as the original model."""
+    path = str(tmp_path / "model.zip")
+    context = generate_context(8, num_artists=2, seed=1)
+    solver = Solver(context)
+    solver.solver.parameters.num_search_workers = 1
+    export_model(solver, path)
+    expected = solver.solve()
+
+    replay = ReplaySolver(path)
+    replay.solver.parameters.num_search_workers = 1
+    actual = replay.solve()
+    assert replay.report.status == solver.report.status == "OPTIMAL"
+    assert replay.report.objective == solver.report.objective
+    assert [task.name for task in replay.tasks] == [task.name for task in context.tasks]
+    assert len(actual) == len(expected)
+
+
+def test_replay_invalid(tmp_path):
+    """Ensure we raise a ValueError when the file is not a model."""
+    path = tmp_path / "model.zip"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("other.txt", "")
+    with pytest.raises(ValueError):
+        ReplaySolver(str(path))
+
+
+def test_replay_corrupted(tmp_path):
+    """Ensure we raise a ValueError when the model itself cannot be decoded."""
+    path = str(tmp_path / "model.zip")
+    export_model(Solver(generate_context(4, num_artists=2, seed=1)), path)
+    path_corrupted = tmp_path / "corrupted.zip"
+    with zipfile.ZipFile(path) as source, zipfile.ZipFile(
+        path_corrupted, "w"
+    ) as archive:
+        for info in source.infolist():
+            data = source.read(info)
+            archive.writestr(
+                info, data[: len(data) // 2] if info.filename == "model.pb" else data
+            )
+    with pytest.raises(ValueError):
+        ReplaySolver(str(path_corrupted))
@@ -0,0 +1,84 @@
+"""Tests for the solve report."""
+
+import pytest
+
+from csp4cg.core import Solver, generate_context
+from csp4cg.core._report import (
+    SolutionPoint,
+    SolveReport,
+    export_report,
+    get_report_path,
+    import_report,
+)
+
+_LOG = """\
+Starting presolve at 0.00s
+#Bound   0.05s best:-inf  next:[-3.49132704e+10,103000] initial_domain
+#Model   0.05s var:496/496 constraints:260/260
+Starting search at 0.05s with 8 workers.
+#1       0.22s best:-1.32532306e+09 next:[-1.32532304e+09,103000] no_lp
+#Bound   0.44s best:-1.05687094e+09 next:[-1.05687092e+09,102400] pseudo_costs
+#2       0.45s best:-1000 next:[-999,102400] no_lp fixed_bools:0/454
+"""
+
+
+def test_report_on_log():
+    """Ensure we parse the presolve time and improving solutions from the log."""
+    report = SolveReport()
+    for line in _LOG.splitlines():
+        report.on_log(line)
+    assert report.presolve_time == 0.05
+    assert report.solutions == [
+        SolutionPoint(0.22, -1.32532306e09, 103000),
+        SolutionPoint(0.45, -1000, 102400),
+    ]
+
+
+def test_report_gap():
+    """Ensure the gap is relative to the objective."""
+    assert SolveReport().gap is None
+    assert SolveReport(objective=100, best_bound=150).gap == 0.5
+    assert SolveReport(objective=0, best_bound=0).gap == 0
+    assert SolutionPoint(1.0, -200, 100).gap == 1.5
+
+
+def test_report_serialization(tmp_path):
+    """Ensure a report can be written and read back."""
+    report = SolveReport(
+        status="FEASIBLE",
+        build_time=1.5,
+        presolve_time=0.1,
+        objective=100,
+        best_bound=150,
+        solutions=[SolutionPoint(0.2, 100, 150)],
+    )
+    path = str(tmp_path / "session.report.json")
+    export_report(report, path)
+    assert import_report(path) == report
+
+
+@pytest.mark.parametrize(
+    "path,expected",
+    [
+        ("session.yml", "session.report.json"),
+        ("dir/session.json.gz", "dir/session.report.json"),
+    ],
+)
+def test_get_report_path(path, expected):
+    """Ensure the report is next to the session."""
+    assert get_report_path(path) == expected
+
+
+def test_solver_report():
+    """Ensure the solver fill its report."""
+    solver = Solver(generate_context(10, num_artists=2, seed=1))
+    assert solver.report.build_time > 0
+    solver.solve()
+    report = solver.report
+    assert report.status == "OPTIMAL"
+    assert report.num_variables > 0
+    assert report.num_constraints > 0
+    assert report.presolve_time is not None
+    assert report.solutions
+    assert report.objective == report.best_bound
+    assert report.gap == 0
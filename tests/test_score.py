@@ -0,0 +1,79 @@
+"""Tests for scoring assignments without the solver."""
+from csp4cg.core import context_from_dict
+from csp4cg.core._score import get_score, iter_scores
+from csp4cg.core._solver import Solver
+
+
+def _get_context():
+    return context_from_dict(
+        {
+            "artists": [
+                {"name": "1", "tags": [{"name": "acting", "weight": 2}]},
+                {"name": "2", "availability": 50},
+                {"name": "3", "tags": [{"name": "0004"}]},
+            ],
+            "tasks": [
+                {"name": "0001", "duration": 1, "tags": ["acting"]},
+                {"name": "0002", "duration": 2.5},
+                {"name": "0003", "duration": 3},
+                {"name": "0004", "duration": 1},
+                {"name": "0005", "duration": 4},
+            ],
+            "combinations": [{"tasks": ["0002", "0003"], "weight": 1}],
+            "settings": {
+                "TAGS": 10,
+                "EQUAL_TASKS_BY_USER": 1,
+                "EQUAL_TASKS_COUNT_BY_USER": 100,
+            },
+        }
+    )
+
+
+def test_score_match_solver_objective():
+    """Ensure we compute the same score as the solver objective."""
+    context = _get_context()
+    solver = Solver(context)
+    assignments = solver.solve()
+
+    # Note: The solver objective count each weighted variable twice.
+    assert get_score(context, assignments) == solver.solver.ObjectiveValue() / 2
+
+
+def test_scores_match_solver_scores():
+    """Ensure each score and weight match the ones the solver report."""
+    context = _get_context()
+    solver = Solver(context)
+    assignments = solver.solve()
+    metadata = solver.get_score_metadata()
+    values = solver.get_scores(solver.solver.ResponseProto().solution).tolist()
+    expected = {
+        name: (score, weight)
+        for name, score, weight in zip(metadata.names, values, metadata.weights)
+    }
+
+    actual = {
+        name: (score, weight)
+        for name, score, weight in iter_scores(context, assignments)
+    }
+    assert actual == {name: expected[name] for name in actual}
+    # Scores the solver has but not us are preferences of unassigned tasks
+    assert not any(expected[name][0] for name in expected.keys() - actual.keys())
+
+
+def test_iter_scores_names():
+    """Ensure scores are named like the solver variables."""
+    context = context_from_dict(
+        {
+            "artists": [{"name": "1", "tags": [{"name": "0001"}]}],
+            "tasks": [{"name": "0001", "duration": 1}],
+            "solution": [{"artist": "1", "task": "0001"}],
+            "combinations": [{"tasks": ["0001"], "weight": 2}],
+        }
+    )
+    actual = list(iter_scores(context, context.solution))
+    assert actual == [
+        ("assign_task_0001_to_1", 1, 1),
+        ("assign_multiple_0001", 2, 2),
+        ("1_hours_deviation_cost_total", 0, 0),
+        ("1_number_of_tasks_deviation_cost_total", 0, 0),
+    ]
@@ -381,3 +381,56 @@ def _get_workload_by_artist(assignments: List[Assignment]):
         actual.setdefault(assignment.artist, timedelta())
         actual[assignment.artist] += assignment.task.duration
     return actual
+
+
+def test_get_assignments():
+    """Ensure we decode the assignments of a solution from all variable values."""
+    artist1, artist2 = Artist("artist1"), Artist("artist2")
+    task1, task2 = Task("0010", 1), Task("0020", 1)
+    context = Context(artists=[artist1, artist2], tasks=[task1, task2])
+    solver = Solver(context)
+
+    values = [0] * len(solver.model.Proto().variables)
+    for task, artist in ((task1, artist2), (task2, artist1)):
+        values[solver.get_variable_assignment(task, artist).Index()] = 1
+    assert solver.get_assignments(values) == (
+        Assignment(artist1, task2),
+        Assignment(artist2, task1),
+    )
+
+    # Ensure the solve result is decoded the same way
+    solution = solver.solve()
+    assert solution == solver.get_assignments(solver.solver.ResponseProto().solution)
+    assert sorted(assignment.task for assignment in solution) == [task1, task2]
+
+
+def test_get_scores():
+    """Ensure the scores computed in bulk match the weighted variables values."""
+    artist1, artist2 = Artist("artist1", tags={"acting": 1}), Artist("artist2")
+    tasks = [Task("0010", 1, tags=["acting"]), Task("0020", 2)]
+    solver = Solver(Context(artists=[artist1, artist2], tasks=tasks))
+    solver.solve()
+
+    metadata = solver.get_score_metadata()
+    scores = solver.get_scores(solver.solver.ResponseProto().solution)
+    expected = [
+        (variable.Name(), solver.solver.Value(variable) * weight, weight)
+        for variable, weight in solver.iter_variables_and_cost()
+    ]
+    assert list(zip(metadata.names, scores.tolist(), metadata.weights)) == expected
+
+
+def test_solver_parameters():
+    """Ensure the solver parameters of the settings are applied."""
+    context = Context(artists=[Artist("artist1")], tasks=[Task("0010", 1)])
+    context.settings.solver_parameters = {
+        "linearization_level": 2,
+        "search_branching": "FIXED_SEARCH",
+    }
+    parameters = Solver(context).solver.parameters
+    assert parameters.linearization_level == 2
+    assert parameters.search_branching == parameters.FIXED_SEARCH
+
+    context.settings.solver_parameters = {"search_branching": "UNKNOWN"}
+    with pytest.raises(ValueError):
+        Solver(context)
@@ -0,0 +1,71 @@
+"""Tests for the synthetic production generator."""
+
+import pytest
+
+from csp4cg.core import Solver, context_to_dict, generate_context
+
+
+def test_generate_context():
+    """Ensure the generated context match the requested size."""
+    context = generate_context(500, num_artists=20, num_sequences=10, locked_ratio=0.1)
+    assert len(context.tasks) == 500
+    assert len(context.artists) == 20
+    assert len(context.assignments) == 50
+    assert len({task.name for task in context.tasks}) == 500
+    assert {task.name[:5] for task in context.tasks} == {
+        f"sq{index:03d}" for index in range(1, 11)
+    }
+
+
+def test_generate_context_default_size():
+    """Ensure the default size match the example."""
+    context = generate_context()
+    assert len(context.tasks) == 61
+    assert len(context.artists) == 7
+
+
+def test_generate_context_seed():
+    """Ensure the same seed generate the same context."""
+    expected = context_to_dict(generate_context(200, seed=1))
+    assert context_to_dict(generate_context(200, seed=1)) == expected
+    assert context_to_dict(generate_context(200, seed=2)) != expected
+
+
+def test_generate_context_groups():
+    """Ensure task groups only contain consecutive tasks of the same sequence."""
+    context = generate_context(1000)
+    assert context.combinations
+    used = set()
+    for group in context.combinations:
+        assert 2 <= len(group.tasks) <= 5
+        assert len({task.name[:5] for task in group.tasks}) == 1
+        names = {task.name for task in group.tasks}
+        assert not used & names
+        used |= names
+
+
+def test_generate_context_tags():
+    """Ensure the most popular tags are used the most."""
+    context = generate_context(3000)
+    counts = {}
+    for task in context.tasks:
+        for tag in task.tags:
+            counts[tag] = counts.get(tag, 0) + 1
+    assert counts["tag0"] > counts["tag1"] > counts["tag10"]
+
+
+def test_generate_context_invalid():
+    """Ensure we cannot generate an empty context."""
+    with pytest.raises(ValueError):
+        generate_context(0)
+
+
+def test_generate_context_solve():
+    """Ensure a generated context can be solved."""
+    context = generate_context(20, seed=3)
+    solver = Solver(context)
+    solver.solver.parameters.max_time_in_seconds = 5
+    solution = list(solver.solve())
+    assert len(solution) == 20
+    for assignment in context.assignments:
+        assert assignment in solution
@@ -0,0 +1,22 @@
+"""Tests for the tag registry."""
+from csp4cg.core._tags import TagRegistry
+
+
+def test_registry():
+    """Ensure tags are interned to consecutive ids."""
+    registry = TagRegistry(["acting", "fx"])
+    assert registry.intern("fx") == 1
+    assert registry.intern("layout") == 2
+    assert registry.get_id("unknown") is None
+    assert "unknown" not in registry
+    assert registry.get_name(2) == "layout"
+    assert len(registry) == 3
+
+
+def test_mask():
+    """Ensure tags can be converted to and from a bitset."""
+    registry = TagRegistry(["acting", "fx", "layout"])
+    mask = registry.to_mask(["layout", "acting", "unknown"])
+    assert mask == 0b101
+    assert registry.from_mask(mask) == ["acting", "layout"]
+    assert registry.to_mask(["fx"]) & mask == 0
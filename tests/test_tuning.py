@@ -0,0 +1,91 @@
+"""Tests for the solver parameters tuning."""
+
+import pytest
+
+from csp4cg.core import Artist, Context, Task, export_context, generate_context
+from csp4cg.core._report import SolutionPoint, SolveReport
+from csp4cg.core._tuning import (
+    check_grid,
+    find_sessions,
+    get_objective_at,
+    iter_parameter_sets,
+    rank,
+    tune,
+)
+
+
+def test_iter_parameter_sets():
+    """Ensure we get all the combinations of a grid."""
+    grid = {"b": [1, 2], "a": [True]}
+    expected = [{"a": True, "b": 1}, {"a": True, "b": 2}]
+    assert list(iter_parameter_sets(grid)) == expected
+
+
+@pytest.mark.parametrize("grid", [{}, {"linearization_level": []}])
+def test_check_grid_empty(grid):
+    """Ensure a grid without any parameter set is rejected."""
+    with pytest.raises(ValueError):
+        check_grid(grid)
+
+
+def test_get_objective_at():
+    """Ensure we get the best objective found at a time of the solve."""
+    report = SolveReport(
+        solutions=[SolutionPoint(1.0, 10, 100), SolutionPoint(2.0, 20, 100)]
+    )
+    assert get_objective_at(report, 0.5) is None
+    assert get_objective_at(report, 1.5) == 10
+    assert get_objective_at(report, 2.0) == 20
+
+
+def test_rank():
+    """Ensure parameter sets are ranked by objective, higher is better."""
+    objectives = [[10, None], [20, 5], [10, 5]]
+    assert rank(objectives) == [2.5, 1.0, 1.5]
+
+
+def test_find_sessions(tmp_path):
+    """Ensure we find session files in directories, ignoring solve reports."""
+    for name in ("a.yml", "b.json.gz", "a.report.json", "notes.txt"):
+        (tmp_path / name).write_text("")
+    expected = [str(tmp_path / "a.yml"), str(tmp_path / "b.json.gz")]
+    assert find_sessions([str(tmp_path)]) == expected
+
+
+def test_tune(tmp_path):
+    """Ensure we can rank parameter sets over multiple sessions."""
+    paths = []
+    for seed in range(2):
+        path = str(tmp_path / f"session{seed}.yml")
+        export_context(generate_context(6, num_artists=2, seed=seed), path)
+        paths.append(path)
+    grid = {"linearization_level": [1, 2]}
+    solves = []
+    results = tune(
+        paths, grid, time_limit=5, workers=1, callback=lambda *args: solves.append(args)
+    )
+    assert len(solves) == 4
+    levels = [result.parameters["linearization_level"] for result in results]
+    assert sorted(levels) == [1, 2]
+    assert all(set(result.objectives) == set(paths) for result in results)
+    assert results[0].rank <= results[1].rank
+
+
+def test_tune_crash(tmp_path):
+    """Ensure a session that crash the solver rank last without stopping the tuning."""
+    path = str(tmp_path / "session.yml")
+    export_context(generate_context(6, num_artists=2, seed=0), path)
+    path_crash = str(tmp_path / "crash.yml")
+    context = Context(artists=[Artist("artist1", availability=0)], tasks=[Task("a", 1)])
+    export_context(context, path_crash)
+    solves = []
+    results = tune(
+        [path, path_crash],
+        {"linearization_level": [1]},
+        time_limit=5,
+        workers=1,
+        callback=lambda *args: solves.append(args),
+    )
+    statuses = {session: report.status for session, _, report in solves}
+    assert statuses == {path: "OPTIMAL", path_crash: "ERROR"}
+    assert results[0].objectives[path_crash] == [None, None, None]
@@ -0,0 +1,186 @@
+"""Unit tests for the core data types."""
+import pickle
+
+import pytest
+
+from csp4cg.core import Artist, Assignment, AssignmentPool, Context, Task, TaskGroup
+
+
+def test_slots():
+    """Ensure artists, tasks and assignments don't have a per-instance __dict__."""
+    artist = Artist("artist1", tags={"acting": 10})
+    task = Task("0010", 1, tags=["acting"])
+    assignment = Assignment(artist, task)
+    for obj in (artist, task, assignment):
+        assert not hasattr(obj, "__dict__")
+
+    assert artist.availability == 100
+    assert Task("0020", 2).tags == []
+    assert pickle.loads(pickle.dumps(assignment)) == assignment
+
+
+def test_assignment_hash():
+    """Ensure equal assignments have the same hash."""
+    assignment1 = Assignment(Artist("artist1"), Task("0010", 1))
+    assignment2 = Assignment(Artist("artist1"), Task("0010", 1))
+    assert len({assignment1, assignment2}) == 1
+
+
+def test_assignment_pool():
+    """Ensure the pool return a single instance by artist and task."""
+    artists = [Artist("artist1"), Artist("artist2")]
+    tasks = [Task("0010", 1), Task("0020", 1)]
+    pool = AssignmentPool(artists, tasks)
+
+    assignment = pool.get(1, 0)
+    assert assignment == Assignment(artists[1], tasks[0])
+    assert pool.get(1, 0) is assignment
+    assert pool.get(0, 0) is not assignment
+    assert len(pool) == 2
+
+
+def _get_context():
+    artist1 = Artist("artist1")
+    artist2 = Artist("artist2")
+    tasks = [Task(f"{index:04d}", 1) for index in range(4)]
+    return Context(
+        artists=[artist1, artist2],
+        tasks=tasks,
+        assignments=[Assignment(artist1, tasks[0]), Assignment(artist2, tasks[1])],
+        combinations=[TaskGroup(tasks[:2]), TaskGroup(tasks[2:3])],
+        solution=[Assignment(artist1, task) for task in tasks],
+    )
+
+
+def test_context_lookups():
+    """Ensure the locks, solution and groups of a task can be looked up."""
+    context = _get_context()
+    artist1, artist2 = context.artists
+    task1, task2, task3, _ = context.tasks
+    assert context.get_locks(task2) == [Assignment(artist2, task2)]
+    assert context.get_locks(task3) == []
+    assert context.get_assignment(task3) == Assignment(artist1, task3)
+    assert context.get_groups(task1) == [TaskGroup([task1, task2])]
+
+    context.assign(task2, artist1)
+    context.assign(task3, artist2)
+    assert context.assignments == (
+        Assignment(artist1, task1),
+        Assignment(artist1, task2),
+        Assignment(artist2, task3),
+    )
+
+
+def test_context_get_by_name():
+    """Ensure artists and tasks can be looked up by name."""
+    context = _get_context()
+    assert context.get_artist("artist2") is context.artists[1]
+    assert context.get_task("0002") is context.tasks[2]
+    context.update_task(context.tasks[2], name="0025")
+    assert context.get_task("0025") is context.tasks[2]
+    with pytest.raises(KeyError):
+        context.get_task("0002")
+
+
+def test_context_eq_ignore_assignments_order():
+    """Ensure contexts are equal whatever the order their assignments were set."""
+    context1 = _get_context()
+    context2 = _get_context()
+    artist1, artist2 = context2.artists
+    task1, task2, task3, _ = context2.tasks
+    context1.solution = [Assignment(artist1, task1), Assignment(artist2, task3)]
+    context2.solution = [Assignment(artist2, task3), Assignment(artist1, task1)]
+    context2.assignments = reversed(context2.assignments)
+    assert context1 == context2
+    context2.assign(task2, artist1)
+    assert context1 != context2
+
+
+def test_context_duplicate_locks():
+    """Ensure a task locked to multiple artists keep all its locks."""
+    artist1, artist2 = Artist("artist1"), Artist("artist2")
+    task = Task("0010", 1)
+    locks = [Assignment(artist1, task), Assignment(artist2, task)]
+    context = Context(artists=[artist1, artist2], tasks=[task], assignments=locks)
+    assert context.assignments == tuple(locks)
+    context.unassign(task)
+    assert context.assignments == ()
+
+
+def test_context_remove_tasks():
+    """Ensure removing tasks update the locks, solution and groups."""
+    context = _get_context()
+    artist1, artist2 = context.artists
+    task1, task2, task3, task4 = context.tasks
+    context.remove_tasks([task1, task3])
+
+    assert context.tasks == [task2, task4]
+    assert context.assignments == (Assignment(artist2, task2),)
+    assert context.solution == (Assignment(artist1, task2), Assignment(artist1, task4))
+    assert context.combinations == [TaskGroup([task2])]
+
+
+def test_context_remove_artists():
+    """Ensure removing artists update the locks and solution."""
+    context = _get_context()
+    artist1, artist2 = context.artists
+    task2 = context.tasks[1]
+    context.remove_artist(artist1)
+
+    assert context.artists == [artist2]
+    assert context.assignments == (Assignment(artist2, task2),)
+    assert context.solution == ()
+
+
+def test_context_groups_appended_in_place():
+    """Ensure groups appended without going through the context are indexed."""
+    context = _get_context()
+    task4 = context.tasks[3]
+    assert context.get_groups(task4) == []
+    context.combinations.append(TaskGroup([task4]))
+    context.remove_task(task4)
+    assert context.combinations == [
+        TaskGroup(context.tasks[:2]),
+        TaskGroup([context.tasks[2]]),
+    ]
+
+
+def test_context_pickle():
+    """Ensure a context can be sent to another process."""
+    context = _get_context()
+    context.get_columns()
+    context.get_groups(context.tasks[0])
+    assert pickle.loads(pickle.dumps(context)) == context
+
+
+def test_context_snapshot():
+    """Ensure a snapshot is not affected by later changes of the context."""
+    context = _get_context()
+    snapshot = context.snapshot()
+    assert snapshot.artists == context.artists
+    assert snapshot.tasks == context.tasks
+    assert snapshot.assignments == context.assignments
+    assert snapshot.combinations == context.combinations
+    assert snapshot.settings == context.settings
+    assert not snapshot.solution
+    assert context.snapshot() is snapshot  # reused until the next change
+    context.solution = [Assignment(context.artists[0], context.tasks[0])]
+    assert context.snapshot() is snapshot  # the solution is not part of it
+
+    task = context.tasks[0]
+    context.update_task(task, name="renamed")
+    context.settings.weight_tags = 1
+    assert snapshot.tasks[0].name != "renamed"
+    assert snapshot.settings.weight_tags != 1
+    assert snapshot.combinations[0].tasks[0] is snapshot.tasks[0]
+    assert snapshot.assignments[0].task is snapshot.tasks[0]
+    assert context.snapshot().tasks[0].name == "renamed"
+
+
+def test_context_snapshot_settings():
+    """Ensure settings modified directly are part of the next snapshot."""
+    context = _get_context()
+    snapshot = context.snapshot()
+    context.settings.solver_parameters["linearization_level"] = 2
+    assert not snapshot.settings.solver_parameters
+    assert context.snapshot().settings == context.settings
@@ -2,6 +2,7 @@
 import pytest
 
 from csp4cg.core import Context
+from csp4cg.core._report import SolutionPoint
 from csp4cg.gui._manager import Manager
 from csp4cg.gui.widgets.artists import ArtistsWidget
 from csp4cg.gui.widgets.tasks import TasksWidget
@@ -9,6 +10,7 @@ from csp4cg.gui.widgets.taskgroups import TasksGroupsWidget
 from csp4cg.gui.widgets.settings import SettingsWidget
 from csp4cg.gui.widgets.gantt import GanttWidget
 from csp4cg.gui.widgets.scores import ScoresWidget
+from csp4cg.gui.widgets.footer import FooterBarWidget
 
 from PySide2.QtWidgets import QWidget
 
@@ -68,3 +70,11 @@ def test_widget_gantt_init(parent, manager):
         widget_artists.table.selectionModel(),
         widget_tasks.table.selectionModel(),
     )
+
+
+def test_widget_footer_progress(parent, manager):
+    """Ensure the footer show the gap of the last solution."""
+    widget = FooterBarWidget(parent, manager)
+    manager.progress = SolutionPoint(1.0, 100, 150)
+    widget.on_solution_found()
+    assert "Gap: 50.0%" in widget.label_progress.text()
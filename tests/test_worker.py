@@ -0,0 +1,39 @@
+"""Tests for the solve process."""
+import sys
+
+import pytest
+
+from csp4cg.core import SolveReport, generate_context
+from csp4cg.core._solver import ScoreMetadata
+from csp4cg.core._worker import get_process_context, solve, start_server
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="no forkserver on Windows")
+def test_get_process_context():
+    """Ensure solve processes are forked from a server that preload ortools."""
+    assert get_process_context().get_start_method() == "forkserver"
+
+
+def test_solve(tmp_path):
+    """Ensure a solve process send the scores, solutions and report."""
+    start_server()
+    process_context = get_process_context()
+    queue = process_context.Queue()
+    context = generate_context(4, num_artists=2)
+    process = process_context.Process(
+        target=solve, args=(context, queue, str(tmp_path))
+    )
+    process.start()
+    messages = [queue.get()]
+    while not isinstance(messages[-1], SolveReport):
+        messages.append(queue.get())
+    process.join()
+
+    assert isinstance(messages[0], ScoreMetadata)
+    assert len(messages) > 2
+    assert messages[-1].status == "OPTIMAL"
+    assignments, scores, progress = messages[-2]
+    assert len(assignments) == len(context.tasks)
+    assert len(scores) == len(messages[0].names)
+    assert progress.objective == messages[-1].objective
+    assert list(tmp_path.iterdir())  # the built model was cached